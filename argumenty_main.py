@@ -0,0 +1,144 @@
+import argparse
+
+# Nazwy operatorów z rejestrów OPERATORY_KRZYZOWANIA i OPERATORY_MUTACJI w main.py.
+# Są powtórzone tutaj, żeby `main.py --help` i błędy argumentów nie importowały
+# numpy ani silnika GA; zgodność z rejestrami sprawdza tests/test_argumenty.py.
+NAZWY_KRZYZOWANIA = ("gpx", "jednopunktowe", "jednorodne")
+NAZWY_MUTACJI = ("konfliktowa", "losowa")
+
+# Prawdopodobieństwa krzyżowania i mutacji prób --szukaj-k, gdy nie podano --p-krzyzowania / --p-mutacji
+DOMYSLNE_P_KRZYZOWANIA_SZUKANIA = 0.9
+DOMYSLNE_P_MUTACJI_SZUKANIA = 0.05
+
+
+def sprawdz_argumenty(argv=None):
+    # Buduje parser wiersza poleceń main.py, parsuje argv (domyślnie sys.argv)
+    # i odrzuca niezgodne kombinacje opcji przez parser.error.
+    # Moduł importuje tylko argparse, więc --help i błędy kończą się przed
+    # kosztownym importem numpy w main.py.
+    parser = argparse.ArgumentParser(description="Algorytm Genetyczny dla Kolorowania Grafu.")
+    parser.add_argument("sciezka_do_grafu", type=str, 
+                        help="Ścieżka do pliku .json lub .gbin z definicją grafu.")
+    parser.add_argument("-k", "--kolory", type=int, default=3, 
+                        help="Liczba kolorów do testu (default: 3)")
+    parser.add_argument("--silnik", choices=["python", "numpy"], default="python",
+                        help="Implementacja pętli ewolucji: python (listy) lub numpy (tablice, wektorowo) (default: python)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Liczba procesów do równoległego wykonywania uruchomień (default: 1)")
+    parser.add_argument("--wyspy", type=int, default=1,
+                        help="Liczba wysp (podpopulacji w osobnych procesach) w modelu wyspowym; 1 = wyłączony (default: 1)")
+    parser.add_argument("--interwal-migracji", type=int, default=10,
+                        help="Co ile generacji wyspy wymieniają najlepszych osobników (default: 10)")
+    parser.add_argument("--migranci", type=int, default=2,
+                        help="Liczba osobników wysyłanych przy każdej migracji (default: 2)")
+    parser.add_argument("--topologia", choices=["pierscien", "pelna"], default="pierscien",
+                        help="Topologia migracji między wyspami (default: pierscien)")
+    parser.add_argument("--stan-ustalony", type=int, default=0, metavar="PROCESY",
+                        help="GA ze stanem ustalonym: dzieci powstają ciągle i są oceniane przez PROCESY procesów, "
+                             "a każde od razu zastępuje słabszego osobnika; 0 = wyłączony (default: 0)")
+    parser.add_argument("--zastepowanie", choices=["najgorszy", "turniej"], default="najgorszy",
+                        help="Kogo zastępuje dziecko w trybie --stan-ustalony: najgorszego osobnika "
+                             "albo przegranego turnieju (default: najgorszy)")
+    parser.add_argument("--porcja", type=int, default=None,
+                        help="Liczba dzieci wysyłanych do oceny naraz w trybie --stan-ustalony "
+                             "(default: populacja / (2 * PROCESY))")
+    parser.add_argument("--stop-zero", action="store_true",
+                        help="Kończ uruchomienie po znalezieniu pokolorowania bez konfliktów")
+    parser.add_argument("--limit-czasu", type=float, default=None,
+                        help="Maksymalny czas jednego uruchomienia w sekundach")
+    parser.add_argument("--limit-ocen", type=int, default=None,
+                        help="Maksymalna liczba ocen przystosowania w jednym uruchomieniu")
+    parser.add_argument("--limit-stagnacji", type=int, default=None,
+                        help="Kończ uruchomienie po tylu generacjach bez poprawy najlepszego wyniku")
+    parser.add_argument("--log-generacji", type=str, default=None, metavar="KATALOG",
+                        help="Zapisuj czasy faz, liczbę ocen, różnorodność i pamięć każdej generacji "
+                             "do KATALOG/zestaw<i>_uruchomienie<j>.<format>")
+    parser.add_argument("--format-logu", choices=["jsonl", "csv"], default="jsonl",
+                        help="Format plików z --log-generacji (default: jsonl)")
+    parser.add_argument("--pamiec", type=int, default=None, metavar="POJEMNOSC",
+                        help="Zapamiętuj oceny do POJEMNOSC chromosomów (LRU) i nie oceniaj ponownie kopii rodziców; "
+                             "działa w silniku numpy i z --pelna-ocena")
+    parser.add_argument("--pelna-ocena", action="store_true",
+                        help="Oceniaj każde dziecko na wszystkich krawędziach zamiast przyrostowo (silnik python)")
+    parser.add_argument("--punkty-kontrolne", type=str, default=None, metavar="KATALOG",
+                        help="Zapisuj stan uruchomień do KATALOG; ponowne uruchomienie z tym katalogiem "
+                             "wznawia eksperyment i pomija ukończone uruchomienia")
+    parser.add_argument("--interwal-punktow", type=int, default=10,
+                        help="Co ile generacji zapisywać stan uruchomienia (default: 10)")
+    parser.add_argument("--zapis-historii", type=str, default=None, metavar="PLIK",
+                        help="Dopisuj pełne historie zbieżności wszystkich uruchomień do pliku binarnego "
+                             "(int32, zob. wczytaj_historie)")
+    parser.add_argument("--lokalne", type=int, default=0, metavar="KROKI",
+                        help="Tryb memetyczny: najlepsze dzieci przechodzą do KROKI ruchów przeszukiwania lokalnego "
+                             "(min-conflicts z tabu) w każdej generacji (default: 0 = wyłączone)")
+    parser.add_argument("--udzial-lokalny", type=float, default=0.1,
+                        help="Udział populacji poprawianej lokalnie w trybie memetycznym (default: 0.1)")
+    parser.add_argument("--krzyzowanie", choices=list(NAZWY_KRZYZOWANIA), default="jednopunktowe",
+                        help="Operator krzyżowania: jednopunktowe, jednorodne albo gpx (klasy kolorów) "
+                             "(default: jednopunktowe)")
+    parser.add_argument("--mutacja", choices=list(NAZWY_MUTACJI), default="losowa",
+                        help="Operator mutacji: losowa albo konfliktowa (tylko wierzchołki w konflikcie) "
+                             "(default: losowa)")
+    parser.add_argument("--adaptacja-mutacji", action="store_true",
+                        help="Zmieniaj prawdopodobieństwo mutacji w trakcie uruchomienia według tempa poprawy "
+                             "najlepszego wyniku; PM zestawów jest wartością startową")
+    parser.add_argument("--szukaj-k", choices=["w_dol", "bisekcja"], default=None,
+                        help="Zamiast eksperymentu dla -k szukaj najmniejszej liczby kolorów bez konfliktów, "
+                             "zaczynając od kolorowania DSatur: w_dol (k-1 aż do porażki) albo bisekcja")
+    parser.add_argument("--p-krzyzowania", type=float, default=None, metavar="PK",
+                        help="Prawdopodobieństwo krzyżowania w próbach --szukaj-k "
+                             f"(default: {DOMYSLNE_P_KRZYZOWANIA_SZUKANIA})")
+    parser.add_argument("--p-mutacji", type=float, default=None, metavar="PM",
+                        help="Prawdopodobieństwo mutacji (startowe przy --adaptacja-mutacji) w próbach --szukaj-k "
+                             f"(default: {DOMYSLNE_P_MUTACJI_SZUKANIA})")
+    parser.add_argument("--ziarno", type=int, default=None,
+                        help="Ziarno bazowe; z niego wyznaczane są ziarna poszczególnych uruchomień (default: losowe)")
+    parser.add_argument("--baza", type=str, nargs="?", const="wyniki/wyniki.sqlite", default=None, metavar="PLIK",
+                        help="Dopisz wyniki do wspólnej bazy SQLite (baza_wynikow.py) zamiast zapisywać plik JSON "
+                             "(default PLIK: wyniki/wyniki.sqlite)")
+    
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers musi być dodatnie")
+    if args.wyspy > 1 and args.workers > 1:
+        parser.error("model wyspowy sam używa wielu procesów, nie łącz --wyspy z --workers")
+    if args.wyspy > 1 and args.silnik != "python":
+        parser.error("model wyspowy korzysta z operatorów silnika python")
+    if args.wyspy > 1 and args.log_generacji:
+        parser.error("--log-generacji nie obsługuje modelu wyspowego")
+    if args.pamiec is not None and args.pamiec < 1:
+        parser.error("--pamiec musi być dodatnie")
+    if args.interwal_punktow < 1:
+        parser.error("--interwal-punktow musi być dodatni")
+    if args.lokalne < 0 or not 0 < args.udzial_lokalny <= 1:
+        parser.error("--lokalne musi być nieujemne, a --udzial-lokalny w przedziale (0, 1]")
+    if args.wyspy > 1 and args.lokalne:
+        parser.error("tryb memetyczny (--lokalne) nie obsługuje modelu wyspowego")
+    if args.wyspy > 1 and (args.krzyzowanie, args.mutacja) != ("jednopunktowe", "losowa"):
+        parser.error("model wyspowy używa tylko domyślnych operatorów (--krzyzowanie, --mutacja)")
+    if args.stan_ustalony < 0 or (args.porcja is not None and args.porcja < 1):
+        parser.error("--stan-ustalony musi być nieujemne, a --porcja dodatnia")
+    if args.stan_ustalony and (args.wyspy > 1 or args.workers > 1 or args.lokalne or args.log_generacji
+                               or args.szukaj_k):
+        parser.error("--stan-ustalony sam używa puli procesów; nie łącz go z --wyspy, --workers, --lokalne, "
+                     "--log-generacji ani --szukaj-k")
+    if args.stan_ustalony and args.punkty_kontrolne:
+        parser.error("--stan-ustalony nie zapisuje stanu uruchomień; nie łącz go z --punkty-kontrolne")
+    if args.szukaj_k and (args.wyspy > 1 or args.workers > 1 or args.punkty_kontrolne or args.log_generacji
+                          or args.zapis_historii):
+        parser.error("--szukaj-k wykonuje próby kolejno w jednym procesie; nie łącz go z --wyspy, --workers, "
+                     "--punkty-kontrolne, --log-generacji ani --zapis-historii")
+    if args.adaptacja_mutacji and (args.wyspy > 1 or args.stan_ustalony):
+        parser.error("--adaptacja-mutacji działa tylko w pętli uruchom_ga; nie łącz jej z --wyspy "
+                     "ani --stan-ustalony")
+    if not args.szukaj_k and (args.p_krzyzowania is not None or args.p_mutacji is not None):
+        parser.error("--p-krzyzowania i --p-mutacji dotyczą tylko --szukaj-k; eksperyment dla -k "
+                     "używa zestawów parametrów")
+    if args.szukaj_k:
+        if args.p_krzyzowania is None:
+            args.p_krzyzowania = DOMYSLNE_P_KRZYZOWANIA_SZUKANIA
+        if args.p_mutacji is None:
+            args.p_mutacji = DOMYSLNE_P_MUTACJI_SZUKANIA
+        if not (0 <= args.p_krzyzowania <= 1 and 0 <= args.p_mutacji <= 1):
+            parser.error("--p-krzyzowania i --p-mutacji muszą leżeć w przedziale [0, 1]")
+    return args
@@ -0,0 +1,426 @@
+import os
+import sys
+import json
+import zlib
+import sqlite3
+import hashlib
+import argparse
+
+from wynik_export import eksperymenty_z_pliku, generuj_okno_tabeli
+
+# Wspólna baza wyników (SQLite) zamiast osobnego pliku JSON dla każdego eksperymentu.
+# Eksperymenty, strategie i wyniki pojedynczych uruchomień są w małych, indeksowanych tabelach,
+# więc zestawienia po grafach, liczbach kolorów i parametrach są zapytaniami SQL bez czytania historii.
+# Historie zbieżności (duże) leżą osobno, skompresowane, i są czytane tylko przy eksporcie eksperymentu.
+
+DOMYSLNA_BAZA = os.path.join("wyniki", "wyniki.sqlite")
+
+# Klucze wyników strategii trzymane w tabeli historie (wszystko, co nie jest podsumowaniem)
+KLUCZE_PODSUMOWANIA = ("nazwa", "pk", "pm", "najlepszy_wynik", "srednia_konfliktow_finalna", "konflikty_uruchomien")
+
+# Silnik i operatory mają własne kolumny; pliki wyników sprzed tych ustawień powstały z tymi wartościami
+DOMYSLNY_SILNIK = "python"
+DOMYSLNE_OPERATORY = ("jednopunktowe", "losowa")
+
+# Pozostałe ustawienia info_eksperymentu zmieniające przebieg uruchomień, z wartością "wyłączone".
+# Kolumna ustawienia to kanoniczny JSON tych, które są włączone ("{}" dla zwykłego GA).
+USTAWIENIA_PRZEBIEGU = {"liczba_wysp": 1, "wyspy": None, "stan_ustalony": 0, "kroki_lokalne": 0,
+                        "adaptacja_mutacji": False, "kryteria_stopu": None}
+
+SCHEMAT = """
+CREATE TABLE IF NOT EXISTS eksperymenty (
+    id INTEGER PRIMARY KEY,
+    graf TEXT NOT NULL,
+    nazwa_grafu TEXT NOT NULL,
+    liczba_kolorow INTEGER NOT NULL,
+    liczba_wierzcholkow INTEGER,
+    liczba_krawedzi INTEGER,
+    liczba_generacji INTEGER,
+    rozmiar_populacji INTEGER,
+    liczba_uruchomien INTEGER,
+    ziarno INTEGER,
+    silnik TEXT NOT NULL DEFAULT 'python',
+    operator_krzyzowania TEXT NOT NULL DEFAULT 'jednopunktowe',
+    operator_mutacji TEXT NOT NULL DEFAULT 'losowa',
+    ustawienia TEXT NOT NULL DEFAULT '{}',
+    info TEXT NOT NULL,
+    skrot TEXT NOT NULL UNIQUE
+);
+CREATE INDEX IF NOT EXISTS eksperymenty_graf ON eksperymenty(nazwa_grafu, liczba_kolorow);
+CREATE INDEX IF NOT EXISTS eksperymenty_sciezka ON eksperymenty(graf, liczba_kolorow);
+CREATE INDEX IF NOT EXISTS eksperymenty_ziarno ON eksperymenty(ziarno);
+
+CREATE TABLE IF NOT EXISTS strategie (
+    id INTEGER PRIMARY KEY,
+    eksperyment INTEGER NOT NULL REFERENCES eksperymenty(id) ON DELETE CASCADE,
+    nazwa TEXT NOT NULL,
+    pk REAL,
+    pm REAL,
+    najlepszy_wynik INTEGER,
+    srednia_konfliktow REAL
+);
+CREATE INDEX IF NOT EXISTS strategie_eksperyment ON strategie(eksperyment);
+CREATE INDEX IF NOT EXISTS strategie_parametry ON strategie(nazwa, pk, pm);
+
+CREATE TABLE IF NOT EXISTS uruchomienia (
+    strategia INTEGER NOT NULL REFERENCES strategie(id) ON DELETE CASCADE,
+    numer INTEGER NOT NULL,
+    konflikty INTEGER NOT NULL,
+    PRIMARY KEY (strategia, numer)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS historie (
+    strategia INTEGER PRIMARY KEY REFERENCES strategie(id) ON DELETE CASCADE,
+    dane BLOB NOT NULL
+);
+"""
+
+def otworz_baze(sciezka=DOMYSLNA_BAZA):
+
+    # Otwiera (i w razie potrzeby tworzy) bazę wyników. Tryb WAL pozwala czytać bazę
+    # w trakcie dopisywania wyników przez inny proces; synchronous=NORMAL w trybie WAL
+    # nie grozi uszkodzeniem bazy, a nie czeka na dysk przy każdym eksperymencie.
+
+    katalog = os.path.dirname(sciezka)
+    if katalog:
+        os.makedirs(katalog, exist_ok=True)
+    polaczenie = sqlite3.connect(sciezka)
+    polaczenie.execute("PRAGMA journal_mode=WAL")
+    polaczenie.execute("PRAGMA synchronous=NORMAL")
+    polaczenie.execute("PRAGMA foreign_keys=ON")
+    uzupelnij_kolumny(polaczenie)
+    polaczenie.executescript(SCHEMAT)
+    return polaczenie
+
+def uzupelnij_kolumny(polaczenie):
+
+    # Baza utworzona przed dodaniem kolumn konfiguracji (silnik, operatory, ustawienia) dostaje je
+    # tutaj, wypełnione na podstawie zapisanego info każdego eksperymentu.
+
+    kolumny = {wiersz[1] for wiersz in polaczenie.execute("PRAGMA table_info(eksperymenty)")}
+    if not kolumny or "ustawienia" in kolumny:
+        return
+    with polaczenie:
+        for kolumna, domyslna in (("silnik", DOMYSLNY_SILNIK), ("operator_krzyzowania", DOMYSLNE_OPERATORY[0]),
+                                  ("operator_mutacji", DOMYSLNE_OPERATORY[1]), ("ustawienia", "{}")):
+            if kolumna not in kolumny:
+                polaczenie.execute(f"ALTER TABLE eksperymenty ADD COLUMN {kolumna} TEXT NOT NULL "
+                                   f"DEFAULT '{domyslna}'")
+        for id_eksperymentu, info in polaczenie.execute("SELECT id, info FROM eksperymenty").fetchall():
+            polaczenie.execute("UPDATE eksperymenty SET silnik = ?, operator_krzyzowania = ?, operator_mutacji = ?, "
+                               "ustawienia = ? WHERE id = ?", (*konfiguracja(json.loads(info)), id_eksperymentu))
+
+def ustawienia_przebiegu(info):
+
+    # Kanoniczny JSON ustawień z USTAWIENIA_PRZEBIEGU włączonych w info_eksperymentu.
+    # Wyłączone kryteria stopu są pomijane, a udział lokalny liczy się tylko w trybie memetycznym.
+
+    ustawienia = {}
+    for klucz, wylaczone in USTAWIENIA_PRZEBIEGU.items():
+        wartosc = info.get(klucz, wylaczone)
+        if klucz == "kryteria_stopu" and wartosc:
+            wartosc = {kryterium: prog for kryterium, prog in wartosc.items() if prog} or None
+        if wartosc and wartosc != wylaczone:
+            ustawienia[klucz] = wartosc
+    if "kroki_lokalne" in ustawienia:
+        ustawienia["udzial_lokalny"] = info.get("udzial_lokalny")
+    return json.dumps(ustawienia, sort_keys=True, separators=(",", ":"))
+
+def konfiguracja(info):
+
+    # (silnik, operator krzyżowania, operator mutacji, ustawienia) eksperymentu do kolumn tabeli eksperymenty.
+
+    return (info.get("silnik") or DOMYSLNY_SILNIK, info.get("operator_krzyzowania") or DOMYSLNE_OPERATORY[0],
+            info.get("operator_mutacji") or DOMYSLNE_OPERATORY[1], ustawienia_przebiegu(info))
+
+def dodaj_eksperyment(polaczenie, eksperyment):
+
+    # Dopisuje eksperyment w formacie pliku wyników main.py ({"info_eksperymentu", "wyniki_strategii"})
+    # w jednej transakcji. Eksperyment o tej samej treści (skrót SHA-256) nie jest dodawany drugi raz.
+    # Zwraca id eksperymentu albo None, gdy już był w bazie.
+
+    kanoniczny = json.dumps(eksperyment, sort_keys=True, separators=(",", ":"))
+    skrot = hashlib.sha256(kanoniczny.encode()).hexdigest()
+    info = eksperyment.get("info_eksperymentu", {})
+    graf = os.path.normpath(info.get("graf", ""))
+    strategie = eksperyment.get("wyniki_strategii", [])
+    liczba_uruchomien = info.get("liczba_uruchomien_na_zestaw")
+    if liczba_uruchomien is None and strategie and strategie[0].get("konflikty_uruchomien"):
+        # Starsze pliki bez liczby uruchomień: liczba zapisanych wyników uruchomień
+        liczba_uruchomien = len(strategie[0]["konflikty_uruchomien"])
+
+    with polaczenie:
+        try:
+            kursor = polaczenie.execute(
+                "INSERT INTO eksperymenty (graf, nazwa_grafu, liczba_kolorow, liczba_wierzcholkow, liczba_krawedzi, "
+                "liczba_generacji, rozmiar_populacji, liczba_uruchomien, ziarno, silnik, operator_krzyzowania, "
+                "operator_mutacji, ustawienia, info, skrot) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (graf, os.path.splitext(os.path.basename(graf))[0], info.get("liczba_kolorow"),
+                 info.get("liczba_wierzcholkow"), info.get("liczba_krawedzi"), info.get("liczba_generacji"),
+                 info.get("rozmiar_populacji"), liczba_uruchomien, info.get("ziarno"), *konfiguracja(info),
+                 json.dumps(info), skrot))
+        except sqlite3.IntegrityError:
+            return None
+        id_eksperymentu = kursor.lastrowid
+
+        for strategia in strategie:
+            id_strategii = polaczenie.execute(
+                "INSERT INTO strategie (eksperyment, nazwa, pk, pm, najlepszy_wynik, srednia_konfliktow) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (id_eksperymentu, strategia.get("nazwa"), strategia.get("pk"), strategia.get("pm"),
+                 strategia.get("najlepszy_wynik"), strategia.get("srednia_konfliktow_finalna"))).lastrowid
+            polaczenie.executemany(
+                "INSERT INTO uruchomienia (strategia, numer, konflikty) VALUES (?, ?, ?)",
+                ((id_strategii, numer, konflikty)
+                 for numer, konflikty in enumerate(strategia.get("konflikty_uruchomien", []))))
+            historie = {klucz: wartosc for klucz, wartosc in strategia.items() if klucz not in KLUCZE_PODSUMOWANIA}
+            polaczenie.execute("INSERT INTO historie (strategia, dane) VALUES (?, ?)",
+                               (id_strategii, zlib.compress(json.dumps(historie).encode())))
+
+    return id_eksperymentu
+
+def importuj_plik(polaczenie, sciezka):
+
+    # Importuje plik wyników main.py albo plik partii uruchom_wsadowo.py.
+    # Zwraca (liczba dodanych eksperymentów, liczba pominiętych, bo już były w bazie).
+
+    with open(sciezka, 'r') as f:
+        dane = json.load(f)
+    dodane = pominiete = 0
+    for _, eksperyment in eksperymenty_z_pliku(dane, os.path.basename(sciezka)):
+        if dodaj_eksperyment(polaczenie, eksperyment) is None:
+            pominiete += 1
+        else:
+            dodane += 1
+    return dodane, pominiete
+
+# Kolumny eksperymentów, po których grupowane jest podsumowanie (razem z nazwą strategii, pk i pm):
+# wyniki różnych grafów, budżetów, silników i ustawień nie są uśredniane razem
+KOLUMNY_KONFIGURACJI = ("graf", "nazwa_grafu", "liczba_kolorow", "liczba_generacji", "rozmiar_populacji", "silnik",
+                        "operator_krzyzowania", "operator_mutacji", "ustawienia")
+
+def warunki_eksperymentow(graf=None, liczba_kolorow=None, liczba_generacji=None, rozmiar_populacji=None,
+                          silnik=None, ziarno=None):
+
+    # Warunki WHERE (lista) i ich parametry dla filtrów eksperymentów; None oznacza brak ograniczenia.
+    # graf pasuje do nazwy pliku grafu bez rozszerzenia albo do ścieżki grafu.
+
+    warunki, parametry = [], []
+    if graf is not None:
+        warunki.append("(e.nazwa_grafu = ? OR e.graf = ?)")
+        parametry += [graf, os.path.normpath(graf)]
+    for kolumna, wartosc in (("e.liczba_kolorow", liczba_kolorow), ("e.liczba_generacji", liczba_generacji),
+                             ("e.rozmiar_populacji", rozmiar_populacji), ("e.silnik", silnik), ("e.ziarno", ziarno)):
+        if wartosc is not None:
+            warunki.append(f"{kolumna} = ?")
+            parametry.append(wartosc)
+    return warunki, parametry
+
+def podsumowanie(polaczenie, graf=None, liczba_kolorow=None, strategia=None, pk=None, pm=None,
+                 liczba_generacji=None, rozmiar_populacji=None, silnik=None, ziarno=None):
+
+    # Zestawienie strategii po wszystkich pasujących eksperymentach, pogrupowane po KOLUMNY_KONFIGURACJI
+    # i (nazwa, pk, pm): najlepszy wynik i średnia konfliktów ważona liczbą uruchomień
+    # (eksperyment o nieznanej liczbie uruchomień liczy się jak jedno).
+    # Filtry jak w warunki_eksperymentow oraz nazwa strategii, pk i pm.
+    # Zwraca listę słowników posortowaną po grafie, liczbie kolorów, konfiguracji i średniej.
+
+    warunki, parametry = warunki_eksperymentow(graf, liczba_kolorow, liczba_generacji, rozmiar_populacji,
+                                               silnik, ziarno)
+    for kolumna, wartosc in (("s.nazwa", strategia), ("s.pk", pk), ("s.pm", pm)):
+        if wartosc is not None:
+            warunki.append(f"{kolumna} = ?")
+            parametry.append(wartosc)
+    gdzie = f"WHERE {' AND '.join(warunki)}" if warunki else ""
+    grupy = ", ".join(f"e.{kolumna}" for kolumna in KOLUMNY_KONFIGURACJI)
+
+    wiersze = polaczenie.execute(f"""
+        SELECT {grupy}, s.nazwa, s.pk, s.pm,
+               MIN(s.najlepszy_wynik),
+               SUM(s.srednia_konfliktow * COALESCE(e.liczba_uruchomien, 1)) / SUM(COALESCE(e.liczba_uruchomien, 1)),
+               SUM(e.liczba_uruchomien), COUNT(*),
+               MIN(e.liczba_wierzcholkow), MIN(e.liczba_krawedzi)
+        FROM strategie s JOIN eksperymenty e ON e.id = s.eksperyment
+        {gdzie}
+        GROUP BY {grupy}, s.nazwa, s.pk, s.pm
+        ORDER BY e.nazwa_grafu, {grupy}, {len(KOLUMNY_KONFIGURACJI) + 5}
+    """, parametry).fetchall()
+
+    klucze = (*KOLUMNY_KONFIGURACJI, "nazwa", "pk", "pm", "najlepszy_wynik", "srednia_konfliktow_finalna",
+              "liczba_uruchomien", "liczba_eksperymentow", "liczba_wierzcholkow", "liczba_krawedzi")
+    return [dict(zip(klucze, wiersz)) for wiersz in wiersze]
+
+def tabele_podsumowania(wiersze):
+
+    # Grupuje wiersze podsumowania po KOLUMNY_KONFIGURACJI w słowniki w formacie pliku wyników,
+    # które przyjmuje generuj_okno_tabeli z wynik_export.py.
+
+    tabele = {}
+    for wiersz in wiersze:
+        klucz = tuple(wiersz[kolumna] for kolumna in KOLUMNY_KONFIGURACJI)
+        if klucz not in tabele:
+            tabele[klucz] = {
+                "info_eksperymentu": {
+                    **{kolumna: wiersz[kolumna] for kolumna in KOLUMNY_KONFIGURACJI},
+                    "liczba_wierzcholkow": wiersz["liczba_wierzcholkow"],
+                    "liczba_krawedzi": wiersz["liczba_krawedzi"],
+                    "liczba_uruchomien_na_zestaw": 0
+                },
+                "wyniki_strategii": []
+            }
+        tabela = tabele[klucz]
+        tabela["wyniki_strategii"].append({klucz: wiersz[klucz] for klucz in
+                                           ("nazwa", "pk", "pm", "najlepszy_wynik", "srednia_konfliktow_finalna")})
+        info = tabela["info_eksperymentu"]
+        info["liczba_uruchomien_na_zestaw"] = max(info["liczba_uruchomien_na_zestaw"], wiersz["liczba_uruchomien"] or 0)
+    return list(tabele.values())
+
+def lista_eksperymentow(polaczenie, graf=None, liczba_kolorow=None, liczba_generacji=None, rozmiar_populacji=None,
+                        silnik=None, ziarno=None):
+
+    # Krotki (id, graf, liczba kolorów, liczba generacji, rozmiar populacji, liczba uruchomień, ziarno,
+    # silnik, ustawienia) eksperymentów pasujących do filtrów (jak w warunki_eksperymentow).
+
+    warunki, parametry = warunki_eksperymentow(graf, liczba_kolorow, liczba_generacji, rozmiar_populacji,
+                                               silnik, ziarno)
+    gdzie = f"WHERE {' AND '.join(warunki)}" if warunki else ""
+    return polaczenie.execute(
+        "SELECT e.id, e.graf, e.liczba_kolorow, e.liczba_generacji, e.rozmiar_populacji, e.liczba_uruchomien, "
+        f"e.ziarno, e.silnik, e.ustawienia FROM eksperymenty e {gdzie} ORDER BY e.id", parametry).fetchall()
+
+def pole(wartosc):
+
+    # Wartość do wydruku tekstowego; brakujące pola (None) jako "-".
+
+    return "-" if wartosc is None else wartosc
+
+def wczytaj_eksperyment(polaczenie, id_eksperymentu):
+
+    # Odtwarza eksperyment w formacie pliku wyników main.py (z historiami), np. dla wynik_export.py.
+
+    wiersz = polaczenie.execute("SELECT info FROM eksperymenty WHERE id = ?", (id_eksperymentu,)).fetchone()
+    if wiersz is None:
+        raise ValueError(f"Brak eksperymentu {id_eksperymentu} w bazie")
+
+    wyniki_strategii = []
+    for id_strategii, nazwa, pk, pm, najlepszy, srednia, dane in polaczenie.execute(
+            "SELECT s.id, s.nazwa, s.pk, s.pm, s.najlepszy_wynik, s.srednia_konfliktow, h.dane "
+            "FROM strategie s LEFT JOIN historie h ON h.strategia = s.id WHERE s.eksperyment = ? ORDER BY s.id",
+            (id_eksperymentu,)):
+        strategia = {"nazwa": nazwa, "pk": pk, "pm": pm, "najlepszy_wynik": najlepszy,
+                     "srednia_konfliktow_finalna": srednia}
+        konflikty = [k for (k,) in polaczenie.execute(
+            "SELECT konflikty FROM uruchomienia WHERE strategia = ? ORDER BY numer", (id_strategii,))]
+        if konflikty:
+            strategia["konflikty_uruchomien"] = konflikty
+        if dane is not None:
+            strategia.update(json.loads(zlib.decompress(dane)))
+        wyniki_strategii.append(strategia)
+
+    return {"info_eksperymentu": json.loads(wiersz[0]), "wyniki_strategii": wyniki_strategii}
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Wspólna baza wyników GA (SQLite): import i zestawienia.")
+    parser.add_argument("--baza", type=str, default=DOMYSLNA_BAZA,
+                        help=f"Plik bazy wyników (default: {DOMYSLNA_BAZA})")
+    polecenia = parser.add_subparsers(dest="polecenie", required=True)
+
+    importuj = polecenia.add_parser("importuj", help="Dopisz pliki wyników JSON (main.py, partie) do bazy")
+    importuj.add_argument("pliki", nargs="+", help="Pliki wyników .json")
+
+    def dodaj_filtry(podparser):
+        podparser.add_argument("--graf", type=str, default=None,
+                               help="Nazwa grafu bez rozszerzenia (np. graph_1) albo ścieżka do pliku grafu")
+        podparser.add_argument("-k", "--kolory", type=int, default=None, help="Liczba kolorów")
+        podparser.add_argument("--generacje", type=int, default=None, help="Liczba generacji")
+        podparser.add_argument("--populacja", type=int, default=None, help="Rozmiar populacji")
+        podparser.add_argument("--silnik", type=str, default=None, help="Silnik GA (python, numpy)")
+        podparser.add_argument("--ziarno", type=int, default=None, help="Ziarno bazowe eksperymentu")
+
+    zapytaj = polecenia.add_parser("zapytaj", help="Zestawienie strategii po wszystkich pasujących eksperymentach")
+    dodaj_filtry(zapytaj)
+    zapytaj.add_argument("--strategia", type=str, default=None, help="Nazwa zestawu parametrów")
+    zapytaj.add_argument("--pk", type=float, default=None, help="Prawdopodobieństwo krzyżowania")
+    zapytaj.add_argument("--pm", type=float, default=None, help="Prawdopodobieństwo mutacji")
+    zapytaj.add_argument("--json", action="store_true", help="Wypisz zestawienie jako JSON")
+    zapytaj.add_argument("--tabele", type=str, default=None, metavar="KATALOG",
+                         help="Zapisz obraz tabeli (jak wynik_export.py) dla każdej konfiguracji eksperymentu "
+                              "do KATALOG")
+
+    lista = polecenia.add_parser("lista", help="Wypisz eksperymenty w bazie (id do polecenia eksportuj)")
+    dodaj_filtry(lista)
+
+    eksportuj = polecenia.add_parser("eksportuj", help="Zapisz eksperyment z bazy jako plik wyników JSON")
+    eksportuj.add_argument("id", type=int, help="Id eksperymentu")
+    eksportuj.add_argument("-o", "--wyjscie", type=str, required=True, help="Plik wyjściowy .json")
+
+    args = parser.parse_args()
+    polaczenie = otworz_baze(args.baza)
+
+    if args.polecenie == "importuj":
+        suma_dodanych = suma_pominietych = 0
+        for sciezka in args.pliki:
+            try:
+                dodane, pominiete = importuj_plik(polaczenie, sciezka)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Błąd importu pliku {sciezka}: {e}", file=sys.stderr)
+                sys.exit(1)
+            suma_dodanych += dodane
+            suma_pominietych += pominiete
+        print(f"Dodano eksperymentów: {suma_dodanych}, pominięto (już w bazie): {suma_pominietych}")
+
+    elif args.polecenie == "zapytaj":
+        wiersze = podsumowanie(polaczenie, args.graf, args.kolory, args.strategia, args.pk, args.pm,
+                               args.generacje, args.populacja, args.silnik, args.ziarno)
+        if args.json:
+            print(json.dumps(wiersze, indent=4))
+        else:
+            print(f"{'Graf':<24} {'k':>3} {'G':>6} {'P':>5} {'Silnik':<6}  {'Nazwa Strategii':<26} {'PK':>5} "
+                  f"{'PM':>5} {'Najlepszy':>9} {'Śr. Konfliktów':>14} {'Uruchomień':>10}  Operatory / ustawienia")
+            for w in wiersze:
+                ustawienia = "" if w["ustawienia"] == "{}" else f" {w['ustawienia']}"
+                srednia = w["srednia_konfliktow_finalna"]
+                srednia = "-" if srednia is None else f"{srednia:.2f}"
+                print(f"{w['graf']:<24} {w['liczba_kolorow']:>3} {pole(w['liczba_generacji']):>6} "
+                      f"{pole(w['rozmiar_populacji']):>5} {w['silnik']:<6}  {pole(w['nazwa']):<26} "
+                      f"{pole(w['pk']):>5} {pole(w['pm']):>5} {pole(w['najlepszy_wynik']):>9} "
+                      f"{srednia:>14} "
+                      f"{pole(w['liczba_uruchomien']):>10}  "
+                      f"{w['operator_krzyzowania']}/{w['operator_mutacji']}{ustawienia}")
+        if args.tabele:
+            os.makedirs(args.tabele, exist_ok=True)
+            uzyte = set()
+            for tabela in tabele_podsumowania(wiersze):
+                info = tabela["info_eksperymentu"]
+                nazwa = (f"tabela_{info['nazwa_grafu']}_k{info['liczba_kolorow']}_g{pole(info['liczba_generacji'])}"
+                         f"_p{pole(info['rozmiar_populacji'])}_{info['silnik']}")
+                # Ta sama nazwa dla różnych ścieżek grafu, operatorów lub ustawień: kolejny numer
+                numer = 1
+                while (nazwa if numer == 1 else f"{nazwa}_{numer}") in uzyte:
+                    numer += 1
+                nazwa = nazwa if numer == 1 else f"{nazwa}_{numer}"
+                uzyte.add(nazwa)
+                generuj_okno_tabeli(tabela, os.path.join(args.tabele, f"{nazwa}.png"))
+
+    elif args.polecenie == "lista":
+        print(f"{'Id':>5}  {'Graf':<24} {'k':>3} {'Generacje':>9} {'Populacja':>9} {'Uruchomień':>10}  "
+              f"{'Ziarno':>10}  {'Silnik':<6}  Ustawienia")
+        for wiersz in lista_eksperymentow(polaczenie, args.graf, args.kolory, args.generacje, args.populacja,
+                                          args.silnik, args.ziarno):
+            print(f"{wiersz[0]:>5}  {wiersz[1]:<24} {pole(wiersz[2]):>3} {pole(wiersz[3]):>9} {pole(wiersz[4]):>9} "
+                  f"{pole(wiersz[5]):>10}  {pole(wiersz[6]):>10}  {wiersz[7]:<6}  {wiersz[8]}")
+
+    else:
+        try:
+            eksperyment = wczytaj_eksperyment(polaczenie, args.id)
+        except ValueError as e:
+            print(f"Błąd: {e}", file=sys.stderr)
+            sys.exit(1)
+        with open(args.wyjscie, 'w') as f:
+            json.dump(eksperyment, f, indent=4)
+        print(f"Zapisano eksperyment {args.id}: {args.wyjscie}")
+
+    polaczenie.close()
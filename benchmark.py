@@ -0,0 +1,335 @@
+import os
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import resource
+import subprocess
+import multiprocessing as mp
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import main
+from generate_graph import generate_random_graph
+
+# Katalog z wynikami pomiarów
+BENCH_DIR = "benchmarki"
+
+# Moduły z punktami wejścia CLI, których czas startu mierzy --importy
+MODULY_IMPORTU = ("main", "wyniki", "wynik_export", "generate_graph", "format_grafu", "uruchom_wsadowo",
+                  "baza_wynikow", "wyscig", "argumenty_main")
+
+
+def zmierz(funkcja, powtorzenia, minimalny_czas=0.2):
+    """Zwraca najlepszy czas (w sekundach) jednego wywołania funkcji.
+
+    Funkcja jest wywoływana w pętli tak długo, aż pomiar trwa co najmniej minimalny_czas,
+    a całość powtarzana jest powtorzenia razy (jak w module timeit).
+    """
+    liczba_wywolan = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(liczba_wywolan):
+            funkcja()
+        czas = time.perf_counter() - start
+        if czas >= minimalny_czas or liczba_wywolan >= 1 << 20:
+            break
+        liczba_wywolan *= 2
+
+    najlepszy = czas
+    for _ in range(powtorzenia - 1):
+        start = time.perf_counter()
+        for _ in range(liczba_wywolan):
+            funkcja()
+        najlepszy = min(najlepszy, time.perf_counter() - start)
+    return najlepszy / liczba_wywolan
+
+
+def szczytowa_pamiec_mb():
+    """Szczytowe zużycie pamięci (RSS) bieżącego procesu w MB."""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux podaje wartość w KB, macOS w bajtach
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+def zmierz_przypadek(przypadek):
+    """Mierzy operatory i pełne uruchomienia GA dla jednego przypadku macierzy.
+
+    Wykonywane w świeżym procesie, żeby szczytowy RSS dotyczył tylko tego przypadku.
+    """
+    n, p, rozmiar_populacji = przypadek["n"], przypadek["p"], przypadek["populacja"]
+    liczba_kolorow, liczba_generacji = przypadek["kolory"], przypadek["generacje"]
+    powtorzenia = przypadek["powtorzenia"]
+
+    random.seed(przypadek["ziarno"])
+    graf = generate_random_graph(n, p, seed=przypadek["ziarno"])
+    graf["sasiedzi_offsety"], graf["sasiedzi"] = main.zbuduj_indeks_sasiedztwa(n, graf["krawedzie"])
+    krawedzie = graf["krawedzie"]
+
+    populacja = [main.stworz_osobnika(n, liczba_kolorow) for _ in range(rozmiar_populacji)]
+    przystosowania = [main.oblicz_przystosowanie(o, krawedzie) for o in populacja]
+    rozmiar_turnieju = min(5, rozmiar_populacji)
+
+    wyniki = []
+
+    def dodaj(miara, czas, jednostki, nazwa_jednostki):
+        wyniki.append({
+            "miara": miara,
+            "czas_s": czas,
+            "na_sekunde": jednostki / czas if czas > 0 else float("inf"),
+            "jednostka": nazwa_jednostki
+        })
+
+    # Operatory w izolacji
+    dodaj("oblicz_przystosowanie",
+          zmierz(lambda: main.oblicz_przystosowanie(populacja[0], krawedzie), powtorzenia), 1, "ocen")
+    dodaj("selekcja_turniejowa",
+          zmierz(lambda: main.selekcja_turniejowa(populacja, przystosowania, rozmiar_turnieju), powtorzenia),
+          1, "selekcji")
+    dodaj("krzyzowanie",
+          zmierz(lambda: main.krzyzowanie(populacja[0], populacja[1], 1.0), powtorzenia), 1, "krzyzowan")
+    dodaj("mutacja",
+          zmierz(lambda: main.mutacja(populacja[0], 0.05, liczba_kolorow), powtorzenia), 1, "mutacji")
+
+    # Operatory z rejestru na zwartych chromosomach (array, z oceną przyrostową) i całe pokolenie,
+    # jak w domyślnej ścieżce uruchom_ga
+    rng = np.random.default_rng(przypadek["ziarno"])
+    indeks = main.indeks_sasiedztwa(graf)
+    kontekst = main.KontekstOperatorow(liczba_kolorow, rng, indeks)
+    chromosomy = [array(main.typ_genu(liczba_kolorow), o) for o in populacja]
+    konflikty = [main.policz_konflikty(o, krawedzie) for o in chromosomy]
+    dzieci = main.stworz_bufor_populacji(2, n, liczba_kolorow)
+    pozycje = main.pozycje_mutacji(n, 0.05, rng).tolist()
+    kolory = rng.integers(0, liczba_kolorow, size=len(pozycje)).tolist()
+    dodaj("krzyzowanie_jednopunktowe",
+          zmierz(lambda: main.krzyzowanie_jednopunktowe(*chromosomy[:2], *konflikty[:2], *dzieci, n // 2, kontekst),
+                 powtorzenia), 1, "krzyzowan")
+    dodaj("mutacja_losowa",
+          zmierz(lambda: main.mutacja_losowa(dzieci[0], konflikty[0], pozycje, kolory, kontekst), powtorzenia),
+          1, "mutacji")
+    bufor = main.stworz_bufor_populacji(rozmiar_populacji + rozmiar_populacji % 2, n, liczba_kolorow)
+    dodaj("stworz_nowa_populacje",
+          zmierz(lambda: main.stworz_nowa_populacje(chromosomy, konflikty, przystosowania, rozmiar_populacji,
+                                                    liczba_kolorow, 0.9, 0.05, rozmiar_turnieju,
+                                                    main.tablice_krawedzi(graf), indeks,
+                                                    bufor=bufor, rng=rng), powtorzenia),
+          rozmiar_populacji, "dzieci")
+
+    # Pełne uruchomienia: generacje/s i oceny/s
+    for silnik in przypadek["silniki"]:
+        def uruchomienie():
+            random.seed(przypadek["ziarno"])
+            main.uruchom_ga(graf, liczba_kolorow, rozmiar_populacji, liczba_generacji, 0.9, 0.05,
+                            rozmiar_turnieju, silnik=silnik)
+
+        czas = zmierz(uruchomienie, powtorzenia, minimalny_czas=0)
+        dodaj(f"uruchom_ga[{silnik}]", czas, liczba_generacji, "generacji")
+        wyniki[-1]["oceny_na_sekunde"] = rozmiar_populacji * liczba_generacji / czas
+
+    return {
+        "n": n,
+        "p": p,
+        "populacja": rozmiar_populacji,
+        "liczba_krawedzi": len(krawedzie),
+        "szczytowy_rss_mb": round(szczytowa_pamiec_mb(), 1),
+        "wyniki": wyniki
+    }
+
+
+def zmierz_start(kod, powtorzenia):
+    """Najlepszy czas (w sekundach) uruchomienia python -c kod w świeżym interpreterze.
+
+    Katalogiem roboczym jest katalog repozytorium, więc kod może importować jego moduły.
+    Pierwsze uruchomienie tworzy pliki .pyc, a liczy się najlepsze z powtórzeń.
+    """
+    katalog = os.path.dirname(os.path.abspath(__file__))
+    najlepszy = float("inf")
+    for _ in range(powtorzenia + 1):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", kod], cwd=katalog, check=True)
+        najlepszy = min(najlepszy, time.perf_counter() - start)
+    return najlepszy
+
+
+def zmierz_importy(moduly, powtorzenia):
+    """Czas startu interpretera z importem każdego modułu (tyle płaci każde wywołanie skryptu).
+
+    czas_importu_s to ten czas bez samego startu interpretera (python -c pass).
+    """
+    start_interpretera = zmierz_start("pass", powtorzenia)
+    importy = []
+    for modul in moduly:
+        czas = zmierz_start(f"import {modul}", powtorzenia)
+        importy.append({
+            "modul": modul,
+            "czas_s": czas,
+            "czas_importu_s": max(0.0, czas - start_interpretera)
+        })
+    return start_interpretera, importy
+
+
+def metadane():
+    """Informacje o środowisku, potrzebne do porównywania pomiarów między wersjami."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platforma": platform.platform(),
+        "procesor": platform.processor() or platform.machine()
+    }
+
+
+def klucze_pomiarow(raport):
+    """Słownik (n, p, populacja, miara) -> liczba operacji na sekundę."""
+    klucze = {}
+    for przypadek in raport["przypadki"]:
+        for wynik in przypadek["wyniki"]:
+            klucz = (przypadek["n"], przypadek["p"], przypadek["populacja"], wynik["miara"])
+            klucze[klucz] = wynik["na_sekunde"]
+    return klucze
+
+
+def czasy_importu(raport):
+    """Słownik moduł -> czas startu z importem modułu."""
+    return {pomiar["modul"]: pomiar["czas_s"] for pomiar in raport.get("importy", [])}
+
+
+def porownaj(raport, poprzedni, tolerancja):
+    """Wypisuje pomiary wolniejsze od poprzednich o więcej niż tolerancja. Zwraca listę regresji."""
+    obecne, dawne = klucze_pomiarow(raport), klucze_pomiarow(poprzedni)
+    regresje = []
+    for klucz, wartosc in sorted(obecne.items()):
+        if klucz not in dawne:
+            continue
+        zmiana = wartosc / dawne[klucz] - 1.0
+        if zmiana < -tolerancja:
+            regresje.append((klucz, zmiana))
+            n, p, populacja, miara = klucz
+            print(f"REGRESJA: {miara} (n={n}, p={p}, populacja={populacja}): {zmiana:+.1%}", file=sys.stderr)
+
+    # Czasy importu: zmiana liczona jak dla operacji na sekundę (ujemna = wolniejszy start)
+    obecne_importy, dawne_importy = czasy_importu(raport), czasy_importu(poprzedni)
+    for modul, czas in sorted(obecne_importy.items()):
+        if modul not in dawne_importy:
+            continue
+        zmiana = dawne_importy[modul] / czas - 1.0
+        if zmiana < -tolerancja:
+            regresje.append((("import", modul), zmiana))
+            print(f"REGRESJA: import {modul}: {zmiana:+.1%}", file=sys.stderr)
+    return regresje
+
+
+def sprawdz_budzet_importu(importy, budzet_s):
+    """Wypisuje moduły, których start z importem trwa dłużej niż budzet_s. Zwraca ich listę."""
+    przekroczone = [pomiar for pomiar in importy if pomiar["czas_s"] > budzet_s]
+    for pomiar in przekroczone:
+        print(f"PRZEKROCZONY BUDŻET IMPORTU: {pomiar['modul']}: {pomiar['czas_s'] * 1000:.0f} ms "
+              f"> {budzet_s * 1000:.0f} ms", file=sys.stderr)
+    return przekroczone
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pomiary wydajności operatorów i pętli GA.")
+    parser.add_argument("--wierzcholki", type=int, nargs="+", default=[200, 1000],
+                        help="Rozmiary grafów (default: 200 1000)")
+    parser.add_argument("--gestosci", type=float, nargs="+", default=[0.01, 0.05],
+                        help="Prawdopodobieństwa krawędzi G(n, p) (default: 0.01 0.05)")
+    parser.add_argument("--populacje", type=int, nargs="+", default=[50],
+                        help="Rozmiary populacji (default: 50)")
+    parser.add_argument("--silniki", nargs="+", choices=["python", "numpy"], default=["python", "numpy"],
+                        help="Silniki uruchom_ga do zmierzenia (default: python numpy)")
+    parser.add_argument("-k", "--kolory", type=int, default=8,
+                        help="Liczba kolorów (default: 8)")
+    parser.add_argument("-g", "--generacje", type=int, default=20,
+                        help="Liczba generacji w pomiarze uruchom_ga (default: 20)")
+    parser.add_argument("--powtorzenia", type=int, default=3,
+                        help="Liczba powtórzeń każdego pomiaru; liczy się najlepszy (default: 3)")
+    parser.add_argument("--ziarno", type=int, default=0,
+                        help="Ziarno grafów i populacji (default: 0)")
+    parser.add_argument("-o", "--wyjscie", type=str, default=None,
+                        help="Plik wynikowy JSON (default: benchmarki/benchmark_<data>.json)")
+    parser.add_argument("--porownaj", type=str, default=None,
+                        help="Poprzedni plik z pomiarami; spowolnienia ponad tolerancję kończą się kodem 1")
+    parser.add_argument("--tolerancja", type=float, default=0.1,
+                        help="Dopuszczalne spowolnienie przy porównaniu (default: 0.1 = 10%%)")
+    parser.add_argument("--importy", action="store_true",
+                        help="Zmierz też czas startu interpretera z importem modułów CLI")
+    parser.add_argument("--tylko-importy", action="store_true",
+                        help="Zmierz tylko czasy importu, bez pomiarów GA")
+    parser.add_argument("--budzet-importu", type=float, default=None, metavar="MS",
+                        help="Budżet startu z importem każdego modułu w ms; przekroczenie kończy się kodem 1 "
+                             "(włącza --importy)")
+
+    args = parser.parse_args()
+    mierz_importy = args.importy or args.tylko_importy or args.budzet_importu is not None
+
+    przypadki = [] if args.tylko_importy else [
+        {"n": n, "p": p, "populacja": populacja, "kolory": args.kolory, "generacje": args.generacje,
+         "powtorzenia": args.powtorzenia, "silniki": args.silniki, "ziarno": args.ziarno}
+        for n in args.wierzcholki for p in args.gestosci for populacja in args.populacje
+    ]
+
+    raport = {"metadane": metadane(), "przypadki": []}
+    kontekst = mp.get_context("spawn")
+
+    for przypadek in przypadki:
+        print(f"\n--- n={przypadek['n']}, p={przypadek['p']}, populacja={przypadek['populacja']} ---")
+
+        # Każdy przypadek w osobnym procesie, żeby szczytowy RSS się nie sumował
+        with ProcessPoolExecutor(max_workers=1, mp_context=kontekst) as pula:
+            wynik = pula.submit(zmierz_przypadek, przypadek).result()
+        raport["przypadki"].append(wynik)
+
+        print(f"  krawędzie: {wynik['liczba_krawedzi']}, szczytowy RSS: {wynik['szczytowy_rss_mb']} MB")
+        for pomiar in wynik["wyniki"]:
+            linia = f"  {pomiar['miara']:<26} {pomiar['na_sekunde']:>14,.1f} {pomiar['jednostka']}/s"
+            if "oceny_na_sekunde" in pomiar:
+                linia += f"  ({pomiar['oceny_na_sekunde']:,.0f} ocen/s)"
+            print(linia)
+
+    if mierz_importy:
+        print("\n--- start interpretera z importem modułu ---")
+        raport["start_interpretera_s"], raport["importy"] = zmierz_importy(MODULY_IMPORTU, args.powtorzenia)
+        print(f"  {'python -c pass':<26} {raport['start_interpretera_s'] * 1000:>8.0f} ms")
+        for pomiar in raport["importy"]:
+            print(f"  {'import ' + pomiar['modul']:<26} {pomiar['czas_s'] * 1000:>8.0f} ms"
+                  f"  (sam import: {pomiar['czas_importu_s'] * 1000:.0f} ms)")
+
+    sciezka = args.wyjscie
+    if sciezka is None:
+        os.makedirs(BENCH_DIR, exist_ok=True)
+        sciezka = os.path.join(BENCH_DIR, f"benchmark_{time.strftime('%Y%m%d_%H%M%S')}.json")
+
+    try:
+        with open(sciezka, 'w') as f:
+            json.dump(raport, f, indent=4)
+        print(f"\nZapisano pomiary: {sciezka}")
+    except IOError as e:
+        print(f"Błąd zapisu pliku: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.porownaj:
+        try:
+            with open(args.porownaj, 'r') as f:
+                poprzedni = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Błąd odczytu pliku do porównania: {e}", file=sys.stderr)
+            sys.exit(1)
+        if porownaj(raport, poprzedni, args.tolerancja):
+            sys.exit(1)
+        print("Brak regresji względem", args.porownaj)
+
+    if args.budzet_importu is not None:
+        if sprawdz_budzet_importu(raport["importy"], args.budzet_importu / 1000):
+            sys.exit(1)
+        print(f"Wszystkie importy mieszczą się w budżecie {args.budzet_importu:.0f} ms")
\ No newline at end of file
@@ -0,0 +1,198 @@
+"""Binarny format grafu (.gbin) wczytywany przez mapowanie pamięci.
+
+Układ pliku (little-endian):
+    nagłówek (32 bajty): magia b"GRAF", wersja (u32), flagi (u32), ograniczenie_kolorow (u32, 0 = nieznane),
+                         liczba_wierzcholkow (i64), liczba_krawedzi (i64)
+    krawędzie:           int32[liczba_krawedzi, 2]
+    indeks CSR (opcjonalny, flaga FLAGA_CSR):
+                         offsety int32[liczba_wierzcholkow + 1], sąsiedzi int32[2 * liczba_krawedzi]
+"""
+import os
+import sys
+import json
+import struct
+import argparse
+import numpy as np
+
+ROZSZERZENIE_BINARNE = ".gbin"
+MAGIA = b"GRAF"
+WERSJA = 1
+FLAGA_CSR = 1
+
+# magia, wersja, flagi, ograniczenie_kolorow, liczba_wierzcholkow, liczba_krawedzi
+NAGLOWEK = struct.Struct("<4sIIIqq")
+
+
+def czy_format_binarny(sciezka):
+    """Sprawdza po rozszerzeniu, czy plik jest w formacie binarnym."""
+    return os.path.splitext(sciezka)[1].lower() == ROZSZERZENIE_BINARNE
+
+
+def zapisz_naglowek(f, liczba_wierzcholkow, liczba_krawedzi, flagi=0, ograniczenie_kolorow=None):
+    """Zapisuje nagłówek na bieżącej pozycji pliku."""
+    f.write(NAGLOWEK.pack(MAGIA, WERSJA, flagi, ograniczenie_kolorow or 0, liczba_wierzcholkow, liczba_krawedzi))
+
+
+def sprawdz_petle(krawedzie, porcja=1 << 20):
+    """Zgłasza ValueError, jeśli graf ma pętlę (krawędź v-v).
+
+    Pętla zawsze jest konfliktem, a ocena przyrostowa i przeszukiwanie lokalne zakładają,
+    że wierzchołek nie jest własnym sąsiadem. Tablica krawędzi jest sprawdzana porcjami,
+    żeby zmapowany plik nie był kopiowany w całości.
+    """
+    for poczatek in range(0, len(krawedzie), porcja):
+        czesc = np.asarray(krawedzie[poczatek:poczatek + porcja]).reshape(-1, 2)
+        petle = np.flatnonzero(czesc[:, 0] == czesc[:, 1])
+        if len(petle):
+            raise ValueError(f"graf zawiera pętlę przy wierzchołku {int(czesc[petle[0], 0])}")
+
+
+def zbuduj_indeks_sasiedztwa(liczba_wierzcholkow, krawedzie):
+    """Buduje indeks sąsiedztwa w formacie CSR.
+
+    Sąsiedzi wierzchołka v to sasiedzi[offsety[v]:offsety[v + 1]]. Grafy z pętlami są odrzucane
+    (ValueError, zob. sprawdz_petle).
+    """
+    krawedzie = np.asarray(krawedzie, dtype=np.int64).reshape(-1, 2)
+    sprawdz_petle(krawedzie)
+    konce = np.concatenate((krawedzie[:, 0], krawedzie[:, 1]))
+    poczatki = np.concatenate((krawedzie[:, 1], krawedzie[:, 0]))
+
+    kolejnosc = np.argsort(konce, kind="stable")
+    sasiedzi = poczatki[kolejnosc].astype(np.int32)
+
+    offsety = np.zeros(liczba_wierzcholkow + 1, dtype=np.int32)
+    np.cumsum(np.bincount(konce, minlength=liczba_wierzcholkow), out=offsety[1:])
+    return offsety, sasiedzi
+
+
+def zapisz_graf_binarny(sciezka, liczba_wierzcholkow, krawedzie, z_indeksem=True, ograniczenie_kolorow=None):
+    """Zapisuje graf w formacie binarnym, domyślnie razem z indeksem sąsiedztwa CSR.
+
+    ograniczenie_kolorow to znana górna granica liczby chromatycznej (np. dla grafów z ukrytym kolorowaniem).
+    """
+    krawedzie = np.asarray(krawedzie, dtype=np.int32).reshape(-1, 2)
+    flagi = FLAGA_CSR if z_indeksem else 0
+
+    with open(sciezka, 'wb') as f:
+        zapisz_naglowek(f, liczba_wierzcholkow, len(krawedzie), flagi, ograniczenie_kolorow)
+        f.write(krawedzie.tobytes())
+        if z_indeksem:
+            offsety, sasiedzi = zbuduj_indeks_sasiedztwa(liczba_wierzcholkow, krawedzie)
+            f.write(offsety.tobytes())
+            f.write(sasiedzi.tobytes())
+
+
+def zapisz_graf_binarny_strumieniowo(sciezka, liczba_wierzcholkow, porcje_krawedzi, z_indeksem=False,
+                                     ograniczenie_kolorow=None):
+    """Zapisuje krawędzie porcjami (tablice (k, 2)) bez trzymania całego grafu w pamięci.
+
+    Liczba krawędzi jest wpisywana do nagłówka na końcu zapisu. Indeks CSR wymaga
+    jednorazowego przejścia po wszystkich krawędziach w pamięci, dlatego jest opcjonalny;
+    bez niego zostanie zbudowany przy wczytywaniu. Zwraca liczbę zapisanych krawędzi.
+    """
+    liczba_krawedzi = 0
+    with open(sciezka, 'wb') as f:
+        zapisz_naglowek(f, liczba_wierzcholkow, 0)
+        for porcja in porcje_krawedzi:
+            porcja = np.ascontiguousarray(porcja, dtype=np.int32).reshape(-1, 2)
+            f.write(porcja.tobytes())
+            liczba_krawedzi += len(porcja)
+
+        if z_indeksem:
+            f.flush()
+            krawedzie = (np.memmap(sciezka, dtype=np.int32, mode='r', offset=NAGLOWEK.size,
+                                   shape=(liczba_krawedzi, 2))
+                         if liczba_krawedzi else np.zeros((0, 2), dtype=np.int32))
+            offsety, sasiedzi = zbuduj_indeks_sasiedztwa(liczba_wierzcholkow, krawedzie)
+            del krawedzie
+            f.write(offsety.tobytes())
+            f.write(sasiedzi.tobytes())
+
+        f.seek(0)
+        zapisz_naglowek(f, liczba_wierzcholkow, liczba_krawedzi, FLAGA_CSR if z_indeksem else 0, ograniczenie_kolorow)
+    return liczba_krawedzi
+
+
+def wczytaj_naglowek(sciezka):
+    """Czyta i sprawdza nagłówek.
+
+    Zwraca (liczba_wierzcholkow, liczba_krawedzi, flagi, ograniczenie_kolorow).
+    """
+    with open(sciezka, 'rb') as f:
+        dane = f.read(NAGLOWEK.size)
+    if len(dane) < NAGLOWEK.size:
+        raise ValueError("plik jest krótszy niż nagłówek")
+
+    magia, wersja, flagi, ograniczenie_kolorow, liczba_wierzcholkow, liczba_krawedzi = NAGLOWEK.unpack(dane)
+    if magia != MAGIA:
+        raise ValueError("niepoprawna sygnatura pliku")
+    if wersja != WERSJA:
+        raise ValueError(f"nieobsługiwana wersja formatu: {wersja}")
+    return liczba_wierzcholkow, liczba_krawedzi, flagi, ograniczenie_kolorow
+
+
+def wczytaj_graf_binarny(sciezka):
+    """Mapuje plik binarny do pamięci bez kopiowania danych.
+
+    Zwraca słownik grafu w formacie wczytaj_graf_z_pliku, w którym "krawedzie",
+    "sasiedzi_offsety" i "sasiedzi" są tablicami np.memmap tylko do odczytu.
+    Znane ograniczenie liczby kolorów trafia pod klucz "ograniczenie_kolorow".
+    Graf z pętlą jest odrzucany (ValueError).
+    """
+    liczba_wierzcholkow, liczba_krawedzi, flagi, ograniczenie_kolorow = wczytaj_naglowek(sciezka)
+
+    przesuniecie = NAGLOWEK.size
+    oczekiwany_rozmiar = przesuniecie + 8 * liczba_krawedzi
+    if flagi & FLAGA_CSR:
+        oczekiwany_rozmiar += 4 * (liczba_wierzcholkow + 1) + 8 * liczba_krawedzi
+    if os.path.getsize(sciezka) < oczekiwany_rozmiar:
+        raise ValueError("plik jest obcięty")
+
+    def mapuj(liczba_elementow, ksztalt):
+        nonlocal przesuniecie
+        if liczba_elementow == 0:
+            tablica = np.zeros(ksztalt, dtype=np.int32)
+        else:
+            tablica = np.memmap(sciezka, dtype=np.int32, mode='r', offset=przesuniecie, shape=ksztalt)
+        przesuniecie += 4 * liczba_elementow
+        return tablica
+
+    graf = {
+        "liczba_wierzcholkow": liczba_wierzcholkow,
+        "krawedzie": mapuj(2 * liczba_krawedzi, (liczba_krawedzi, 2))
+    }
+
+    if ograniczenie_kolorow:
+        graf["ograniczenie_kolorow"] = ograniczenie_kolorow
+
+    if flagi & FLAGA_CSR:
+        # Zapisany indeks pomija zbuduj_indeks_sasiedztwa, więc pętle trzeba sprawdzić tutaj
+        sprawdz_petle(graf["krawedzie"])
+        graf["sasiedzi_offsety"] = mapuj(liczba_wierzcholkow + 1, (liczba_wierzcholkow + 1,))
+        graf["sasiedzi"] = mapuj(2 * liczba_krawedzi, (2 * liczba_krawedzi,))
+    return graf
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Konwersja grafu z JSON do formatu binarnego .gbin.")
+    parser.add_argument("wejscie", type=str, help="Plik .json z grafem")
+    parser.add_argument("wyjscie", type=str, nargs="?", default=None,
+                        help="Plik wynikowy (domyślnie: ta sama nazwa z rozszerzeniem .gbin)")
+    parser.add_argument("--bez-indeksu", action="store_true",
+                        help="Nie zapisuj indeksu CSR (zostanie zbudowany przy wczytywaniu)")
+
+    args = parser.parse_args()
+    wyjscie = args.wyjscie or os.path.splitext(args.wejscie)[0] + ROZSZERZENIE_BINARNE
+
+    try:
+        with open(args.wejscie, 'r') as f:
+            dane = json.load(f)
+        zapisz_graf_binarny(wyjscie, dane["liczba_wierzcholkow"], dane["krawedzie"],
+                            z_indeksem=not args.bez_indeksu,
+                            ograniczenie_kolorow=dane.get("ograniczenie_kolorow"))
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Błąd konwersji: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Zapisano: {wyjscie} ({len(dane['krawedzie'])} krawędzi)")
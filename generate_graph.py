@@ -1,19 +1,23 @@
 import os
-import json
-import random
 import re
+import sys
 import argparse
+import numpy as np
+from format_grafu import ROZSZERZENIE_BINARNE, zapisz_graf_binarny_strumieniowo
 
 # Katalog do zapisywania grafów
 GRAPH_DIR = "grafy"
 
+# Domyślna liczba krawędzi losowanych i zapisywanych naraz
+ROZMIAR_PORCJI = 1 << 20
+
 def find_next_graph_number(directory):
     """Przeszukuje katalog i znajduje następny wolny numer dla grafu."""
     
     # Upewnij się, że katalog istnieje
     os.makedirs(directory, exist_ok=True)
     
-    pattern = re.compile(r'graph_(\d+)\.json')
+    pattern = re.compile(r'graph_(\d+)\.(json|gbin)$')
     max_num = 0
     
     try:
@@ -29,16 +33,213 @@ def find_next_graph_number(directory):
         
     return max_num + 1
 
-def generate_random_graph(n, p):
+def indeksy_na_pary(indeksy, n):
+    """Zamienia numery par (i < j) w porządku wierszowym na tablicę krawędzi (k, 2)."""
+
+    # Wiersz i zaczyna się od numeru i*(2n - i - 1)/2
+    def poczatek_wiersza(i):
+        return i * (2 * n - i - 1) // 2
+
+    indeksy = np.asarray(indeksy, dtype=np.int64)
+    i = np.floor(((2 * n - 1) - np.sqrt((2.0 * n - 1) ** 2 - 8.0 * indeksy)) / 2).astype(np.int64)
+    i = np.clip(i, 0, n - 2)
+
+    # Korekta błędu zaokrąglenia pierwiastka (najwyżej o jeden wiersz)
+    i += poczatek_wiersza(i + 1) <= indeksy
+    i -= poczatek_wiersza(i) > indeksy
+
+    j = indeksy - poczatek_wiersza(i) + i + 1
+    return np.stack((i, j), axis=1).astype(np.int32)
+
+def generuj_krawedzie_gnp(n, p, rng, rozmiar_porcji=ROZMIAR_PORCJI):
+    """Generuje krawędzie G(n, p) porcjami, w kolejności (i, j) rosnąco.
+
+    Zamiast losować każdą z n(n-1)/2 par, losuje odstępy między kolejnymi krawędziami
+    z rozkładu geometrycznego, więc praca jest proporcjonalna do liczby krawędzi.
+    """
+    liczba_par = n * (n - 1) // 2
+    if liczba_par == 0 or p <= 0:
+        return
+    if p >= 1:
+        for start in range(0, liczba_par, rozmiar_porcji):
+            yield indeksy_na_pary(np.arange(start, min(start + rozmiar_porcji, liczba_par)), n)
+        return
+
+    ostatni = -1
+    while True:
+        # Odstęp >= 1 między numerami kolejnych wylosowanych par
+        pozycje = ostatni + np.cumsum(rng.geometric(p, size=rozmiar_porcji))
+        pozycje = pozycje[pozycje < liczba_par]
+        if len(pozycje):
+            yield indeksy_na_pary(pozycje, n)
+        if len(pozycje) < rozmiar_porcji:
+            return
+        ostatni = int(pozycje[-1])
+
+def generuj_krawedzie_ukryte(n, k, p, rng, rozmiar_porcji=ROZMIAR_PORCJI):
+    """Generuje graf z ukrytym k-kolorowaniem (k-dzielny losowy).
+
+    Wierzchołki dostają losowe kolory 0..k-1, a każda para wierzchołków o różnych kolorach
+    jest krawędzią z prawdopodobieństwem p. Graf jest więc na pewno k-kolorowalny.
+    """
+    kolory = rng.integers(0, k, size=n)
+    for porcja in generuj_krawedzie_gnp(n, p, rng, rozmiar_porcji):
+        porcja = porcja[kolory[porcja[:, 0]] != kolory[porcja[:, 1]]]
+        if len(porcja):
+            yield porcja
+
+def generuj_krawedzie_geometryczne(n, promien, rng, rozmiar_porcji=ROZMIAR_PORCJI):
+    """Generuje losowy graf geometryczny (dyskowy): n punktów w kwadracie jednostkowym,
+    krawędź łączy punkty odległe o mniej niż promien.
+
+    Punkty są grupowane w komórki siatki o boku promien, więc porównywane są tylko pary
+    z sąsiednich komórek. Numery wierzchołków odpowiadają kolejności komórek.
+    """
+    if n < 2 or promien <= 0:
+        return
+    liczba_komorek = max(1, int(1.0 / promien))
+    punkty = rng.random((n, 2))
+    komorki_xy = np.minimum((punkty / (1.0 / liczba_komorek)).astype(np.int64), liczba_komorek - 1)
+    komorki = komorki_xy[:, 0] * liczba_komorek + komorki_xy[:, 1]
+
+    kolejnosc = np.argsort(komorki, kind="stable")
+    punkty, komorki, komorki_xy = punkty[kolejnosc], komorki[kolejnosc], komorki_xy[kolejnosc]
+    poczatki = np.searchsorted(komorki, np.arange(liczba_komorek * liczba_komorek + 1))
+    promien2 = promien * promien
+
+    # Połowa sąsiedztwa, żeby każda para komórek była sprawdzana raz
+    for dx, dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        for start in range(0, n, rozmiar_porcji):
+            i = np.arange(start, min(start + rozmiar_porcji, n))
+            cx, cy = komorki_xy[i, 0] + dx, komorki_xy[i, 1] + dy
+            poprawne = (cx < liczba_komorek) & (cy >= 0) & (cy < liczba_komorek)
+            i, cel = i[poprawne], cx[poprawne] * liczba_komorek + cy[poprawne]
+
+            od, do = poczatki[cel], poczatki[cel + 1]
+            if (dx, dy) == (0, 0):
+                od = np.maximum(od, i + 1)
+            liczby = np.maximum(do - od, 0)
+
+            # Rozwinięcie zakresów kandydatów [od, do) dla każdego punktu
+            u = np.repeat(i, liczby)
+            v = np.arange(liczby.sum()) - np.repeat(np.cumsum(liczby) - liczby, liczby) + np.repeat(od, liczby)
+
+            roznica = punkty[u] - punkty[v]
+            blisko = (roznica * roznica).sum(axis=1) < promien2
+            if blisko.any():
+                para = np.stack((u[blisko], v[blisko]), axis=1)
+                yield np.sort(para, axis=1).astype(np.int32)
+
+def generuj_krawedzie_ba(n, m, rng, rozmiar_porcji=ROZMIAR_PORCJI):
+    """Generuje graf potęgowy Barabásiego–Alberta: każdy nowy wierzchołek łączy się
+    z m różnymi wcześniejszymi, wybieranymi proporcjonalnie do stopnia.
+    """
+    if m < 1 or n <= m:
+        return
+    cele = list(range(m))
+    powtorzone = []
+    porcja = []
+    losowe = rng.random(4096).tolist()
+
+    for zrodlo in range(m, n):
+        porcja.extend((cel, zrodlo) for cel in cele)
+        powtorzone.extend(cele)
+        powtorzone.extend([zrodlo] * m)
+        if len(porcja) >= rozmiar_porcji:
+            yield np.array(porcja, dtype=np.int32)
+            porcja = []
+
+        # Losowanie m różnych celów z listy, w której wierzchołek występuje tyle razy, ile ma krawędzi
+        wybrane = set()
+        while len(wybrane) < m:
+            if not losowe:
+                losowe = rng.random(4096).tolist()
+            wybrane.add(powtorzone[int(losowe.pop() * len(powtorzone))])
+        cele = list(wybrane)
+
+    if porcja:
+        yield np.array(porcja, dtype=np.int32)
+
+def wczytaj_krawedzie_dimacs(sciezka, rozmiar_porcji=ROZMIAR_PORCJI):
+    """Czyta graf w formacie DIMACS (.col): linia "p edge n m" i linie "e u v" (numeracja od 1).
+
+    Zwraca (n, generator porcji krawędzi). Pętle są pomijane, a powtórzone krawędzie
+    (także zapisane w obu kierunkach) zapisywane tylko raz. Niepoprawna linia albo wierzchołek
+    spoza 1..n to ValueError z numerem linii (linie krawędzi są sprawdzane w trakcie czytania porcji).
+    """
+    n = None
+    with open(sciezka, 'r') as f:
+        for numer_naglowka, linia in enumerate(f, 1):
+            if linia.startswith("p"):
+                czesci = linia.split()
+                if len(czesci) < 3 or not czesci[2].isdigit():
+                    raise ValueError(f"linia {numer_naglowka}: niepoprawna linia nagłówka: {linia.strip()}")
+                n = int(czesci[2])
+                break
+    if n is None:
+        raise ValueError("brak linii \"p edge n m\"")
+
+    def porcje():
+        # Plik jest otwierany ponownie i zamykany także wtedy, gdy generator nie zostanie wyczerpany
+        widziane = set()
+        porcja = []
+        with open(sciezka, 'r') as f:
+            for numer, linia in enumerate(f, 1):
+                if numer <= numer_naglowka or not linia.startswith("e"):
+                    continue
+                czesci = linia.split()
+                if len(czesci) < 3 or not (czesci[1].isdigit() and czesci[2].isdigit()):
+                    raise ValueError(f"linia {numer}: niepoprawna linia krawędzi: {linia.strip()}")
+                u, v = int(czesci[1]), int(czesci[2])
+                if not (1 <= u <= n and 1 <= v <= n):
+                    raise ValueError(f"linia {numer}: wierzchołek spoza zakresu 1..{n}: {linia.strip()}")
+                u, v = u - 1, v - 1
+                if u == v:
+                    continue
+                if u > v:
+                    u, v = v, u
+                klucz = u * n + v
+                if klucz in widziane:
+                    continue
+                widziane.add(klucz)
+                porcja.append((u, v))
+                if len(porcja) >= rozmiar_porcji:
+                    yield np.array(porcja, dtype=np.int32)
+                    porcja = []
+        if porcja:
+            yield np.array(porcja, dtype=np.int32)
+
+    return n, porcje()
+
+def zapisz_graf_json_strumieniowo(sciezka, n, porcje_krawedzi, ograniczenie_kolorow=None):
+    """Zapisuje graf w formacie JSON porcjami, bez budowania pełnej listy krawędzi.
+
+    Zwraca liczbę zapisanych krawędzi.
+    """
+    liczba_krawedzi = 0
+    with open(sciezka, 'w') as f:
+        f.write(f'{{"liczba_wierzcholkow": {n}, ')
+        if ograniczenie_kolorow:
+            f.write(f'"ograniczenie_kolorow": {ograniczenie_kolorow}, ')
+        f.write('"krawedzie": [')
+        for porcja in porcje_krawedzi:
+            if len(porcja) == 0:
+                continue
+            tekst = ", ".join(f"[{u}, {v}]" for u, v in porcja.tolist())
+            f.write((",\n" if liczba_krawedzi else "\n") + tekst)
+            liczba_krawedzi += len(porcja)
+        f.write("\n]}\n")
+    return liczba_krawedzi
+
+def generate_random_graph(n, p, seed=None):
 
     # Generuje graf losowy G(n, p) - n wierzchołków, p-prawdopodobieństwo krawędzi.
+    # Cały graf trafia do pamięci; do dużych grafów służy zapis strumieniowy.
 
+    rng = np.random.default_rng(seed)
     krawedzie = []
-    for i in range(n):
-        for j in range(i + 1, n):
-            # Dla każdej możliwej pary wierzchołków, losuj czy istnieje krawędź
-            if random.random() < p:
-                krawedzie.append((i, j))
+    for porcja in generuj_krawedzie_gnp(n, p, rng):
+        krawedzie.extend(map(tuple, porcja.tolist()))
                 
     return {
         "liczba_wierzcholkow": n,
@@ -47,29 +248,80 @@ def generate_random_graph(n, p):
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generator skomplikowanych grafów losowych.")
+    parser.add_argument("-t", "--typ", choices=["gnp", "ukryty", "geometryczny", "ba", "dimacs"], default="gnp",
+                        help="Rodzina grafów: gnp (Erdős–Rényi), ukryty (z ukrytym k-kolorowaniem), "
+                             "geometryczny (dyskowy), ba (Barabási–Albert), dimacs (import .col) (default: gnp)")
     parser.add_argument("-n", "--wierzcholki", type=int, default=25, 
                         help="Liczba wierzchołków (default: 25)")
     parser.add_argument("-p", "--prawdopodobienstwo", type=float, default=0.2, 
-                        help="Prawdopodobieństwo krawędzi (default: 0.2)")
+                        help="Prawdopodobieństwo krawędzi dla gnp i ukryty (default: 0.2)")
+    parser.add_argument("-k", "--kolory", type=int, default=3,
+                        help="Liczba kolorów ukrytego kolorowania dla typu ukryty (default: 3)")
+    parser.add_argument("-r", "--promien", type=float, default=0.1,
+                        help="Promień połączeń dla typu geometryczny (default: 0.1)")
+    parser.add_argument("-m", "--krawedzie-na-wierzcholek", type=int, default=3,
+                        help="Liczba krawędzi dodawanych z każdym wierzchołkiem dla typu ba (default: 3)")
+    parser.add_argument("--plik-dimacs", type=str, default=None,
+                        help="Plik .col do zaimportowania dla typu dimacs")
+    parser.add_argument("-f", "--format", choices=["json", "gbin"], default="json",
+                        help="Format pliku: json lub binarny gbin (mapowany do pamięci) (default: json)")
+    parser.add_argument("-s", "--ziarno", type=int, default=None,
+                        help="Ziarno generatora liczb losowych (ten sam plik dla tego samego ziarna)")
+    parser.add_argument("--porcja", type=int, default=ROZMIAR_PORCJI,
+                        help=f"Liczba krawędzi losowanych i zapisywanych naraz (default: {ROZMIAR_PORCJI})")
+    parser.add_argument("--bez-indeksu", action="store_true",
+                        help="Nie dołączaj indeksu CSR do pliku gbin (mniej pamięci przy generowaniu)")
     
     args = parser.parse_args()
-    
-    # Generowanie grafu
-    graph_data = generate_random_graph(args.wierzcholki, args.prawdopodobienstwo)
+    if args.typ == "dimacs" and not args.plik_dimacs:
+        parser.error("typ dimacs wymaga --plik-dimacs")
     
     # Szukanie odpowiedniej nazwy dla pliku
     next_num = find_next_graph_number(GRAPH_DIR)
-    filepath = os.path.join(GRAPH_DIR, f'graph_{next_num}.json')
+    extension = ROZSZERZENIE_BINARNE if args.format == "gbin" else ".json"
+    filepath = os.path.join(GRAPH_DIR, f'graph_{next_num}{extension}')
+    
+    # Wybór generatora; wszystkie zwracają krawędzie porcjami
+    rng = np.random.default_rng(args.ziarno)
+    liczba_wierzcholkow = args.wierzcholki
+    ograniczenie_kolorow = None
+    if args.typ == "gnp":
+        porcje = generuj_krawedzie_gnp(liczba_wierzcholkow, args.prawdopodobienstwo, rng, args.porcja)
+    elif args.typ == "ukryty":
+        porcje = generuj_krawedzie_ukryte(liczba_wierzcholkow, args.kolory, args.prawdopodobienstwo, rng, args.porcja)
+        ograniczenie_kolorow = args.kolory
+    elif args.typ == "geometryczny":
+        porcje = generuj_krawedzie_geometryczne(liczba_wierzcholkow, args.promien, rng, args.porcja)
+    elif args.typ == "ba":
+        porcje = generuj_krawedzie_ba(liczba_wierzcholkow, args.krawedzie_na_wierzcholek, rng, args.porcja)
+    else:
+        try:
+            liczba_wierzcholkow, porcje = wczytaj_krawedzie_dimacs(args.plik_dimacs, args.porcja)
+        except (OSError, ValueError) as e:
+            print(f"Błąd odczytu pliku DIMACS: {e}", file=sys.stderr)
+            sys.exit(1)
     
-    # Zapisywanie grafu do pliku JSON
+    # Zapis do pliku tymczasowego: błąd w trakcie (np. niepoprawna linia DIMACS) nie zostawia
+    # w katalogu grafów obciętego pliku
+    sciezka_tymczasowa = filepath + ".tmp"
     try:
-        with open(filepath, 'w') as f:
-            json.dump(graph_data, f, indent=2)
-            
-        print(f"   Wygenerowano graf:")
-        print(f"   Wierzchołki: {args.wierzcholki}")
-        print(f"   Krawędzie:   {len(graph_data['krawedzie'])}")
-        print(f"   Zapisano w:  {filepath}")
-        
-    except IOError as e:
-        print(f"Błąd zapisu pliku: {e}")
\ No newline at end of file
+        if args.format == "gbin":
+            liczba_krawedzi = zapisz_graf_binarny_strumieniowo(sciezka_tymczasowa, liczba_wierzcholkow, porcje,
+                                                               z_indeksem=not args.bez_indeksu,
+                                                               ograniczenie_kolorow=ograniczenie_kolorow)
+        else:
+            liczba_krawedzi = zapisz_graf_json_strumieniowo(sciezka_tymczasowa, liczba_wierzcholkow, porcje,
+                                                            ograniczenie_kolorow=ograniczenie_kolorow)
+        os.replace(sciezka_tymczasowa, filepath)
+    except (OSError, ValueError) as e:
+        if os.path.exists(sciezka_tymczasowa):
+            os.remove(sciezka_tymczasowa)
+        print(f"Nie utworzono grafu: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"   Wygenerowano graf ({args.typ}):")
+    print(f"   Wierzchołki: {liczba_wierzcholkow}")
+    print(f"   Krawędzie:   {liczba_krawedzi}")
+    if ograniczenie_kolorow:
+        print(f"   Kolorowalny: {ograniczenie_kolorow} kolorami")
+    print(f"   Zapisano w:  {filepath}")
@@ -0,0 +1,102 @@
+import numpy as np
+
+# Wielorozdzielcza historia zbieżności dla bardzo długich uruchomień.
+# Zamiast jednej wartości na generację plik wyników przechowuje kilka poziomów szczegółowości:
+# na każdym poziomie generacje są pogrupowane w kubełki o stałym rozmiarze, a każdy kubełek ma
+# średnią, minimum i maksimum średniej krzywej oraz minimum i maksimum wszystkich uruchomień.
+# Kolejne poziomy mają kubełki WSPOLCZYNNIK_POZIOMOW razy większe, więc całość zajmuje
+# ok. 4/3 najdokładniejszego poziomu, niezależnie od liczby generacji.
+#
+# Format (klucz "poziomy_historii_zbieznosci" w wynikach strategii):
+# {"liczba_generacji": G,
+#  "poziomy": [{"rozmiar_kubelka": b, "srednia": [...], "min": [...], "max": [...],
+#               "min_uruchomien": [...], "max_uruchomien": [...]}, ...]}   # od najdokładniejszego
+# Kubełek i obejmuje generacje [i * b, min((i + 1) * b, G)); ostatni może być niepełny.
+
+# Najdokładniejszy poziom ma co najwyżej tyle kubełków (więcej niż pikseli szerokości wykresu)
+NAJWIECEJ_PUNKTOW = 4096
+
+# Najgrubszy poziom ma co najmniej tyle kubełków
+NAJMNIEJ_PUNKTOW = 64
+
+WSPOLCZYNNIK_POZIOMOW = 4
+
+def _kubelki(wartosci, rozmiar_kubelka):
+
+    # Średnia, minimum i maksimum wartości w kolejnych kubełkach po rozmiar_kubelka elementów.
+
+    poczatki = np.arange(0, len(wartosci), rozmiar_kubelka)
+    liczebnosci = np.diff(np.append(poczatki, len(wartosci)))
+    srednie = np.add.reduceat(wartosci, poczatki) / liczebnosci
+    return srednie, np.minimum.reduceat(wartosci, poczatki), np.maximum.reduceat(wartosci, poczatki)
+
+def zbuduj_poziomy(srednia, minimum=None, maksimum=None, najwiecej_punktow=NAJWIECEJ_PUNKTOW,
+                   najmniej_punktow=NAJMNIEJ_PUNKTOW, wspolczynnik=WSPOLCZYNNIK_POZIOMOW):
+
+    # Poziomy szczegółowości średniej historii (i opcjonalnie obwiedni uruchomień minimum/maksimum,
+    # np. z AgregatHistorii). Zwraca słownik w formacie opisanym na początku modułu.
+
+    srednia = np.asarray(srednia, dtype=np.float64)
+    liczba_generacji = len(srednia)
+    rozmiar_kubelka = max(1, -(-liczba_generacji // najwiecej_punktow))
+
+    poziomy = []
+    while True:
+        sr, mn, mx = _kubelki(srednia, rozmiar_kubelka)
+        poziom = {
+            "rozmiar_kubelka": rozmiar_kubelka,
+            "srednia": np.round(sr, 2).tolist(),
+            "min": np.round(mn, 2).tolist(),
+            "max": np.round(mx, 2).tolist()
+        }
+        if minimum is not None:
+            poziom["min_uruchomien"] = _kubelki(np.asarray(minimum), rozmiar_kubelka)[1].tolist()
+        if maksimum is not None:
+            poziom["max_uruchomien"] = _kubelki(np.asarray(maksimum), rozmiar_kubelka)[2].tolist()
+        poziomy.append(poziom)
+
+        rozmiar_kubelka *= wspolczynnik
+        if -(-liczba_generacji // rozmiar_kubelka) < najmniej_punktow:
+            break
+
+    return {"liczba_generacji": liczba_generacji, "poziomy": poziomy}
+
+def wybierz_poziom(poziomy, szerokosc):
+
+    # Najgrubszy poziom, który ma co najmniej szerokosc kubełków (kubełek na piksel wykresu);
+    # gdy żaden nie ma, najdokładniejszy.
+
+    for poziom in reversed(poziomy["poziomy"]):
+        if len(poziom["srednia"]) >= szerokosc:
+            return poziom
+    return poziomy["poziomy"][0]
+
+def srodki_kubelkow(liczba_generacji, rozmiar_kubelka):
+
+    # Położenie kubełków na osi generacji: środek każdego kubełka (ostatni może być niepełny).
+
+    poczatki = np.arange(0, liczba_generacji, rozmiar_kubelka)
+    konce = np.minimum(poczatki + rozmiar_kubelka, liczba_generacji)
+    return (poczatki + konce - 1) / 2
+
+def krzywa_do_wykresu(strategia, szerokosc):
+
+    # Dane średniej krzywej zbieżności strategii dla wykresu o szerokości szerokosc pikseli.
+    # Zwraca (x, srednia, minimum, maksimum); minimum i maksimum są None, gdy rysowana jest
+    # każda generacja. Pliki z pełną historią ("srednia_historia_zbieznosci") dłuższą niż
+    # szerokosc są zmniejszane w locie; bez żadnej historii zwraca None.
+
+    poziomy = strategia.get("poziomy_historii_zbieznosci")
+    if poziomy is None:
+        historia = strategia.get("srednia_historia_zbieznosci")
+        if not historia:
+            return None
+        if len(historia) <= szerokosc:
+            return list(range(len(historia))), historia, None, None
+        poziomy = zbuduj_poziomy(historia)
+
+    poziom = wybierz_poziom(poziomy, szerokosc)
+    x = srodki_kubelkow(poziomy["liczba_generacji"], poziom["rozmiar_kubelka"])
+    if poziom["rozmiar_kubelka"] == 1:
+        return x, poziom["srednia"], None, None
+    return x, poziom["srednia"], poziom["min"], poziom["max"]
@@ -0,0 +1,190 @@
+import heapq
+import time
+import numpy as np
+
+from main import indeks_sasiedztwa, uruchom_ga
+
+# Szukanie najmniejszej liczby kolorów, dla której GA znajduje kolorowanie bez konfliktów.
+# Punkt startowy to kolorowanie DSatur; populacja dla każdej kolejnej liczby kolorów powstaje
+# ze scalenia klas kolorów najlepszego dotąd kolorowania, a nie losowo.
+
+TRYBY_SZUKANIA = ("w_dol", "bisekcja")
+
+def dsatur(liczba_wierzcholkow, offsety, sasiedzi):
+
+    # Zachłanne kolorowanie DSatur: zawsze koloruje wierzchołek o największej liczbie różnych kolorów
+    # u sąsiadów (remis: większy stopień), najmniejszym wolnym kolorem. Zwraca listę kolorów 0..c-1.
+    # Kopiec z leniwym usuwaniem: po wzroście nasycenia wierzchołek trafia do kopca ponownie,
+    # a nieaktualne wpisy są pomijane przy zdejmowaniu.
+
+    kolory = [-1] * liczba_wierzcholkow
+    nasycenie = [set() for _ in range(liczba_wierzcholkow)]
+    stopnie = [offsety[v + 1] - offsety[v] for v in range(liczba_wierzcholkow)]
+    kopiec = [(0, -stopnie[v], v) for v in range(liczba_wierzcholkow)]
+    heapq.heapify(kopiec)
+
+    while kopiec:
+        _, _, v = heapq.heappop(kopiec)
+        if kolory[v] >= 0:
+            continue
+        kolor = 0
+        while kolor in nasycenie[v]:
+            kolor += 1
+        kolory[v] = kolor
+        for w in sasiedzi[offsety[v]:offsety[v + 1]]:
+            if kolory[w] < 0 and kolor not in nasycenie[w]:
+                nasycenie[w].add(kolor)
+                heapq.heappush(kopiec, (-len(nasycenie[w]), -stopnie[w], w))
+
+    return kolory
+
+def klika_zachlanna(liczba_wierzcholkow, offsety, sasiedzi, liczba_startow=10):
+
+    # Rozmiar kliki znalezionej zachłannie z liczba_startow wierzchołków o największym stopniu:
+    # do kliki dokładany jest kandydat o największym stopniu, sąsiadujący ze wszystkimi dotychczasowymi.
+    # Każde poprawne kolorowanie potrzebuje co najmniej tylu kolorów.
+
+    if liczba_wierzcholkow == 0:
+        return 0
+    stopnie = [offsety[v + 1] - offsety[v] for v in range(liczba_wierzcholkow)]
+    starty = sorted(range(liczba_wierzcholkow), key=stopnie.__getitem__, reverse=True)[:liczba_startow]
+
+    najwieksza = 1
+    for start in starty:
+        rozmiar = 1
+        kandydaci = set(sasiedzi[offsety[start]:offsety[start + 1]])
+        while kandydaci:
+            v = max(kandydaci, key=stopnie.__getitem__)
+            kandydaci.intersection_update(sasiedzi[offsety[v]:offsety[v + 1]])
+            rozmiar += 1
+        najwieksza = max(najwieksza, rozmiar)
+    return najwieksza
+
+def przenumeruj_kolory(kolorowanie):
+
+    # Numeruje użyte kolory kolejno od 0 (w kolejności pierwszego wystąpienia).
+    # Zwraca (kolorowanie, liczba_uzytych_kolorow).
+
+    numery = {}
+    wynik = [numery.setdefault(kolor, len(numery)) for kolor in kolorowanie]
+    return wynik, len(numery)
+
+def scal_klase(kolorowanie, liczba_kolorow, usuwana, offsety, sasiedzi, rng):
+
+    # Kolorowanie liczba_kolorow-1 kolorami: wierzchołki klasy usuwana dostają kolor najrzadszy
+    # wśród już pokolorowanych sąsiadów (remis: pierwszy od losowego przesunięcia), a kolory
+    # większe od usuwana są zmniejszane o 1. Zwraca nową listę.
+
+    nowe = [kolor - (kolor > usuwana) if kolor != usuwana else -1 for kolor in kolorowanie]
+    klasa = [v for v, kolor in enumerate(kolorowanie) if kolor == usuwana]
+    liczba_pozostalych = liczba_kolorow - 1
+
+    przesuniecia = rng.integers(0, liczba_pozostalych, size=len(klasa)).tolist()
+    for v, start in zip(klasa, przesuniecia):
+        sasiedzi_w_kolorze = [0] * liczba_pozostalych
+        for w in sasiedzi[offsety[v]:offsety[v + 1]]:
+            if nowe[w] >= 0:
+                sasiedzi_w_kolorze[nowe[w]] += 1
+        najlepszy = start
+        for i in range(liczba_pozostalych):
+            kolor = (start + i) % liczba_pozostalych
+            if sasiedzi_w_kolorze[kolor] < sasiedzi_w_kolorze[najlepszy]:
+                najlepszy = kolor
+        nowe[v] = najlepszy
+
+    return nowe
+
+def populacja_ze_scalenia(kolorowanie, liczba_kolorow_kolorowania, liczba_kolorow, rozmiar_populacji,
+                          offsety, sasiedzi, rng):
+
+    # Populacja startowa dla liczba_kolorow kolorów z kolorowania liczba_kolorow_kolorowania kolorami:
+    # każdy osobnik scala kolejno tyle klas, ile kolorów trzeba ubyć. Pierwszy osobnik scala zawsze
+    # najmniejszą klasę, pozostałe losowe, więc populacja różni się od samego początku.
+
+    populacja = []
+    for numer in range(rozmiar_populacji):
+        osobnik = kolorowanie
+        for liczba in range(liczba_kolorow_kolorowania, liczba_kolorow, -1):
+            if numer == 0:
+                liczebnosci = np.bincount(osobnik, minlength=liczba)
+                usuwana = int(np.argmin(liczebnosci))
+            else:
+                usuwana = int(rng.integers(0, liczba))
+            osobnik = scal_klase(osobnik, liczba, usuwana, offsety, sasiedzi, rng)
+        populacja.append(osobnik)
+    return populacja
+
+def szukaj_liczby_chromatycznej(graf, rozmiar_populacji, liczba_generacji, p_krzyzowania, p_mutacji,
+                                rozmiar_turnieju, tryb="w_dol", kryteria_stopu=None, rng=None, obserwator=None,
+                                **opcje):
+
+    # Szuka najmniejszego k, dla którego uruchom_ga (z budżetem liczba_generacji i kryteria_stopu)
+    # znajduje kolorowanie bez konfliktów. Górne ograniczenie daje DSatur, dolne - klika zachłanna.
+    # tryb="w_dol" zmniejsza k o 1 i kończy na pierwszym k, dla którego budżet nie wystarczył;
+    # tryb="bisekcja" połowi przedział między największym k bez sukcesu a najmniejszym z sukcesem.
+    # Populacja dla każdego k to najlepsze dotąd kolorowanie ze scalonymi klasami (populacja_ze_scalenia).
+    # obserwator (wywoływalny) dostaje słownik z wynikiem każdej próby; opcje trafiają do uruchom_ga
+    # (silnik, operatory, tryb memetyczny itd.).
+    # Zwraca słownik z najmniejszym k, jego kolorowaniem, ograniczeniami i listą prób.
+
+    if tryb not in TRYBY_SZUKANIA:
+        raise ValueError(f"Nieznany tryb szukania: {tryb}")
+    if rng is None:
+        rng = np.random.default_rng()
+    liczba_wierzcholkow = graf["liczba_wierzcholkow"]
+    offsety, sasiedzi = indeks_sasiedztwa(graf)
+    kryteria_stopu = {**(kryteria_stopu or {}), "zero_konfliktow": True}
+
+    najlepsze, gorne = przenumeruj_kolory(dsatur(liczba_wierzcholkow, offsety, sasiedzi))
+    dolne = klika_zachlanna(liczba_wierzcholkow, offsety, sasiedzi)
+    proby = []
+
+    def sprobuj(liczba_kolorow):
+        # Jedno uruchomienie GA dla liczba_kolorow z populacją ze scalenia klas kolorowania najlepsze
+        start = time.perf_counter()
+        populacja = populacja_ze_scalenia(najlepsze, najlepsze_k, liczba_kolorow, rozmiar_populacji,
+                                          offsety, sasiedzi, rng)
+        osobnik, konflikty, historia = uruchom_ga(graf, liczba_kolorow, rozmiar_populacji, liczba_generacji,
+                                                  p_krzyzowania, p_mutacji, rozmiar_turnieju,
+                                                  kryteria_stopu=kryteria_stopu, rng=rng,
+                                                  populacja_poczatkowa=populacja, **opcje)
+        proba = {
+            "liczba_kolorow": liczba_kolorow,
+            "konflikty": konflikty,
+            "wykonalne": konflikty == 0,
+            "generacje": historia.index(0) + 1 if konflikty == 0 else len(historia),
+            "czas_s": time.perf_counter() - start
+        }
+        proby.append(proba)
+        if obserwator is not None:
+            obserwator(proba)
+        return osobnik if konflikty == 0 else None
+
+    najlepsze_k = gorne
+    if tryb == "w_dol":
+        k = gorne - 1
+        while k >= dolne:
+            osobnik = sprobuj(k)
+            if osobnik is None:
+                break
+            # GA może użyć mniej kolorów niż k; kolejna próba zaczyna od faktycznie użytych
+            najlepsze, najlepsze_k = przenumeruj_kolory(osobnik)
+            k = najlepsze_k - 1
+    else:
+        # Niezmiennik: najlepsze_k ma kolorowanie bez konfliktów, dla k <= bez_sukcesu go nie szukamy
+        bez_sukcesu = dolne - 1
+        while najlepsze_k - bez_sukcesu > 1:
+            k = (bez_sukcesu + najlepsze_k) // 2
+            osobnik = sprobuj(k)
+            if osobnik is None:
+                bez_sukcesu = k
+            else:
+                najlepsze, najlepsze_k = przenumeruj_kolory(osobnik)
+
+    return {
+        "liczba_kolorow": najlepsze_k,
+        "kolorowanie": najlepsze,
+        "ograniczenie_gorne_dsatur": gorne,
+        "ograniczenie_dolne_klika": dolne,
+        "proby": proby
+    }
@@ -1,12 +1,50 @@
+if __name__ == "__main__":
+    # Argumenty są sprawdzane przed importem numpy i silnika GA, żeby --help
+    # i błędy w wierszu poleceń nie płaciły za ich ładowanie.
+    from argumenty_main import sprawdz_argumenty
+    ARGUMENTY = sprawdz_argumenty()
+
 import random
-import argparse
 import json
 import sys
 import os
+import csv
+import time
+import pickle
+import struct
+import hashlib
+import numpy as np
+from array import array
+from collections import OrderedDict
+from format_grafu import czy_format_binarny, wczytaj_graf_binarny, zbuduj_indeks_sasiedztwa
+from przeszukiwanie_lokalne import popraw_populacje
+from historia_zbieznosci import zbuduj_poziomy
 
 KATALOG_WYNIKOW = "wyniki"
 
+# Domyślny eksperyment (main.py i manifesty uruchom_wsadowo.py bez własnych ustawień)
+DOMYSLNA_LICZBA_URUCHOMIEN = 10
+
+# Parametry algorytmu
+DOMYSLNE_PODSTAWOWE_PARAMETRY = {
+    "rozmiar_populacji": 50,
+    "liczba_generacji": 200,
+    "rozmiar_turnieju": 5
+}
+
+# Zestawy parametrów do porównania
+DOMYSLNE_ZESTAWY_PARAMETROW = [
+    {"nazwa": "Niska mutacja", "p_krzyzowania": 0.9, "p_mutacji": 0.01},
+    {"nazwa": "Średnia mutacja", "p_krzyzowania": 0.9, "p_mutacji": 0.1},
+    {"nazwa": "Wysoka mutacja", "p_krzyzowania": 0.9, "p_mutacji": 0.2},
+    {"nazwa": "Niskie krzyżowanie", "p_krzyzowania": 0.1, "p_mutacji": 0.1},
+    {"nazwa": "Tylko krzyżowanie 100%", "p_krzyzowania": 1, "p_mutacji": 0},
+    {"nazwa": "Sama mutacja 10%", "p_krzyzowania": 0, "p_mutacji": 0.1},
+]
+
 def wczytaj_graf_z_pliku(filepath):
+    if czy_format_binarny(filepath):
+        return wczytaj_graf_binarny_z_pliku(filepath)
     try:
         with open(filepath, 'r') as f:
             data = json.load(f)
@@ -14,6 +52,8 @@ def wczytaj_graf_z_pliku(filepath):
                 print(f"Błąd: Plik {filepath} ma niepoprawny format.", file=sys.stderr)
                 sys.exit(1)
             data["krawedzie"] = [tuple(krawedz) for krawedz in data["krawedzie"]]
+            data["sasiedzi_offsety"], data["sasiedzi"] = zbuduj_indeks_sasiedztwa(
+                data["liczba_wierzcholkow"], data["krawedzie"])
             return data
     except FileNotFoundError:
         print(f"Błąd: Nie znaleziono pliku: {filepath}", file=sys.stderr)
@@ -21,10 +61,41 @@ def wczytaj_graf_z_pliku(filepath):
     except json.JSONDecodeError:
         print(f"Błąd: Plik {filepath} nie jest poprawnym plikiem JSON.", file=sys.stderr)
         sys.exit(1)
+    except ValueError as e:
+        print(f"Błąd: Plik {filepath} zawiera niepoprawny graf ({e}).", file=sys.stderr)
+        sys.exit(1)
     except Exception as e:
         print(f"Wystąpił nieoczekiwany błąd przy wczytywaniu pliku: {e}", file=sys.stderr)
         sys.exit(1)
 
+def indeks_sasiedztwa(graf):
+
+    # Zwraca indeks CSR grafu jako listy Pythona (szybsze indeksowanie w pętli).
+    # Jeśli graf nie pochodzi z wczytaj_graf_z_pliku, indeks jest budowany na miejscu.
+
+    if "sasiedzi_offsety" not in graf:
+        graf["sasiedzi_offsety"], graf["sasiedzi"] = zbuduj_indeks_sasiedztwa(
+            graf["liczba_wierzcholkow"], graf["krawedzie"])
+    return graf["sasiedzi_offsety"].tolist(), graf["sasiedzi"].tolist()
+
+def wczytaj_graf_binarny_z_pliku(filepath):
+
+    # Wczytuje graf .gbin przez mapowanie pamięci (bez kopiowania krawędzi).
+    # Brakujący indeks CSR jest budowany w pamięci.
+
+    try:
+        data = wczytaj_graf_binarny(filepath)
+        if "sasiedzi_offsety" not in data:
+            data["sasiedzi_offsety"], data["sasiedzi"] = zbuduj_indeks_sasiedztwa(
+                data["liczba_wierzcholkow"], data["krawedzie"])
+    except FileNotFoundError:
+        print(f"Błąd: Nie znaleziono pliku: {filepath}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Błąd: Plik {filepath} nie jest poprawnym grafem binarnym ({e}).", file=sys.stderr)
+        sys.exit(1)
+    return data
+
 # FUNKCJE ALGORYTMU GENETYCZNEGO
 
 def stworz_osobnika(liczba_wierzcholkow, liczba_kolorow):
@@ -47,12 +118,39 @@ def oblicz_przystosowanie(osobnik, krawedzie):
     # Zwracamy wskaźnik przystosowania (1.0 = 0 konfliktów)
     return 1.0 / (1.0 + liczba_konfliktow)
 
+def policz_konflikty(osobnik, krawedzie):
+
+    # Zwraca liczbę krawędzi łączących wierzchołki tego samego koloru.
+
+    if isinstance(osobnik, array):
+        # Indeksowanie listy nie tworzy obiektów int przy każdym odczycie, w przeciwieństwie do array
+        osobnik = osobnik.tolist()
+    liczba_konfliktow = 0
+    for u, v in krawedzie:
+        if osobnik[u] == osobnik[v]:
+            liczba_konfliktow += 1
+    return liczba_konfliktow
+
+def konflikty_osobnika(osobnik, krawedzie_u, krawedzie_v):
+
+    # Liczba konfliktów chromosomu (array albo lista) liczona na tablicach krawędzi (tablice_krawedzi),
+    # bez zamiany krawędzi grafu na listę krotek.
+
+    geny = jako_tablica(osobnik)
+    return int(np.count_nonzero(geny[krawedzie_u] == geny[krawedzie_v]))
+
 def selekcja_turniejowa(populacja, przystosowania, rozmiar_turnieju):
 
     # Wybiera najlepszego osobnika z losowo wybranej grupy turniejowej.
 
+    return populacja[selekcja_turniejowa_indeks(przystosowania, rozmiar_turnieju)]
+
+def selekcja_turniejowa_indeks(przystosowania, rozmiar_turnieju):
+
+    # Jak selekcja_turniejowa, ale zwraca indeks zwycięzcy.
+
     # Losowanie uczestników
-    indeksy_uczestnikow = random.sample(range(len(populacja)), rozmiar_turnieju)
+    indeksy_uczestnikow = random.sample(range(len(przystosowania)), rozmiar_turnieju)
     
     najlepszy_indeks = -1
     najlepsze_przystosowanie = -1.0
@@ -63,7 +161,7 @@ def selekcja_turniejowa(populacja, przystosowania, rozmiar_turnieju):
             najlepsze_przystosowanie = przystosowania[indeks]
             najlepszy_indeks = indeks
             
-    return populacja[najlepszy_indeks]
+    return najlepszy_indeks
 
 def krzyzowanie(rodzic1, rodzic2, p_krzyzowania):
 
@@ -96,29 +194,1017 @@ def mutacja(osobnik, p_mutacji, liczba_kolorow):
             
     return zmutowany_osobnik
 
+# OCENA PRZYROSTOWA
+
+def konflikty_po_zmianach(nowy, stary, konflikty_starego, zmienione, offsety, sasiedzi):
+
+    # Liczy konflikty osobnika "nowy", który różni się od "stary" tylko na pozycjach "zmienione".
+    # Przegląda jedynie krawędzie wychodzące ze zmienionych wierzchołków: O(zmiany * stopień).
+
+    if not zmienione:
+        return konflikty_starego
+
+    zbior_zmienionych = set(zmienione)
+    konflikty = konflikty_starego
+    for v in zmienione:
+        nowy_v, stary_v = nowy[v], stary[v]
+        for w in sasiedzi[offsety[v]:offsety[v + 1]]:
+            # Krawędź między dwoma zmienionymi wierzchołkami liczymy tylko raz
+            if w in zbior_zmienionych and w < v:
+                continue
+            konflikty += (nowy_v == nowy[w]) - (stary_v == stary[w])
+    return konflikty
+
+def konflikty_po_krzyzowaniu(rodzic1, rodzic2, konflikty1, konflikty2, dziecko1, dziecko2, punkt_ciecia,
+                             offsety, sasiedzi):
+
+    # Konflikty dzieci krzyżowania jednopunktowego w punkcie punkt_ciecia.
+    # Dzieci różnią się od rodziców tylko tam, gdzie rodzice mają różne geny po jednej stronie cięcia,
+    # więc wystarczy sprawdzić krótszą stronę i krawędzie zmienionych wierzchołków.
+
+    if punkt_ciecia >= len(rodzic1) - punkt_ciecia:
+        # Prawa strona krótsza: dziecko1 to rodzic1 z podmienionym ogonem
+        zmienione = [i for i in range(punkt_ciecia, len(rodzic1)) if rodzic1[i] != rodzic2[i]]
+        return (konflikty_po_zmianach(dziecko1, rodzic1, konflikty1, zmienione, offsety, sasiedzi),
+                konflikty_po_zmianach(dziecko2, rodzic2, konflikty2, zmienione, offsety, sasiedzi))
+
+    # Lewa strona krótsza: dziecko1 to rodzic2 z podmienionym początkiem
+    zmienione = [i for i in range(punkt_ciecia) if rodzic1[i] != rodzic2[i]]
+    return (konflikty_po_zmianach(dziecko1, rodzic2, konflikty2, zmienione, offsety, sasiedzi),
+            konflikty_po_zmianach(dziecko2, rodzic1, konflikty1, zmienione, offsety, sasiedzi))
+
+# OPERATORY W MIEJSCU (BUFORY POPULACJI)
+
+def typ_genu(liczba_kolorow):
+
+    # Najmniejszy kod typu array mieszczący kolory 0..liczba_kolorow-1.
+
+    if liczba_kolorow <= 1 << 8:
+        return 'B'
+    if liczba_kolorow <= 1 << 16:
+        return 'H'
+    return 'I'
+
+def stworz_bufor_populacji(rozmiar_populacji, liczba_wierzcholkow, liczba_kolorow):
+
+    # Lista wyzerowanych chromosomów (array), do których operatory w miejscu zapisują dzieci.
+
+    typ = typ_genu(liczba_kolorow)
+    rozmiar_bajtow = liczba_wierzcholkow * array(typ).itemsize
+    return [array(typ, bytes(rozmiar_bajtow)) for _ in range(rozmiar_populacji)]
+
+# LOSOWANIE BLOKOWE
+
+def pozycje_mutacji(liczba_genow, p_mutacji, rng):
+
+    # Rosnące pozycje genów 0..liczba_genow-1 wybranych do mutacji, każdy niezależnie z p_mutacji.
+    # Odstępy między kolejnymi pozycjami mają rozkład geometryczny, więc koszt zależy
+    # od liczby mutacji, a nie od liczby genów.
+
+    if p_mutacji <= 0 or liczba_genow == 0:
+        return np.empty(0, dtype=np.int64)
+    if p_mutacji >= 1:
+        return np.arange(liczba_genow, dtype=np.int64)
+
+    oczekiwana = liczba_genow * p_mutacji
+    porcja = int(oczekiwana + 4 * np.sqrt(oczekiwana)) + 16
+    czesci = []
+    ostatnia = -1
+    while True:
+        pozycje = ostatnia + np.cumsum(rng.geometric(p_mutacji, size=porcja))
+        if pozycje[-1] >= liczba_genow:
+            czesci.append(pozycje[:np.searchsorted(pozycje, liczba_genow)])
+            return np.concatenate(czesci)
+        czesci.append(pozycje)
+        ostatnia = pozycje[-1]
+
+def wylosuj_pokolenie(przystosowania, liczba_par, liczba_wierzcholkow, p_krzyzowania, p_mutacji, liczba_kolorow,
+                      rozmiar_turnieju, rng):
+
+    # Wszystkie losowania jednej generacji silnika python naraz, w kilku wywołaniach generatora rng.
+    # Zwraca listy Pythona:
+    # - indeksy rodziców (para i: pozycje 2i i 2i+1), wybrane turniejami,
+    # - punkt cięcia każdej pary (0: bez krzyżowania),
+    # - granice: mutacje dziecka j to pozycje[granice[j]:granice[j + 1]] i kolory[...] (dzieci pary i: 2i, 2i+1),
+    # - pozycje genów do mutacji w obrębie dziecka i ich nowe kolory.
+
+    liczba_dzieci = 2 * liczba_par
+    indeksy_rodzicow = selekcja_turniejowa_wektorowa(np.asarray(przystosowania), liczba_dzieci, rozmiar_turnieju, rng)
+
+    punkty_ciecia = np.zeros(liczba_par, dtype=np.int64)
+    if liczba_wierzcholkow > 1:
+        czy_krzyzowac = rng.random(liczba_par) < p_krzyzowania
+        punkty_ciecia[czy_krzyzowac] = rng.integers(1, liczba_wierzcholkow, size=int(czy_krzyzowac.sum()))
+
+    pozycje = pozycje_mutacji(liczba_dzieci * liczba_wierzcholkow, p_mutacji, rng)
+    kolory = rng.integers(0, liczba_kolorow, size=len(pozycje))
+    granice = np.searchsorted(pozycje, np.arange(liczba_dzieci + 1) * liczba_wierzcholkow)
+
+    return (indeksy_rodzicow.tolist(), punkty_ciecia.tolist(), granice.tolist(),
+            (pozycje % max(liczba_wierzcholkow, 1)).tolist(), kolory.tolist())
+
+def zmien_geny(osobnik, pozycje, kolory):
+
+    # Mutacja z gotowych losowań: gen pozycje[i] dostaje kolor kolory[i].
+
+    for i, kolor in zip(pozycje, kolory):
+        osobnik[i] = kolor
+
+def zmien_geny_przyrostowo(osobnik, konflikty, pozycje, kolory, offsety, sasiedzi):
+
+    # Jak zmien_geny, ale aktualizuje liczbę konfliktów w O(stopień) na zmieniony gen.
+    # Zwraca nową liczbę konfliktów.
+
+    for i, nowy_kolor in zip(pozycje, kolory):
+        stary_kolor = osobnik[i]
+        if nowy_kolor != stary_kolor:
+            for w in sasiedzi[offsety[i]:offsety[i + 1]]:
+                kolor_sasiada = osobnik[w]
+                konflikty += (kolor_sasiada == nowy_kolor) - (kolor_sasiada == stary_kolor)
+            osobnik[i] = nowy_kolor
+    return konflikty
+
+# WEKTOROWE OPERATORY (SILNIK NUMPY)
+
+def tablice_krawedzi(graf):
+
+    # Zwraca krawędzie jako dwie tablice indeksów (u, v).
+    # Wynik jest zapamiętywany w słowniku grafu, żeby nie konwertować go przy każdym uruchomieniu.
+
+    if "tablice_krawedzi" not in graf:
+        krawedzie = np.asarray(graf["krawedzie"], dtype=np.intp).reshape(-1, 2)
+        graf["tablice_krawedzi"] = (krawedzie[:, 0].copy(), krawedzie[:, 1].copy())
+    return graf["tablice_krawedzi"]
+
+def konfliktowe_krawedzie(populacja, krawedzie_u, krawedzie_v, bufory=None):
+
+    # Tablica (rozmiar_populacji, liczba_krawedzi): True tam, gdzie oba końce krawędzi mają ten sam kolor.
+    # bufory (BuforyPopulacji) pozwalają zebrać kolory końców krawędzi bez przydzielania nowych tablic;
+    # wynik jest wtedy widokiem bufory.rowne, ważnym do następnego wywołania.
+
+    if bufory is None:
+        return populacja[:, krawedzie_u] == populacja[:, krawedzie_v]
+    np.take(populacja, krawedzie_u, axis=1, out=bufory.kolory_u)
+    np.take(populacja, krawedzie_v, axis=1, out=bufory.kolory_v)
+    return np.equal(bufory.kolory_u, bufory.kolory_v, out=bufory.rowne)
+
+def oblicz_konflikty_populacji(populacja, krawedzie_u, krawedzie_v, bufory=None):
+
+    # Liczy konflikty dla całej populacji naraz.
+    # populacja ma kształt (rozmiar_populacji, liczba_wierzcholkow).
+
+    return np.count_nonzero(konfliktowe_krawedzie(populacja, krawedzie_u, krawedzie_v, bufory), axis=1)
+
+def selekcja_turniejowa_wektorowa(przystosowania, liczba_rodzicow, rozmiar_turnieju, rng):
+
+    # Rozgrywa liczba_rodzicow turniejów jednocześnie i zwraca indeksy zwycięzców.
+    # Uczestnicy każdego turnieju są różni (jak w random.sample).
+
+    rozmiar_populacji = len(przystosowania)
+    losowe_klucze = rng.random((liczba_rodzicow, rozmiar_populacji))
+    uczestnicy = np.argpartition(losowe_klucze, rozmiar_turnieju - 1, axis=1)[:, :rozmiar_turnieju]
+    zwyciezcy = np.argmax(przystosowania[uczestnicy], axis=1)
+    return uczestnicy[np.arange(liczba_rodzicow), zwyciezcy]
+
+class BuforyPopulacji:
+
+    # Tablice przydzielane raz na uruchomienie silnika numpy: dwie populacje (bieżąca i następna,
+    # zamieniane co generację) w najmniejszym typie mieszczącym kolory oraz miejsce na wyniki pośrednie.
+
+    def __init__(self, rozmiar_populacji, liczba_wierzcholkow, liczba_krawedzi, liczba_kolorow):
+        liczba_par = (rozmiar_populacji + 1) // 2
+        self.typ = np.dtype(typ_genu(liczba_kolorow))
+        # Dzieci pary zapisywane są do sąsiednich wierszy; nadmiarowe dziecko trafia do ostatniego wiersza
+        self.populacje = [np.zeros((2 * liczba_par, liczba_wierzcholkow), dtype=self.typ) for _ in range(2)]
+        self.rodzice1 = np.empty((liczba_par, liczba_wierzcholkow), dtype=self.typ)
+        self.rodzice2 = np.empty((liczba_par, liczba_wierzcholkow), dtype=self.typ)
+        self.maska_krzyzowania = np.empty((liczba_par, liczba_wierzcholkow), dtype=bool)
+        self.pozycje = np.arange(liczba_wierzcholkow)
+        self.kolory_u = np.empty((rozmiar_populacji, liczba_krawedzi), dtype=self.typ)
+        self.kolory_v = np.empty((rozmiar_populacji, liczba_krawedzi), dtype=self.typ)
+        self.rowne = np.empty((rozmiar_populacji, liczba_krawedzi), dtype=bool)
+
+    def zamien(self):
+        # Następna populacja staje się bieżącą; poprzednia zostaje nietknięta do kolejnego krzyżowania
+        self.populacje.reverse()
+
+def mutacja_wektorowa_w_miejscu(populacja, p_mutacji, liczba_kolorow, rng):
+
+    # Mutacja wszystkich genów ciągłej tablicy populacji w miejscu; losowane są tylko pozycje
+    # mutacji (pozycje_mutacji) i ich nowe kolory.
+
+    pozycje = pozycje_mutacji(populacja.size, p_mutacji, rng)
+    populacja.reshape(-1)[pozycje] = rng.integers(0, liczba_kolorow, size=len(pozycje))
+
+# REJESTR OPERATORÓW
+
+class KontekstOperatorow:
+
+    # Dane wspólne dla operatorów z rejestru, przygotowywane raz na uruchomienie:
+    # indeks sąsiedztwa (offsety, sasiedzi; None przy pełnej ocenie), krawędzie jako tablice (u, v),
+    # liczba kolorów, generator rng uruchomienia i bufory populacji silnika numpy (albo None).
+
+    def __init__(self, liczba_kolorow, rng, indeks=None, krawedzie=None, bufory=None):
+        self.liczba_kolorow = liczba_kolorow
+        self.rng = rng
+        self.offsety, self.sasiedzi = indeks if indeks is not None else (None, None)
+        self.krawedzie_u, self.krawedzie_v = krawedzie if krawedzie is not None else (None, None)
+        self.bufory = bufory
+
+def jako_tablica(osobnik):
+
+    # Geny chromosomu jako tablica NumPy: widok bez kopiowania dla array, kopia dla listy.
+
+    if isinstance(osobnik, array):
+        return np.frombuffer(osobnik, dtype=osobnik.typecode)
+    return np.asarray(osobnik)
+
+def ustaw_geny(osobnik, pozycje, wartosci):
+
+    # osobnik[pozycje] = wartosci dla chromosomu array albo listy (pozycje i wartosci to tablice NumPy).
+
+    if isinstance(osobnik, array):
+        np.frombuffer(osobnik, dtype=osobnik.typecode)[pozycje] = wartosci
+    else:
+        for i, wartosc in zip(pozycje.tolist(), wartosci.tolist()):
+            osobnik[i] = wartosc
+
+def wierzcholki_w_konflikcie(geny, krawedzie_u, krawedzie_v):
+
+    # Rosnące numery wierzchołków, które leżą na co najmniej jednej konfliktowej krawędzi.
+
+    rowne = geny[krawedzie_u] == geny[krawedzie_v]
+    return np.unique(np.concatenate((krawedzie_u[rowne], krawedzie_v[rowne])))
+
+def klasy_gpx(pierwszy, drugi, liczba_kolorow, rng):
+
+    # Jedno dziecko krzyżowania GPX (greedy partition crossover). Rodzice na przemian oddają swoją
+    # największą klasę koloru, liczoną tylko po wierzchołkach jeszcze bez koloru w dziecku;
+    # klasa dostaje kolejny kolor dziecka. Po liczba_kolorow krokach reszta wierzchołków dostaje
+    # losowe kolory. Liczebności klas są aktualizowane przy przypisaniu wierzchołka, więc całość
+    # kosztuje O(liczba_wierzcholkow + liczba_kolorow^2). Zwraca geny dziecka jako listę.
+
+    rodzice = (pierwszy, drugi)
+    klasy = ([[] for _ in range(liczba_kolorow)], [[] for _ in range(liczba_kolorow)])
+    for v, (kolor1, kolor2) in enumerate(zip(pierwszy, drugi)):
+        klasy[0][kolor1].append(v)
+        klasy[1][kolor2].append(v)
+    liczebnosci = ([len(klasa) for klasa in klasy[0]], [len(klasa) for klasa in klasy[1]])
+
+    dziecko = [-1] * len(pierwszy)
+    for kolor in range(liczba_kolorow):
+        strona = kolor % 2
+        najwieksza = max(range(liczba_kolorow), key=liczebnosci[strona].__getitem__)
+        if liczebnosci[strona][najwieksza] == 0:
+            break
+        liczebnosci[strona][najwieksza] = 0
+        # Wierzchołek opuszcza też swoją klasę u drugiego rodzica
+        drugi_rodzic, liczebnosci_drugiego = rodzice[1 - strona], liczebnosci[1 - strona]
+        for v in klasy[strona][najwieksza]:
+            if dziecko[v] < 0:
+                dziecko[v] = kolor
+                liczebnosci_drugiego[drugi_rodzic[v]] -= 1
+
+    wolne = [v for v, kolor in enumerate(dziecko) if kolor < 0]
+    for v, kolor in zip(wolne, rng.integers(0, liczba_kolorow, size=len(wolne)).tolist()):
+        dziecko[v] = kolor
+    return dziecko
+
+# Operatory silnika python dla jednej pary. Dzieci są już kopiami rodziców; krzyżowanie zapisuje
+# do nich geny w miejscu (chromosomy array albo listy) i zwraca (konflikty1, konflikty2) dzieci,
+# a przy pełnej ocenie (kontekst.offsety to None) - (None, None). Wywoływane tylko dla par
+# wylosowanych do krzyżowania; punkt_ciecia wykorzystuje tylko krzyżowanie jednopunktowe.
+
+def krzyzowanie_jednopunktowe(rodzic1, rodzic2, konflikty1, konflikty2, dziecko1, dziecko2, punkt_ciecia,
+                              kontekst):
+
+    # Zamiana genów od punktu cięcia do końca (jak krzyzowanie).
+
+    if isinstance(dziecko1, array):
+        memoryview(dziecko1)[punkt_ciecia:] = memoryview(rodzic2)[punkt_ciecia:]
+        memoryview(dziecko2)[punkt_ciecia:] = memoryview(rodzic1)[punkt_ciecia:]
+    else:
+        dziecko1[punkt_ciecia:] = rodzic2[punkt_ciecia:]
+        dziecko2[punkt_ciecia:] = rodzic1[punkt_ciecia:]
+    if kontekst.offsety is None:
+        return None, None
+    return konflikty_po_krzyzowaniu(rodzic1, rodzic2, konflikty1, konflikty2, dziecko1, dziecko2, punkt_ciecia,
+                                    kontekst.offsety, kontekst.sasiedzi)
+
+def krzyzowanie_jednorodne(rodzic1, rodzic2, konflikty1, konflikty2, dziecko1, dziecko2, punkt_ciecia,
+                           kontekst):
+
+    # Każdy gen niezależnie z prawdopodobieństwem 1/2 pochodzi od drugiego rodzica.
+    # Konflikty liczone są tylko na krawędziach wierzchołków, które faktycznie zmieniły kolor.
+
+    geny1, geny2 = jako_tablica(rodzic1), jako_tablica(rodzic2)
+    zmienione = np.flatnonzero((kontekst.rng.random(len(geny1)) < 0.5) & (geny1 != geny2))
+    ustaw_geny(dziecko1, zmienione, geny2[zmienione])
+    ustaw_geny(dziecko2, zmienione, geny1[zmienione])
+    if kontekst.offsety is None:
+        return None, None
+    zmienione = zmienione.tolist()
+    return (konflikty_po_zmianach(dziecko1, rodzic1, konflikty1, zmienione, kontekst.offsety, kontekst.sasiedzi),
+            konflikty_po_zmianach(dziecko2, rodzic2, konflikty2, zmienione, kontekst.offsety, kontekst.sasiedzi))
+
+def krzyzowanie_gpx(rodzic1, rodzic2, konflikty1, konflikty2, dziecko1, dziecko2, punkt_ciecia, kontekst):
+
+    # Krzyżowanie zachowujące klasy kolorów (klasy_gpx); pierwszą klasę dziecka1 oddaje rodzic1,
+    # dziecka2 - rodzic2. Dzieci mogą różnić się od rodziców wszędzie, więc konflikty liczone są
+    # na tablicach krawędzi.
+
+    konflikty_dzieci = []
+    for dziecko, pierwszy, drugi in ((dziecko1, rodzic1, rodzic2), (dziecko2, rodzic2, rodzic1)):
+        geny = klasy_gpx(pierwszy, drugi, kontekst.liczba_kolorow, kontekst.rng)
+        dziecko[:] = array(dziecko.typecode, geny) if isinstance(dziecko, array) else geny
+        if kontekst.offsety is not None:
+            geny = np.asarray(geny)
+            konflikty_dzieci.append(konflikty_osobnika(geny, kontekst.krawedzie_u, kontekst.krawedzie_v))
+    if kontekst.offsety is None:
+        return None, None
+    return tuple(konflikty_dzieci)
+
+# Mutacja silnika python dostaje wylosowane pozycje (w obrębie chromosomu) i nowe kolory z wylosuj_pokolenie,
+# zmienia dziecko w miejscu i zwraca jego konflikty (None przy pełnej ocenie).
+
+def mutacja_losowa(dziecko, konflikty, pozycje, kolory, kontekst):
+
+    # Wylosowane geny dostają wylosowane kolory (jak mutacja).
+
+    if kontekst.offsety is None:
+        zmien_geny(dziecko, pozycje, kolory)
+        return None
+    return zmien_geny_przyrostowo(dziecko, konflikty, pozycje, kolory, kontekst.offsety, kontekst.sasiedzi)
+
+def mutacja_konfliktowa(dziecko, konflikty, pozycje, kolory, kontekst):
+
+    # Tyle samo zmian co w mutacja_losowa, ale tylko w wierzchołkach na konfliktowych krawędziach:
+    # pozycja i trafia w (i * liczba_konfliktowych // liczba_wierzcholkow)-ty z nich, więc rozkład
+    # pozostaje równomierny. Osobnik bez konfliktów nie jest zmieniany.
+
+    if not pozycje or konflikty == 0:
+        return konflikty
+    konfliktowe = wierzcholki_w_konflikcie(jako_tablica(dziecko), kontekst.krawedzie_u, kontekst.krawedzie_v)
+    if len(konfliktowe) == 0:
+        return konflikty
+    wybrane = konfliktowe[np.asarray(pozycje) * len(konfliktowe) // len(dziecko)].tolist()
+    return mutacja_losowa(dziecko, konflikty, wybrane, kolory, kontekst)
+
+# Operatory silnika numpy działają na całej populacji w miejscu. Krzyżowanie dostaje rodziców i dzieci
+# (już kopie rodziców) jako tablice (liczba_par, liczba_wierzcholkow), maskę par do krzyżowania
+# i punkty cięcia; mutacja - tablicę populacji.
+
+def krzyzowanie_jednopunktowe_wektorowe(rodzice1, rodzice2, dzieci1, dzieci2, czy_krzyzowac, punkty_ciecia,
+                                        kontekst=None):
+
+    # Geny od punktu cięcia w prawo pochodzą od drugiego rodzica.
+
+    bufory = kontekst.bufory if kontekst is not None else None
+    if bufory is not None:
+        maska, pozycje = bufory.maska_krzyzowania, bufory.pozycje
+        np.greater_equal(pozycje[None, :], punkty_ciecia[:, None], out=maska)
+    else:
+        maska = np.arange(rodzice1.shape[1])[None, :] >= punkty_ciecia[:, None]
+    maska &= czy_krzyzowac[:, None]
+
+    np.copyto(dzieci1, rodzice2, where=maska)
+    np.copyto(dzieci2, rodzice1, where=maska)
+
+def krzyzowanie_jednorodne_wektorowe(rodzice1, rodzice2, dzieci1, dzieci2, czy_krzyzowac, punkty_ciecia, kontekst):
+
+    # Krzyżowanie jednorodne (jak krzyzowanie_jednorodne) dla wszystkich par naraz.
+
+    maska = kontekst.rng.random(rodzice1.shape) < 0.5
+    maska &= czy_krzyzowac[:, None]
+
+    np.copyto(dzieci1, rodzice2, where=maska)
+    np.copyto(dzieci2, rodzice1, where=maska)
+
+def krzyzowanie_gpx_wektorowe(rodzice1, rodzice2, dzieci1, dzieci2, czy_krzyzowac, punkty_ciecia, kontekst):
+
+    # Krzyżowanie GPX (klasy_gpx) dla par wylosowanych do krzyżowania; pętla po parach,
+    # bo kolejne klasy zależą od poprzednich.
+
+    for para in np.flatnonzero(czy_krzyzowac).tolist():
+        rodzic1, rodzic2 = rodzice1[para].tolist(), rodzice2[para].tolist()
+        dzieci1[para] = klasy_gpx(rodzic1, rodzic2, kontekst.liczba_kolorow, kontekst.rng)
+        dzieci2[para] = klasy_gpx(rodzic2, rodzic1, kontekst.liczba_kolorow, kontekst.rng)
+
+def mutacja_losowa_wektorowa(populacja, p_mutacji, kontekst):
+
+    # Mutacja jak mutacja_wektorowa_w_miejscu.
+
+    mutacja_wektorowa_w_miejscu(populacja, p_mutacji, kontekst.liczba_kolorow, kontekst.rng)
+
+def mutacja_konfliktowa_wektorowa(populacja, p_mutacji, kontekst):
+
+    # Mutacja konfliktowa (jak mutacja_konfliktowa) dla całej populacji: pozycje losowane jak
+    # w mutacja_wektorowa_w_miejscu, każda przeniesiona na wierzchołek w konflikcie w swoim wierszu.
+
+    rng = kontekst.rng
+    rozmiar_populacji, liczba_wierzcholkow = populacja.shape
+    pozycje = pozycje_mutacji(populacja.size, p_mutacji, rng)
+    kolory = rng.integers(0, kontekst.liczba_kolorow, size=len(pozycje))
+    if len(pozycje) == 0:
+        return
+
+    # Maska wierzchołków w konflikcie; jej niezerowe kolumny, wiersz po wierszu, w jednej tablicy
+    rowne = konfliktowe_krawedzie(populacja, kontekst.krawedzie_u, kontekst.krawedzie_v, kontekst.bufory)
+    wiersze, krawedzie = np.nonzero(rowne)
+    w_konflikcie = np.zeros(populacja.shape, dtype=bool)
+    w_konflikcie[wiersze, kontekst.krawedzie_u[krawedzie]] = True
+    w_konflikcie[wiersze, kontekst.krawedzie_v[krawedzie]] = True
+    konfliktowe = np.nonzero(w_konflikcie)[1]
+    liczby = np.count_nonzero(w_konflikcie, axis=1)
+    poczatki = np.cumsum(liczby) - liczby
+
+    wiersz, kolumna = np.divmod(pozycje, liczba_wierzcholkow)
+    zostaja = liczby[wiersz] > 0
+    wiersz, kolumna, kolory = wiersz[zostaja], kolumna[zostaja], kolory[zostaja]
+    cele = konfliktowe[poczatki[wiersz] + kolumna * liczby[wiersz] // liczba_wierzcholkow]
+    populacja[wiersz, cele] = kolory
+
+# Rejestr: nazwa -> (operator silnika python, operator silnika numpy).
+# Nowy operator wystarczy dopisać tutaj i w NAZWY_KRZYZOWANIA / NAZWY_MUTACJI
+# w argumenty_main.py, skąd CLI bierze listę nazw.
+OPERATORY_KRZYZOWANIA = {
+    "jednopunktowe": (krzyzowanie_jednopunktowe, krzyzowanie_jednopunktowe_wektorowe),
+    "jednorodne": (krzyzowanie_jednorodne, krzyzowanie_jednorodne_wektorowe),
+    "gpx": (krzyzowanie_gpx, krzyzowanie_gpx_wektorowe)
+}
+OPERATORY_MUTACJI = {
+    "losowa": (mutacja_losowa, mutacja_losowa_wektorowa),
+    "konfliktowa": (mutacja_konfliktowa, mutacja_konfliktowa_wektorowa)
+}
+
+def wybierz_operatory(operator_krzyzowania, operator_mutacji, silnik):
+
+    # Funkcje (krzyżowanie, mutacja) z rejestru dla danego silnika; nieznana nazwa to ValueError.
+
+    if operator_krzyzowania not in OPERATORY_KRZYZOWANIA:
+        raise ValueError(f"Nieznany operator krzyżowania: {operator_krzyzowania}")
+    if operator_mutacji not in OPERATORY_MUTACJI:
+        raise ValueError(f"Nieznany operator mutacji: {operator_mutacji}")
+    wersja = 1 if silnik == "numpy" else 0
+    return OPERATORY_KRZYZOWANIA[operator_krzyzowania][wersja], OPERATORY_MUTACJI[operator_mutacji][wersja]
+
+# PAMIĘĆ PRZYSTOSOWANIA
+
+def klucz_osobnika(osobnik):
+
+    # Zwarta reprezentacja chromosomu do użycia jako klucz słownika (szybkie haszowanie bajtów).
+
+    if isinstance(osobnik, np.ndarray):
+        return osobnik.tobytes()
+    try:
+        return bytes(osobnik)
+    except ValueError:
+        # Kolory >= 256 nie mieszczą się w jednym bajcie
+        return array('I', osobnik).tobytes()
+
+class PamiecPrzystosowania:
+
+    # Pamięć podręczna liczby konfliktów z usuwaniem najdawniej używanych wpisów (LRU).
+    # Zlicza trafienia, chybienia i oceny pominięte dla niezmienionych kopii rodziców.
+
+    def __init__(self, pojemnosc=10000):
+        self.pojemnosc = pojemnosc
+        self.wpisy = OrderedDict()
+        self.trafienia = 0
+        self.chybienia = 0
+        self.pominiete = 0
+
+    def pobierz(self, klucz):
+        konflikty = self.wpisy.get(klucz)
+        if konflikty is None:
+            self.chybienia += 1
+            return None
+        self.trafienia += 1
+        self.wpisy.move_to_end(klucz)
+        return konflikty
+
+    def zapisz(self, klucz, konflikty):
+        self.wpisy[klucz] = konflikty
+        self.wpisy.move_to_end(klucz)
+        if len(self.wpisy) > self.pojemnosc:
+            self.wpisy.popitem(last=False)
+
+    def statystyki(self):
+        return {"trafienia": self.trafienia, "chybienia": self.chybienia, "pominiete": self.pominiete}
+
+def utworz_pamiec(pamiec_przystosowania):
+
+    # Przyjmuje pojemność (int) albo gotowy obiekt PamiecPrzystosowania; None wyłącza pamięć.
+
+    if pamiec_przystosowania is None or isinstance(pamiec_przystosowania, PamiecPrzystosowania):
+        return pamiec_przystosowania
+    return PamiecPrzystosowania(pamiec_przystosowania)
+
+def ocen_z_pamiecia(osobnik, rodzic, konflikty_rodzica, krawedzie, pamiec):
+
+    # Liczba konfliktów dziecka bez zbędnego przeglądania krawędzi (krawedzie to tablice (u, v)):
+    # niezmieniona kopia rodzica dziedziczy jego wynik, powtarzający się chromosom bierze wynik z pamięci.
+
+    if osobnik == rodzic:
+        pamiec.pominiete += 1
+        return konflikty_rodzica
+    klucz = klucz_osobnika(osobnik)
+    konflikty = pamiec.pobierz(klucz)
+    if konflikty is None:
+        konflikty = konflikty_osobnika(osobnik, *krawedzie)
+        pamiec.zapisz(klucz, konflikty)
+    return konflikty
+
+def oblicz_konflikty_z_pamiecia(populacja, rodzice, konflikty_rodzicow, krawedzie_u, krawedzie_v, pamiec):
+
+    # Wektorowy odpowiednik ocen_z_pamiecia dla silnika numpy.
+    # Tylko wiersze, których nie ma w pamięci, są oceniane (jedną operacją na wszystkich krawędziach).
+
+    konflikty = konflikty_rodzicow.copy()
+    zmienione = np.flatnonzero((populacja != rodzice).any(axis=1))
+    pamiec.pominiete += len(populacja) - len(zmienione)
+
+    do_oceny = []
+    klucze = []
+    for i in zmienione.tolist():
+        klucz = populacja[i].tobytes()
+        wynik = pamiec.pobierz(klucz)
+        if wynik is None:
+            do_oceny.append(i)
+            klucze.append(klucz)
+        else:
+            konflikty[i] = wynik
+
+    if do_oceny:
+        nowe = oblicz_konflikty_populacji(populacja[do_oceny], krawedzie_u, krawedzie_v)
+        konflikty[do_oceny] = nowe
+        for klucz, wynik in zip(klucze, nowe.tolist()):
+            pamiec.zapisz(klucz, wynik)
+    return konflikty
+
+# KRYTERIA STOPU
+
+KRYTERIA_STOPU = ("zero_konfliktow", "limit_czasu", "limit_ocen", "limit_stagnacji")
+
+def sprawdz_kryteria_stopu(kryteria_stopu, najlepsze_konflikty, czas_startu, liczba_ocen, generacje_bez_poprawy):
+
+    # Sprawdza warunki wcześniejszego zakończenia ewolucji.
+    # kryteria_stopu to słownik z kluczami z KRYTERIA_STOPU (brak klucza lub None = kryterium wyłączone).
+    # Zwraca nazwę spełnionego kryterium albo None.
+
+    if not kryteria_stopu:
+        return None
+    if kryteria_stopu.get("zero_konfliktow") and najlepsze_konflikty == 0:
+        return "zero_konfliktow"
+    limit_czasu = kryteria_stopu.get("limit_czasu")
+    if limit_czasu is not None and time.perf_counter() - czas_startu >= limit_czasu:
+        return "limit_czasu"
+    limit_ocen = kryteria_stopu.get("limit_ocen")
+    if limit_ocen is not None and liczba_ocen >= limit_ocen:
+        return "limit_ocen"
+    limit_stagnacji = kryteria_stopu.get("limit_stagnacji")
+    if limit_stagnacji is not None and generacje_bez_poprawy >= limit_stagnacji:
+        return "limit_stagnacji"
+    return None
+
+def sprawdz_poprawnosc_kryteriow(kryteria_stopu):
+
+    # Zgłasza błąd dla nieznanych kluczy, żeby literówka nie wyłączała kryterium po cichu.
+
+    nieznane = set(kryteria_stopu or {}) - set(KRYTERIA_STOPU)
+    if nieznane:
+        raise ValueError(f"Nieznane kryteria stopu: {', '.join(sorted(nieznane))}")
+
+def uzupelnij_historie(historia_postepow, liczba_generacji):
+
+    # Dopełnia historię przerwanego uruchomienia ostatnią wartością do pełnej liczby generacji,
+    # żeby uśrednianie historii wielu uruchomień dalej działało generacja po generacji.
+
+    if historia_postepow and len(historia_postepow) < liczba_generacji:
+        historia_postepow.extend([historia_postepow[-1]] * (liczba_generacji - len(historia_postepow)))
+    return historia_postepow
+
+# ADAPTACJA MUTACJI
+
+class AdaptacjaMutacji:
+
+    # Zmiana p_mutacji w trakcie uruchomienia na podstawie tempa poprawy (reguła 1/5 sukcesów).
+    # Co okno generacji liczony jest udział generacji, w których poprawił się najlepszy wynik:
+    # powyżej cel p_mutacji rośnie wspolczynnik razy (mutacja pomaga, można szukać szerzej),
+    # poniżej maleje, bo przy stagnacji mutacja zwykle niszczy dobre dzieci zamiast je poprawiać.
+    # Wartość zostaje w [minimum, maksimum].
+
+    def __init__(self, p_mutacji, okno=10, cel=0.2, wspolczynnik=1.5, minimum=0.001, maksimum=0.5):
+        self.okno = okno
+        self.cel = cel
+        self.wspolczynnik = wspolczynnik
+        self.minimum = minimum
+        self.maksimum = maksimum
+        self.p_mutacji = min(maksimum, max(minimum, p_mutacji))
+        self.poprawy = 0
+        self.generacje = 0
+
+    def aktualizuj(self, poprawa):
+        # Zapisuje, czy generacja poprawiła najlepszy wynik; zwraca p_mutacji dla następnego pokolenia
+        self.poprawy += bool(poprawa)
+        self.generacje += 1
+        if self.generacje == self.okno:
+            tempo = self.poprawy / self.okno
+            if tempo > self.cel:
+                self.p_mutacji = min(self.maksimum, self.p_mutacji * self.wspolczynnik)
+            elif tempo < self.cel:
+                self.p_mutacji = max(self.minimum, self.p_mutacji / self.wspolczynnik)
+            self.poprawy = self.generacje = 0
+        return self.p_mutacji
+
+    def stan(self):
+        # Stan do punktu kontrolnego
+        return (self.p_mutacji, self.poprawy, self.generacje)
+
+    def przywroc(self, stan):
+        self.p_mutacji, self.poprawy, self.generacje = stan
+
+# INSTRUMENTACJA
+
+# Fazy generacji, dla których mierzony jest czas
+FAZY = ("ocena", "selekcja", "krzyzowanie", "mutacja", "lokalne")
+
+def biezaca_pamiec_mb():
+
+    # Bieżące zużycie pamięci (RSS) procesu w MB.
+    # Na Linuksie z /proc, gdzie indziej szczytowe RSS z getrusage.
+
+    try:
+        with open("/proc/self/statm") as f:
+            strony = int(f.read().split()[1])
+        return strony * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+def raport_generacji(obserwator, generacja, konflikty, liczba_unikalnych, najlepsze_konflikty, liczba_ocen,
+                     czasy, czas_generacji, pamiec=None):
+
+    # Składa dane jednej generacji i przekazuje je obserwatorowi.
+    # konflikty i liczba_unikalnych opisują populację ocenioną w tej generacji.
+
+    rozmiar_populacji = len(konflikty)
+    dane = {
+        "generacja": generacja,
+        "najlepsze_konflikty": najlepsze_konflikty,
+        "najlepsze_w_populacji": int(min(konflikty)),
+        "srednie_konflikty": float(sum(konflikty)) / rozmiar_populacji,
+        "liczba_ocen": liczba_ocen,
+        "roznorodnosc": liczba_unikalnych / rozmiar_populacji,
+        "czas_generacji": czas_generacji,
+        "pamiec_mb": biezaca_pamiec_mb()
+    }
+    for faza in FAZY:
+        dane[f"czas_{faza}"] = czasy[faza]
+    if pamiec is not None:
+        for nazwa, wartosc in pamiec.statystyki().items():
+            dane[f"pamiec_{nazwa}"] = wartosc
+    obserwator(dane)
+
+class ObserwatorLogu:
+
+    # Wbudowany obserwator: zapisuje dane każdej generacji do pliku.
+    # Format wynika z rozszerzenia: .csv daje CSV, każde inne JSON lines (jeden obiekt na linię).
+
+    def __init__(self, sciezka, dopisz=False, **stale_pola):
+        # stale_pola (np. numer uruchomienia) są dopisywane do każdego wiersza.
+        # dopisz=True kontynuuje istniejący plik (wznowione uruchomienie) zamiast go nadpisywać.
+        self.sciezka = sciezka
+        self.stale_pola = stale_pola
+        self.csv = os.path.splitext(sciezka)[1].lower() == ".csv"
+        kontynuacja = dopisz and os.path.exists(sciezka) and os.path.getsize(sciezka) > 0
+        self.plik = open(sciezka, 'a' if kontynuacja else 'w', newline='' if self.csv else None)
+        self.zapis_csv = None
+        self.naglowek = not kontynuacja
+
+    def __call__(self, dane):
+        wiersz = {**self.stale_pola, **dane}
+        if not self.csv:
+            self.plik.write(json.dumps(wiersz) + "\n")
+            return
+        if self.zapis_csv is None:
+            self.zapis_csv = csv.DictWriter(self.plik, fieldnames=list(wiersz))
+            if self.naglowek:
+                self.zapis_csv.writeheader()
+        self.zapis_csv.writerow(wiersz)
+
+    def zamknij(self):
+        self.plik.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *wyjatek):
+        self.zamknij()
+
+# PUNKTY KONTROLNE
+
+def zapisz_atomowo(sciezka, obiekt, jako_json=False):
+
+    # Zapisuje obiekt (pickle, a z jako_json=True - JSON z wcięciami) do pliku tymczasowego
+    # i podmienia plik docelowy. Przerwanie procesu w trakcie zapisu zostawia poprzednią, kompletną wersję.
+
+    tymczasowy = sciezka + ".tmp"
+    with open(tymczasowy, 'w' if jako_json else 'wb') as f:
+        if jako_json:
+            json.dump(obiekt, f, indent=4)
+        else:
+            pickle.dump(obiekt, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tymczasowy, sciezka)
+
+def wczytaj_pickle(sciezka):
+
+    # Zwraca obiekt zapisany przez zapisz_atomowo albo None, gdy pliku nie ma.
+
+    if not os.path.exists(sciezka):
+        return None
+    with open(sciezka, 'rb') as f:
+        return pickle.load(f)
+
+def tablica_populacji(populacja, liczba_kolorow):
+
+    # Zwarta postać populacji do zapisu: jeden bajt na gen przy co najwyżej 256 kolorach.
+
+    typ = np.uint8 if liczba_kolorow <= 1 << 8 else np.uint16 if liczba_kolorow <= 1 << 16 else np.int32
+    return np.asarray(populacja, dtype=typ)
+
+class PunktKontrolny:
+
+    # Stan jednego uruchomienia GA zapisywany co interwal generacji do pliku sciezka.
+    # Zawiera populację, stan generatorów liczb losowych, najlepszego osobnika i historię,
+    # więc wznowione uruchomienie daje ten sam wynik co nieprzerwane.
+
+    def __init__(self, sciezka, interwal=10):
+        if interwal < 1:
+            raise ValueError("Interwał punktów kontrolnych musi być dodatni")
+        self.sciezka = sciezka
+        self.interwal = interwal
+
+    def czy_zapisac(self, generacja):
+        return (generacja + 1) % self.interwal == 0
+
+    def zapisz(self, stan):
+        zapisz_atomowo(self.sciezka, stan)
+
+    def wczytaj(self, silnik, liczba_wierzcholkow, liczba_kolorow, rozmiar_populacji):
+        # Zwraca zapisany stan albo None; stan z innej konfiguracji jest błędem, nie jest pomijany
+        stan = wczytaj_pickle(self.sciezka)
+        if stan is None:
+            return None
+        oczekiwane = (silnik, liczba_wierzcholkow, liczba_kolorow, rozmiar_populacji)
+        zapisane = (stan["silnik"], stan["populacja"].shape[1], stan["liczba_kolorow"], stan["populacja"].shape[0])
+        if zapisane != oczekiwane:
+            raise ValueError(f"Punkt kontrolny {self.sciezka} dotyczy innego uruchomienia")
+        return stan
+
+    def usun(self):
+        if os.path.exists(self.sciezka):
+            os.remove(self.sciezka)
+
 # GŁÓWNA FUNKCJA URUCHOMIENIOWA
 
-def uruchom_ga(graf, liczba_kolorow, rozmiar_populacji, liczba_generacji, p_krzyzowania, p_mutacji, rozmiar_turnieju):
+def stworz_nowa_populacje(populacja, konflikty, przystosowania, rozmiar_populacji, liczba_kolorow,
+                          p_krzyzowania, p_mutacji, rozmiar_turnieju, krawedzie, indeks=None, czasy=None,
+                          pamiec=None, bufor=None, rng=None, operatory=None):
+
+    # Tworzy kolejne pokolenie: selekcja, krzyżowanie i mutacja.
+    # Wszystkie losowania generacji są wykonywane blokowo (wylosuj_pokolenie) generatorem rng
+    # (numpy.random.Generator; bez niego tworzony z ziarna z modułu random), więc pętla w Pythonie
+    # przechodzi tylko po parach i wylosowanych mutacjach, nie po wszystkich genach.
+    # Z indeksem sąsiedztwa (offsety, sasiedzi) konflikty dzieci liczone są przyrostowo,
+    # bez niego każde dziecko jest oceniane na wszystkich krawędziach (krawedzie: tablice_krawedzi).
+    # Podany słownik czasy (klucze z FAZY) jest powiększany o czas każdej fazy; czas losowania wchodzi
+    # w czas selekcji, a przy ocenie przyrostowej jej koszt w czas krzyżowania i mutacji.
+    # pamiec (PamiecPrzystosowania) skraca pełną ocenę dla kopii rodziców i powtarzających się chromosomów.
+    # bufor (stworz_bufor_populacji, rozmiar_populacji zaokrąglony w górę do parzystego) to chromosomy,
+    # do których operatory zapisują dzieci w miejscu; nie może zawierać osobników z populacja.
+    # operatory (krzyżowanie, mutacja, KontekstOperatorow) to wersje z rejestru dla silnika python;
+    # bez nich krzyżowanie jest jednopunktowe, a mutacja losowa.
+    # Zwraca (nowa_populacja, nowe_konflikty).
+
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    if operatory is None:
+        operatory = (krzyzowanie_jednopunktowe, mutacja_losowa, KontekstOperatorow(liczba_kolorow, rng, indeks))
+    krzyzuj, mutuj, kontekst = operatory
+    zegar = time.perf_counter if czasy is not None else None
+    liczba_wierzcholkow = len(populacja[0])
+    liczba_par = (rozmiar_populacji + 1) // 2
+
+    if zegar:
+        t0 = zegar()
+
+    # 5. Selekcja (i pozostałe losowania generacji)
+    indeksy_rodzicow, punkty_ciecia, granice, pozycje, kolory = wylosuj_pokolenie(
+        przystosowania, liczba_par, liczba_wierzcholkow, p_krzyzowania, p_mutacji, liczba_kolorow,
+        rozmiar_turnieju, rng)
+
+    if zegar:
+        czasy["selekcja"] += zegar() - t0
+
+    nowa_populacja = []
+    nowe_konflikty = []
+    for para in range(liczba_par):
+
+        if zegar:
+            t1 = zegar()
+
+        indeks1, indeks2 = indeksy_rodzicow[2 * para], indeksy_rodzicow[2 * para + 1]
+        rodzic1, rodzic2 = populacja[indeks1], populacja[indeks2]
+        punkt_ciecia = punkty_ciecia[para]
+
+        # 6. Krzyżowanie (dzieci zaczynają jako kopie rodziców)
+        if bufor is not None:
+            dziecko1, dziecko2 = bufor[2 * para], bufor[2 * para + 1]
+            dziecko1[:] = rodzic1
+            dziecko2[:] = rodzic2
+        else:
+            dziecko1, dziecko2 = list(rodzic1), list(rodzic2)
+
+        konflikty1, konflikty2 = konflikty[indeks1], konflikty[indeks2]
+        if punkt_ciecia:
+            konflikty1, konflikty2 = krzyzuj(rodzic1, rodzic2, konflikty1, konflikty2, dziecko1, dziecko2,
+                                             punkt_ciecia, kontekst)
+
+        if zegar:
+            t2 = zegar()
+            czasy["krzyzowanie"] += t2 - t1
+
+        # 7. Mutacja
+        od1, od2, do2 = granice[2 * para], granice[2 * para + 1], granice[2 * para + 2]
+        konflikty1 = mutuj(dziecko1, konflikty1, pozycje[od1:od2], kolory[od1:od2], kontekst)
+        konflikty2 = mutuj(dziecko2, konflikty2, pozycje[od2:do2], kolory[od2:do2], kontekst)
+
+        if zegar:
+            t3 = zegar()
+            czasy["mutacja"] += t3 - t2
+
+        if indeks is None:
+            if pamiec is not None:
+                konflikty1 = ocen_z_pamiecia(dziecko1, rodzic1, konflikty[indeks1], krawedzie, pamiec)
+                konflikty2 = ocen_z_pamiecia(dziecko2, rodzic2, konflikty[indeks2], krawedzie, pamiec)
+            else:
+                konflikty1 = konflikty_osobnika(dziecko1, *krawedzie)
+                konflikty2 = konflikty_osobnika(dziecko2, *krawedzie)
+            if zegar:
+                czasy["ocena"] += zegar() - t3
+
+        nowa_populacja.append(dziecko1)
+        nowe_konflikty.append(konflikty1)
+        if len(nowa_populacja) < rozmiar_populacji:
+            nowa_populacja.append(dziecko2)
+            nowe_konflikty.append(konflikty2)
+
+    return nowa_populacja, nowe_konflikty
+
+def sprawdz_populacje_poczatkowa(populacja, rozmiar_populacji, liczba_wierzcholkow, liczba_kolorow):
+
+    # Zwraca populację startową jako tablicę (rozmiar_populacji, liczba_wierzcholkow);
+    # zły kształt albo kolor spoza 0..liczba_kolorow-1 to ValueError.
+
+    populacja = np.asarray(populacja, dtype=np.int64)
+    if populacja.shape != (rozmiar_populacji, liczba_wierzcholkow):
+        raise ValueError(f"Populacja początkowa ma kształt {populacja.shape} zamiast "
+                         f"{(rozmiar_populacji, liczba_wierzcholkow)}")
+    if populacja.size and (populacja.min() < 0 or populacja.max() >= liczba_kolorow):
+        raise ValueError(f"Populacja początkowa zawiera kolory spoza zakresu 0..{liczba_kolorow - 1}")
+    return populacja
+
+def uruchom_ga(graf, liczba_kolorow, rozmiar_populacji, liczba_generacji, p_krzyzowania, p_mutacji, rozmiar_turnieju,
+               silnik="python", ocena_przyrostowa=True, kryteria_stopu=None, obserwator=None,
+               pamiec_przystosowania=None, punkt_kontrolny=None, w_miejscu=True, rng=None,
+               kroki_lokalne=0, udzial_lokalny=0.1, operator_krzyzowania="jednopunktowe", operator_mutacji="losowa",
+               populacja_poczatkowa=None, adaptacja_mutacji=False):
 
     # Główna pętla algorytmu genetycznego.
+    # silnik="numpy" trzyma populację w jednej tablicy i wykonuje operatory wektorowo.
+    # ocena_przyrostowa=True liczy konflikty dzieci z różnic względem rodziców (indeks CSR grafu)
+    # zamiast przeglądać wszystkie krawędzie dla każdego osobnika.
+    # kryteria_stopu (zob. sprawdz_kryteria_stopu) pozwalają zakończyć ewolucję wcześniej;
+    # historia jest wtedy dopełniana do liczba_generacji ostatnim wynikiem.
+    # obserwator (wywoływalny, np. ObserwatorLogu) dostaje po każdej generacji słownik z czasami faz,
+    # liczbą ocen, różnorodnością populacji i zużyciem pamięci; bez niego nic nie jest mierzone.
+    # pamiec_przystosowania (pojemność albo PamiecPrzystosowania) zapamiętuje oceny chromosomów;
+    # działa przy pełnej ocenie (ocena_przyrostowa=False) i w silniku numpy.
+    # punkt_kontrolny (PunktKontrolny) zapisuje stan co kilka generacji; jeśli zawiera już stan,
+    # ewolucja jest wznawiana od zapisanej generacji.
+    # w_miejscu=True trzyma chromosomy w zwartych tablicach (array 'B'/'H') i zapisuje dzieci
+    # do drugiego, wcześniej przydzielonego bufora populacji, zamienianego z bieżącym co generację.
+    # rng (numpy.random.Generator) to generator liczb losowych tego uruchomienia; bez niego jest tworzony
+    # z ziarna wylosowanego modułem random, więc random.seed() dalej ustala przebieg obu silników.
+    # kroki_lokalne > 0 włącza tryb memetyczny: w każdej generacji udzial_lokalny najlepszych osobników
+    # przechodzi do kroki_lokalne ruchów przeszukiwania lokalnego (przeszukiwanie_lokalne.popraw_lokalnie).
+    # operator_krzyzowania i operator_mutacji to nazwy z OPERATORY_KRZYZOWANIA i OPERATORY_MUTACJI.
+    # populacja_poczatkowa (rozmiar_populacji chromosomów) zastępuje losową populację startową,
+    # np. kolorowania wyprowadzone z rozwiązania dla większej liczby kolorów.
+    # adaptacja_mutacji=True traktuje p_mutacji jako wartość startową i zmienia ją co kilka generacji
+    # według tempa poprawy najlepszego wyniku (AdaptacjaMutacji).
+
+    sprawdz_poprawnosc_kryteriow(kryteria_stopu)
+    pamiec = utworz_pamiec(pamiec_przystosowania)
+    if silnik not in ("python", "numpy"):
+        raise ValueError(f"Nieznany silnik: {silnik}")
+    krzyzuj, mutuj = wybierz_operatory(operator_krzyzowania, operator_mutacji, silnik)
+    if populacja_poczatkowa is not None:
+        populacja_poczatkowa = sprawdz_populacje_poczatkowa(populacja_poczatkowa, rozmiar_populacji,
+                                                           graf["liczba_wierzcholkow"], liczba_kolorow)
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    if silnik == "numpy":
+        return uruchom_ga_numpy(graf, liczba_kolorow, rozmiar_populacji, liczba_generacji,
+                                p_krzyzowania, p_mutacji, rozmiar_turnieju, kryteria_stopu, obserwator, pamiec,
+                                punkt_kontrolny, w_miejscu, rng, kroki_lokalne, udzial_lokalny, krzyzuj, mutuj,
+                                populacja_poczatkowa, adaptacja_mutacji)
+
+    czas_startu = time.perf_counter()
 
     liczba_wierzcholkow = graf["liczba_wierzcholkow"]
-    krawedzie = graf["krawedzie"]
+    krawedzie = tablice_krawedzi(graf)
+    indeks = indeks_sasiedztwa(graf) if ocena_przyrostowa else None
+    if indeks is not None:
+        # Ocena przyrostowa i tak nie przegląda krawędzi dla kopii, pamięć nic by nie dała
+        pamiec = None
+    if kroki_lokalne > 0:
+        offsety, sasiedzi = indeks if indeks is not None else indeks_sasiedztwa(graf)
+    operatory = (krzyzuj, mutuj, KontekstOperatorow(liczba_kolorow, rng, indeks, krawedzie))
+    adaptacja = AdaptacjaMutacji(p_mutacji) if adaptacja_mutacji else None
     
-    # Lista do śledzenia najlepszego wyniku w każdej generacji
-    historia_postepow = []
+    stan = None
+    if punkt_kontrolny is not None:
+        stan = punkt_kontrolny.wczytaj("python", liczba_wierzcholkow, liczba_kolorow, rozmiar_populacji)
+    
+    if stan is None:
+        # Lista do śledzenia najlepszego wyniku w każdej generacji
+        historia_postepow = []
+        
+        # 1. Inicjalizacja
+        if populacja_poczatkowa is None:
+            populacja_poczatkowa = rng.integers(0, liczba_kolorow, size=(rozmiar_populacji, liczba_wierzcholkow))
+        konflikty = oblicz_konflikty_populacji(populacja_poczatkowa, *krawedzie).tolist()
+        populacja = populacja_poczatkowa.tolist()
+        if w_miejscu:
+            populacja = [array(typ_genu(liczba_kolorow), osobnik) for osobnik in populacja]
+        liczba_ocen = rozmiar_populacji
+        
+        najlepszy_osobnik_globalnie = None
+        najlepsze_przystosowanie_globalnie = -1.0
+        generacje_bez_poprawy = 0
+        pierwsza_generacja = 0
+    else:
+        # Wznowienie: populacja i generator losowy dokładnie w stanie z chwili zapisu
+        historia_postepow = stan["historia"].tolist()
+        populacja = stan["populacja"].tolist()
+        if w_miejscu:
+            populacja = [array(typ_genu(liczba_kolorow), osobnik) for osobnik in populacja]
+        konflikty = stan["konflikty"].tolist()
+        liczba_ocen = stan["liczba_ocen"]
+        najlepszy_osobnik_globalnie = stan["najlepszy"].tolist()
+        najlepsze_przystosowanie_globalnie = stan["najlepsze_przystosowanie"]
+        generacje_bez_poprawy = stan["generacje_bez_poprawy"]
+        pierwsza_generacja = stan["generacja"]
+        rng.bit_generator.state = stan["rng"]
+        random.setstate(stan["random"])
+        czas_startu -= stan["czas"]
+        if adaptacja is not None and stan.get("adaptacja") is not None:
+            adaptacja.przywroc(stan["adaptacja"])
+            p_mutacji = adaptacja.p_mutacji
     
-    # 1. Inicjalizacja
-    populacja = [stworz_osobnika(liczba_wierzcholkow, liczba_kolorow) for _ in range(rozmiar_populacji)]
+    czasy = None
     
-    najlepszy_osobnik_globalnie = None
-    najlepsze_przystosowanie_globalnie = -1.0
+    # Drugi bufor (z miejscem na nadmiarowe dziecko ostatniej pary) na kolejne pokolenie
+    bufor = None
+    if w_miejscu:
+        bufor = stworz_bufor_populacji(rozmiar_populacji + rozmiar_populacji % 2, liczba_wierzcholkow,
+                                       liczba_kolorow)
     
     # 2. Pętla ewolucji
-    for generacja in range(liczba_generacji):
+    for generacja in range(pierwsza_generacja, liczba_generacji):
         
-        # 3. Ocena
-        przystosowania = [oblicz_przystosowanie(osobnik, krawedzie) for osobnik in populacja]
+        if obserwator is not None:
+            start_generacji = time.perf_counter()
+            czasy = dict.fromkeys(FAZY, 0.0)
+        
+        # Tryb memetyczny: przeszukiwanie lokalne najlepszych osobników przed selekcją
+        if kroki_lokalne > 0:
+            popraw_populacje(populacja, konflikty, liczba_kolorow, offsety, sasiedzi, kroki_lokalne,
+                             udzial_lokalny, rng)
+            if czasy is not None:
+                czasy["lokalne"] = time.perf_counter() - start_generacji
+        
+        # 3. Ocena (konflikty są już znane z poprzedniej generacji)
+        przystosowania = [1.0 / (1.0 + k) for k in konflikty]
         
         aktualne_najlepsze_przystosowanie_w_populacji = max(przystosowania)
         
@@ -129,79 +1215,718 @@ def uruchom_ga(graf, liczba_kolorow, rozmiar_populacji, liczba_generacji, p_krzy
             
             indeks_najlepszego = przystosowania.index(najlepsze_przystosowanie_globalnie)
             najlepszy_osobnik_globalnie = list(populacja[indeks_najlepszego])
+            generacje_bez_poprawy = 0
+        else:
+            generacje_bez_poprawy += 1
+        if adaptacja is not None:
+            p_mutacji = adaptacja.aktualizuj(generacje_bez_poprawy == 0)
             
         # Zapisywanie najlepszego wyniku do tej pory
         aktualne_konflikty = (1.0 / najlepsze_przystosowanie_globalnie) - 1.0
         historia_postepow.append(int(round(aktualne_konflikty)))
             
-        # Break zakomentowany na potrzeby prezentacji wyników
-        # if najlepsze_przystosowanie_globalnie == 1.0:
-        #     break
-        
-        # 4. Tworzenie nowej populacji
-        nowa_populacja = []
-        while len(nowa_populacja) < rozmiar_populacji:
-            
-            # 5. Selekcja
-            rodzic1 = selekcja_turniejowa(populacja, przystosowania, rozmiar_turnieju)
-            rodzic2 = selekcja_turniejowa(populacja, przystosowania, rozmiar_turnieju)
-            
-            # 6. Krzyżowanie
-            dziecko1, dziecko2 = krzyzowanie(rodzic1, rodzic2, p_krzyzowania)
+        if czasy is not None:
+            czasy["ocena"] += time.perf_counter() - start_generacji - czasy["lokalne"]
+            oceniona_populacja, ocenione_konflikty, oceny_do_teraz = populacja, konflikty, liczba_ocen
             
-            # 7. Mutacja
-            dziecko1 = mutacja(dziecko1, p_mutacji, liczba_kolorow)
-            dziecko2 = mutacja(dziecko2, p_mutacji, liczba_kolorow)
+        # Wcześniejsze zakończenie (domyślnie wyłączone, żeby wykresy obejmowały wszystkie generacje)
+        zatrzymaj = sprawdz_kryteria_stopu(kryteria_stopu, historia_postepow[-1], czas_startu,
+                                           liczba_ocen, generacje_bez_poprawy)
+        
+        if not zatrzymaj:
+            # 4. Tworzenie nowej populacji
+            nowa_populacja, nowe_konflikty = stworz_nowa_populacje(
+                populacja, konflikty, przystosowania, rozmiar_populacji, liczba_kolorow,
+                p_krzyzowania, p_mutacji, rozmiar_turnieju, krawedzie, indeks, czasy, pamiec, bufor, rng,
+                operatory)
+                    
+            # Zastąpienie starej populacji nową; jej chromosomy przyjmą następne pokolenie
+            if bufor is not None:
+                bufor = populacja + bufor[rozmiar_populacji:]
+            populacja = nowa_populacja
+            konflikty = nowe_konflikty
+            liczba_ocen += rozmiar_populacji
             
-            nowa_populacja.append(dziecko1)
-            if len(nowa_populacja) < rozmiar_populacji:
-                nowa_populacja.append(dziecko2)
-                
-        # Zastąpienie starej populacji nową
-        populacja = nowa_populacja
+            if punkt_kontrolny is not None and punkt_kontrolny.czy_zapisac(generacja):
+                punkt_kontrolny.zapisz({
+                    "silnik": "python",
+                    "liczba_kolorow": liczba_kolorow,
+                    "generacja": generacja + 1,
+                    "populacja": tablica_populacji(populacja, liczba_kolorow),
+                    "konflikty": np.asarray(konflikty, dtype=np.int64),
+                    "najlepszy": tablica_populacji(najlepszy_osobnik_globalnie, liczba_kolorow),
+                    "najlepsze_przystosowanie": najlepsze_przystosowanie_globalnie,
+                    "generacje_bez_poprawy": generacje_bez_poprawy,
+                    "liczba_ocen": liczba_ocen,
+                    "historia": np.asarray(historia_postepow, dtype=np.int64),
+                    "rng": rng.bit_generator.state,
+                    "random": random.getstate(),
+                    "czas": time.perf_counter() - czas_startu,
+                    "adaptacja": adaptacja.stan() if adaptacja is not None else None
+                })
+        
+        if obserwator is not None:
+            raport_generacji(obserwator, generacja, ocenione_konflikty, len(set(map(tuple, oceniona_populacja))),
+                             historia_postepow[-1], oceny_do_teraz, czasy, time.perf_counter() - start_generacji,
+                             pamiec)
         
+        if zatrzymaj:
+            break
+        
+    uzupelnij_historie(historia_postepow, liczba_generacji)
     finalne_konflikty = historia_postepow[-1]
     
     return najlepszy_osobnik_globalnie, finalne_konflikty, historia_postepow
 
+def uruchom_ga_numpy(graf, liczba_kolorow, rozmiar_populacji, liczba_generacji, p_krzyzowania, p_mutacji, rozmiar_turnieju,
+                     kryteria_stopu=None, obserwator=None, pamiec=None, punkt_kontrolny=None, w_miejscu=True,
+                     rng=None, kroki_lokalne=0, udzial_lokalny=0.1,
+                     krzyzuj=krzyzowanie_jednopunktowe_wektorowe, mutuj=mutacja_losowa_wektorowa,
+                     populacja_poczatkowa=None, adaptacja_mutacji=False):
+
+    # Wersja pętli ewolucji na tablicach NumPy.
+    # w_miejscu=True używa BuforyPopulacji: bez nowych tablic w pętli, geny w uint8/uint16.
+    # kroki_lokalne i udzial_lokalny jak w uruchom_ga (tryb memetyczny).
+    # krzyzuj i mutuj to operatory silnika numpy z rejestru (wybierz_operatory).
+    # populacja_poczatkowa (tablica z sprawdz_populacje_poczatkowa) zastępuje losową populację startową.
+    # adaptacja_mutacji jak w uruchom_ga.
+    # Zwraca wyniki w tym samym formacie co uruchom_ga.
+
+    czas_startu = time.perf_counter()
+
+    liczba_wierzcholkow = graf["liczba_wierzcholkow"]
+    krawedzie_u, krawedzie_v = tablice_krawedzi(graf)
+    if kroki_lokalne > 0:
+        offsety, sasiedzi = indeks_sasiedztwa(graf)
+
+    # Bez podanego generatora ziarno pochodzi z modułu random, żeby random.seed() działał dla obu silników
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    adaptacja = AdaptacjaMutacji(p_mutacji) if adaptacja_mutacji else None
+
+    stan = None
+    if punkt_kontrolny is not None:
+        stan = punkt_kontrolny.wczytaj("numpy", liczba_wierzcholkow, liczba_kolorow, rozmiar_populacji)
+
+    if stan is None:
+        historia_postepow = []
+
+        # 1. Inicjalizacja
+        if populacja_poczatkowa is not None:
+            populacja = populacja_poczatkowa.astype(np.int32)
+        else:
+            populacja = rng.integers(0, liczba_kolorow, size=(rozmiar_populacji, liczba_wierzcholkow),
+                                     dtype=np.int32)
+
+        najlepszy_osobnik_globalnie = None
+        najlepsze_konflikty_globalnie = None
+        generacje_bez_poprawy = 0
+        liczba_ocen = 0
+        pierwsza_generacja = 0
+    else:
+        # Wznowienie; populacja zapisana przed oceną, więc pierwsza generacja ocenia ją w całości
+        historia_postepow = stan["historia"].tolist()
+        populacja = stan["populacja"].astype(np.int32)
+        najlepszy_osobnik_globalnie = stan["najlepszy"].tolist()
+        najlepsze_konflikty_globalnie = stan["najlepsze_konflikty"]
+        generacje_bez_poprawy = stan["generacje_bez_poprawy"]
+        liczba_ocen = stan["liczba_ocen"]
+        pierwsza_generacja = stan["generacja"]
+        rng.bit_generator.state = stan["rng"]
+        random.setstate(stan["random"])
+        czas_startu -= stan["czas"]
+        if adaptacja is not None and stan.get("adaptacja") is not None:
+            adaptacja.przywroc(stan["adaptacja"])
+            p_mutacji = adaptacja.p_mutacji
+
+    liczba_par = (rozmiar_populacji + 1) // 2
+
+    bufory = None
+    if w_miejscu:
+        bufory = BuforyPopulacji(rozmiar_populacji, liczba_wierzcholkow, len(krawedzie_u), liczba_kolorow)
+        np.copyto(bufory.populacje[0][:rozmiar_populacji], populacja, casting='unsafe')
+        populacja = bufory.populacje[0][:rozmiar_populacji]
+    kontekst = KontekstOperatorow(liczba_kolorow, rng, krawedzie=(krawedzie_u, krawedzie_v), bufory=bufory)
+
+    # Pomiar czasu faz tylko z obserwatorem
+    zegar = time.perf_counter if obserwator is not None else None
+
+    # 2. Pętla ewolucji
+    for generacja in range(pierwsza_generacja, liczba_generacji):
+
+        if zegar:
+            start_generacji = zegar()
+            czasy = dict.fromkeys(FAZY, 0.0)
+
+        # 3. Ocena
+        if pamiec is not None and generacja > pierwsza_generacja:
+            # Dzieci porównywane z rodzicem, od którego pochodzi ich początek
+            konflikty = oblicz_konflikty_z_pamiecia(populacja, poprzednia_populacja[indeksy_rodzicow_dzieci],
+                                                    konflikty[indeksy_rodzicow_dzieci], krawedzie_u, krawedzie_v,
+                                                    pamiec)
+        else:
+            konflikty = oblicz_konflikty_populacji(populacja, krawedzie_u, krawedzie_v, bufory)
+        liczba_ocen += rozmiar_populacji
+
+        # Tryb memetyczny: przeszukiwanie lokalne najlepszych osobników przed selekcją
+        if kroki_lokalne > 0:
+            if zegar:
+                t_lokalne = zegar()
+            popraw_populacje(populacja, konflikty, liczba_kolorow, offsety, sasiedzi, kroki_lokalne,
+                             udzial_lokalny, rng)
+            if zegar:
+                czasy["lokalne"] = zegar() - t_lokalne
+
+        przystosowania = 1.0 / (1.0 + konflikty)
+
+        indeks_najlepszego = int(np.argmin(konflikty))
+        if najlepsze_konflikty_globalnie is None or konflikty[indeks_najlepszego] < najlepsze_konflikty_globalnie:
+            najlepsze_konflikty_globalnie = int(konflikty[indeks_najlepszego])
+            najlepszy_osobnik_globalnie = populacja[indeks_najlepszego].tolist()
+            generacje_bez_poprawy = 0
+        else:
+            generacje_bez_poprawy += 1
+        if adaptacja is not None:
+            p_mutacji = adaptacja.aktualizuj(generacje_bez_poprawy == 0)
+
+        historia_postepow.append(najlepsze_konflikty_globalnie)
+
+        if zegar:
+            czasy["ocena"] = zegar() - start_generacji - czasy["lokalne"]
+            liczba_unikalnych = len(np.unique(populacja, axis=0))
+            raport = (generacja, konflikty.tolist(), liczba_unikalnych, najlepsze_konflikty_globalnie, liczba_ocen)
+
+        zatrzymaj = sprawdz_kryteria_stopu(kryteria_stopu, najlepsze_konflikty_globalnie, czas_startu,
+                                           liczba_ocen, generacje_bez_poprawy)
+
+        if not zatrzymaj:
+            if zegar:
+                t0 = zegar()
+
+            # 4-5. Selekcja wszystkich rodziców naraz
+            indeksy_rodzicow = selekcja_turniejowa_wektorowa(przystosowania, 2 * liczba_par, rozmiar_turnieju, rng)
+
+            if zegar:
+                t1 = zegar()
+                czasy["selekcja"] = t1 - t0
+
+            # 6. Krzyżowanie; dzieci z pary trafiają do kolejnych wierszy, nadmiarowe jest pomijane
+            if bufory is not None:
+                rodzice1, rodzice2 = bufory.rodzice1, bufory.rodzice2
+                np.take(populacja, indeksy_rodzicow[0::2], axis=0, out=rodzice1)
+                np.take(populacja, indeksy_rodzicow[1::2], axis=0, out=rodzice2)
+                dzieci = bufory.populacje[1]
+            else:
+                rodzice1 = populacja[indeksy_rodzicow[0::2]]
+                rodzice2 = populacja[indeksy_rodzicow[1::2]]
+                dzieci = np.empty((2 * liczba_par, liczba_wierzcholkow), dtype=populacja.dtype)
+            dzieci1, dzieci2 = dzieci[0::2], dzieci[1::2]
+            np.copyto(dzieci1, rodzice1)
+            np.copyto(dzieci2, rodzice2)
+            if liczba_wierzcholkow > 1:
+                czy_krzyzowac = rng.random(liczba_par) < p_krzyzowania
+                punkty_ciecia = rng.integers(1, liczba_wierzcholkow, size=liczba_par)
+                krzyzuj(rodzice1, rodzice2, dzieci1, dzieci2, czy_krzyzowac, punkty_ciecia, kontekst)
+            nowa_populacja = dzieci[:rozmiar_populacji]
+
+            if zegar:
+                t2 = zegar()
+                czasy["krzyzowanie"] = t2 - t1
+
+            # 7. Mutacja
+            if pamiec is not None:
+                poprzednia_populacja = populacja
+                indeksy_rodzicow_dzieci = indeksy_rodzicow[:rozmiar_populacji]
+            mutuj(nowa_populacja, p_mutacji, kontekst)
+            if bufory is not None:
+                bufory.zamien()
+            populacja = nowa_populacja
+
+            if zegar:
+                czasy["mutacja"] = zegar() - t2
+
+            if punkt_kontrolny is not None and punkt_kontrolny.czy_zapisac(generacja):
+                punkt_kontrolny.zapisz({
+                    "silnik": "numpy",
+                    "liczba_kolorow": liczba_kolorow,
+                    "generacja": generacja + 1,
+                    "populacja": tablica_populacji(populacja, liczba_kolorow),
+                    "najlepszy": tablica_populacji(najlepszy_osobnik_globalnie, liczba_kolorow),
+                    "najlepsze_konflikty": najlepsze_konflikty_globalnie,
+                    "generacje_bez_poprawy": generacje_bez_poprawy,
+                    "liczba_ocen": liczba_ocen,
+                    "historia": np.asarray(historia_postepow, dtype=np.int64),
+                    "rng": rng.bit_generator.state,
+                    "random": random.getstate(),
+                    "czas": time.perf_counter() - czas_startu,
+                    "adaptacja": adaptacja.stan() if adaptacja is not None else None
+                })
+
+        if zegar:
+            raport_generacji(obserwator, *raport, czasy, zegar() - start_generacji, pamiec)
+
+        if zatrzymaj:
+            break
+
+    uzupelnij_historie(historia_postepow, liczba_generacji)
+    finalne_konflikty = historia_postepow[-1]
+
+    return najlepszy_osobnik_globalnie, finalne_konflikty, historia_postepow
+
+# AGREGACJA HISTORII
+
+class AgregatHistorii:
+
+    # Statystyki historii zbieżności wielu uruchomień liczone w locie, generacja po generacji.
+    # Sumy są całkowite (int64), więc wynik nie zależy od kolejności dodawania uruchomień,
+    # a pamięć nie rośnie z liczbą uruchomień.
+
+    def __init__(self, liczba_generacji):
+        self.liczba = 0
+        self.suma = np.zeros(liczba_generacji, dtype=np.int64)
+        self.suma_kwadratow = np.zeros(liczba_generacji, dtype=np.int64)
+        self.minimum = np.full(liczba_generacji, np.iinfo(np.int64).max, dtype=np.int64)
+        self.maksimum = np.full(liczba_generacji, np.iinfo(np.int64).min, dtype=np.int64)
+
+    def dodaj(self, historia):
+        # historia musi obejmować wszystkie generacje (zob. uzupelnij_historie)
+        wartosci = np.asarray(historia, dtype=np.int64)
+        self.liczba += 1
+        self.suma += wartosci
+        self.suma_kwadratow += wartosci * wartosci
+        np.minimum(self.minimum, wartosci, out=self.minimum)
+        np.maximum(self.maksimum, wartosci, out=self.maksimum)
+
+    def srednia(self):
+        return self.suma / self.liczba
+
+    def wariancja(self):
+        # Wariancja populacyjna; liczona z sum całkowitych bez utraty precyzji
+        return (self.liczba * self.suma_kwadratow - self.suma * self.suma) / (self.liczba * self.liczba)
+
+# Powyżej tylu generacji plik wyników zawiera historię wielorozdzielczą (historia_zbieznosci.py)
+# zamiast list z wartością dla każdej generacji; pełne historie zapisuje --zapis-historii
+PROG_PELNEJ_HISTORII = 10000
+
+# Plik historii: nagłówek (magia, wersja, liczba generacji), potem wiersze int32
+# [zestaw, uruchomienie, konflikty w generacji 0, 1, ...]
+NAGLOWEK_HISTORII = struct.Struct("<4sII")
+MAGIA_HISTORII = b"HIST"
+WERSJA_HISTORII = 1
+
+class ZapisHistorii:
+
+    # Dopisuje pełne historie kolejnych uruchomień do pliku binarnego zamiast trzymać je w pamięci.
+
+    def __init__(self, sciezka, liczba_generacji):
+        self.liczba_generacji = liczba_generacji
+        self.plik = open(sciezka, 'wb')
+        self.plik.write(NAGLOWEK_HISTORII.pack(MAGIA_HISTORII, WERSJA_HISTORII, liczba_generacji))
+
+    def dopisz(self, zestaw, uruchomienie, historia):
+        wiersz = np.empty(2 + self.liczba_generacji, dtype=np.int32)
+        wiersz[0], wiersz[1] = zestaw, uruchomienie
+        wiersz[2:] = historia
+        self.plik.write(wiersz.tobytes())
+
+    def zamknij(self):
+        self.plik.close()
+
+def wczytaj_historie(sciezka):
+
+    # Zwraca tablicę (uruchomienia, 2 + liczba_generacji) mapowaną z pliku zapisanego przez ZapisHistorii.
+
+    with open(sciezka, 'rb') as f:
+        magia, wersja, liczba_generacji = NAGLOWEK_HISTORII.unpack(f.read(NAGLOWEK_HISTORII.size))
+    if magia != MAGIA_HISTORII or wersja != WERSJA_HISTORII:
+        raise ValueError(f"{sciezka} nie jest plikiem historii w wersji {WERSJA_HISTORII}")
+    wiersze = np.memmap(sciezka, dtype=np.int32, mode='r', offset=NAGLOWEK_HISTORII.size)
+    return wiersze.reshape(-1, 2 + liczba_generacji)
+
+# EKSPERYMENT (WIELE URUCHOMIEŃ)
+
+# Grafy ustawiane raz w każdym procesie roboczym (zamiast wysyłania ich z każdym zadaniem);
+# zadanie wskazuje swój graf kluczem zadanie["graf"]
+_GRAFY_PROCESU = {}
+
+# Opis eksperymentu w katalogu punktów kontrolnych
+PLIK_OPISU_PUNKTOW = "eksperyment.json"
+
+def ziarno_uruchomienia(ziarno_bazowe, indeks_zestawu, numer_uruchomienia):
+
+    # Deterministyczne ziarno dla pary (zestaw parametrów, uruchomienie).
+    # Nie zależy od kolejności wykonania, więc tryb równoległy daje te same wyniki co szeregowy.
+
+    return int(np.random.SeedSequence([ziarno_bazowe, indeks_zestawu, numer_uruchomienia]).generate_state(1)[0])
+
+def skrot_krawedzi(graf, porcja=1 << 20):
+
+    # SHA-256 krawędzi grafu jako ciągłej tablicy int32 (ten sam wynik dla grafu z JSON i z .gbin).
+    # Zmapowana tablica jest haszowana porcjami, bez kopiowania całości do pamięci.
+
+    krawedzie = graf["krawedzie"]
+    skrot = hashlib.sha256()
+    for poczatek in range(0, len(krawedzie), porcja):
+        czesc = np.ascontiguousarray(np.asarray(krawedzie[poczatek:poczatek + porcja], dtype=np.int32))
+        skrot.update(czesc.reshape(-1, 2).tobytes())
+    return skrot.hexdigest()
+
+def sprawdz_katalog_punktow(katalog, opis):
+
+    # Zapisuje opis eksperymentu w katalogu punktów kontrolnych albo sprawdza, że zgadza się z zapisanym.
+    # Chroni przed wznowieniem z punktów innego grafu (opis zawiera skrót krawędzi, zob. skrot_krawedzi),
+    # ziarna lub zestawów parametrów.
+
+    os.makedirs(katalog, exist_ok=True)
+    sciezka = os.path.join(katalog, PLIK_OPISU_PUNKTOW)
+    opis = json.loads(json.dumps(opis))
+    if os.path.exists(sciezka):
+        with open(sciezka, 'r') as f:
+            zapisany = json.load(f)
+        if zapisany != opis:
+            rozne = sorted(klucz for klucz in opis.keys() | zapisany.keys() if opis.get(klucz) != zapisany.get(klucz))
+            raise ValueError(f"Katalog {katalog} zawiera punkty kontrolne innego eksperymentu "
+                             f"(różnice: {', '.join(rozne)})")
+        return
+    with open(sciezka, 'w') as f:
+        json.dump(opis, f, indent=4)
+
+def inicjalizuj_proces(grafy):
+    global _GRAFY_PROCESU
+    _GRAFY_PROCESU = grafy
+
+def wykonaj_uruchomienie(zadanie, graf=None):
+
+    # Wykonuje jedno uruchomienie GA z własnym ziarnem.
+    # Bez podanego grafu używa grafu zadanie["graf"] przekazanego do procesu roboczego.
+    # Z zadanie["punkt_kontrolny"] (ścieżka bez rozszerzenia) ukończone uruchomienie zostawia plik .wynik
+    # i przy ponownym wywołaniu jest tylko wczytywane; przerwane wznawia się z pliku .stan.
+
+    # Zwraca (najlepszy, konflikty, historia, statystyki pamięci przystosowania albo None).
+
+    sciezka = zadanie.get("punkt_kontrolny")
+    if not sciezka:
+        return _wykonaj_uruchomienie(zadanie, graf, None)
+
+    wynik = wczytaj_pickle(sciezka + ".wynik")
+    if wynik is not None:
+        return wynik
+
+    punkt = PunktKontrolny(sciezka + ".stan", zadanie["interwal_punktow"])
+    wynik = _wykonaj_uruchomienie(zadanie, graf, punkt)
+    zapisz_atomowo(sciezka + ".wynik", wynik)
+    punkt.usun()
+    return wynik
+
+def _wykonaj_uruchomienie(zadanie, graf, punkt):
+
+    graf = graf if graf is not None else _GRAFY_PROCESU[zadanie.get("graf")]
+    if zadanie.get("wyspy"):
+        # Model wyspowy zapisuje tylko wynik ukończonego uruchomienia (punkt jest pomijany)
+        # Import na miejscu: moduł wyspy sam importuje operatory z main
+        from wyspy import uruchom_wyspy
+        # Ustawienia samego silnika uruchom_ga nie dotyczą modelu wyspowego
+        pominiete = ("silnik", "pamiec_przystosowania", "ocena_przyrostowa", "kroki_lokalne", "udzial_lokalny",
+                     "operator_krzyzowania", "operator_mutacji", "adaptacja_mutacji")
+        parametry = {klucz: wartosc for klucz, wartosc in zadanie["parametry"].items() if klucz not in pominiete}
+        return (*uruchom_wyspy(graf, ziarno=zadanie["ziarno"], **parametry, **zadanie["wyspy"]), None)
+    if zadanie.get("stan_ustalony"):
+        # Tryb ze stanem ustalonym ma własną pulę procesów oceniających i też nie zapisuje stanu
+        from stan_ustalony import uruchom_stan_ustalony
+        pominiete = ("silnik", "pamiec_przystosowania", "ocena_przyrostowa", "kroki_lokalne", "udzial_lokalny",
+                     "adaptacja_mutacji")
+        parametry = {klucz: wartosc for klucz, wartosc in zadanie["parametry"].items() if klucz not in pominiete}
+        return (*uruchom_stan_ustalony(graf, rng=np.random.default_rng(zadanie["ziarno"]), **parametry,
+                                       **zadanie["stan_ustalony"]), None)
+
+    random.seed(zadanie["ziarno"])
+    parametry = dict(zadanie["parametry"])
+    pamiec = utworz_pamiec(parametry.pop("pamiec_przystosowania", None))
+    statystyki = pamiec.statystyki if pamiec is not None else lambda: None
+
+    # Własny generator każdego uruchomienia: wynik zależy tylko od ziarna zadania, nie od procesu
+    parametry["rng"] = np.random.default_rng(zadanie["ziarno"])
+
+    if not zadanie.get("log"):
+        return (*uruchom_ga(graf, **parametry, pamiec_przystosowania=pamiec, punkt_kontrolny=punkt), statystyki())
+
+    # Wznowione uruchomienie dopisuje do swojego logu; generacje po ostatnim zapisie stanu mogą się powtórzyć
+    with ObserwatorLogu(zadanie["log"], dopisz=punkt is not None, zestaw=zadanie["zestaw"],
+                        uruchomienie=zadanie["uruchomienie"]) as obserwator:
+        wynik = uruchom_ga(graf, **parametry, obserwator=obserwator, pamiec_przystosowania=pamiec,
+                           punkt_kontrolny=punkt)
+    return (*wynik, statystyki())
+
+def zadania_eksperymentu(graf, liczba_kolorow, zestawy_parametrow, podstawowe_parametry, liczba_uruchomien,
+                         ziarno_bazowe, silnik="python", wyspy=None, kryteria_stopu=None, katalog_logow=None,
+                         format_logu="jsonl", pamiec_przystosowania=None, ocena_przyrostowa=True,
+                         katalog_punktow=None, interwal_punktow=10, kroki_lokalne=0, udzial_lokalny=0.1,
+                         operator_krzyzowania="jednopunktowe", operator_mutacji="losowa", stan_ustalony=None,
+                         klucz_grafu=None, adaptacja_mutacji=False):
+
+    # Lista zadań dla wykonaj_uruchomienie: liczba_uruchomien dla każdego zestawu parametrów, po kolei.
+    # wyspy (słownik argumentów uruchom_wyspy) zamienia każde uruchomienie na model wyspowy.
+    # kryteria_stopu są przekazywane do każdego uruchomienia (zob. sprawdz_kryteria_stopu).
+    # Z katalog_logow każde uruchomienie zapisuje dane generacji (ObserwatorLogu) do osobnego pliku.
+    # pamiec_przystosowania to pojemność osobnej pamięci ocen dla każdego uruchomienia.
+    # Z katalog_punktow stan każdego uruchomienia jest zapisywany co interwal_punktow generacji,
+    # a ponowne wykonanie zadań z tym samym katalogiem pomija ukończone pary (zestaw, uruchomienie).
+    # kroki_lokalne > 0 włącza tryb memetyczny w każdym uruchomieniu (zob. uruchom_ga).
+    # operator_krzyzowania i operator_mutacji to nazwy operatorów z rejestru (zob. wybierz_operatory).
+    # stan_ustalony (słownik argumentów uruchom_stan_ustalony) zamienia każde uruchomienie na GA
+    # ze stanem ustalonym i pulą procesów oceniających.
+    # klucz_grafu wskazuje graf zadań w procesach roboczych (inicjalizuj_proces).
+    # adaptacja_mutacji=True zmienia p_mutacji w trakcie każdego uruchomienia (AdaptacjaMutacji).
+    # Zestaw parametrów może mieć własny "rozmiar_turnieju" (domyślnie z podstawowe_parametry).
+
+    if katalog_logow:
+        os.makedirs(katalog_logow, exist_ok=True)
+    if katalog_punktow:
+        sprawdz_katalog_punktow(katalog_punktow, {
+            "liczba_wierzcholkow": graf["liczba_wierzcholkow"],
+            "liczba_krawedzi": len(graf["krawedzie"]),
+            "skrot_krawedzi": skrot_krawedzi(graf),
+            "liczba_kolorow": liczba_kolorow,
+            "zestawy_parametrow": zestawy_parametrow,
+            "podstawowe_parametry": podstawowe_parametry,
+            "liczba_uruchomien": liczba_uruchomien,
+            "ziarno": ziarno_bazowe,
+            "silnik": silnik,
+            "wyspy": wyspy,
+            "stan_ustalony": stan_ustalony,
+            "kryteria_stopu": kryteria_stopu,
+            "ocena_przyrostowa": ocena_przyrostowa,
+            "kroki_lokalne": kroki_lokalne,
+            "udzial_lokalny": udzial_lokalny,
+            "operator_krzyzowania": operator_krzyzowania,
+            "operator_mutacji": operator_mutacji,
+            "adaptacja_mutacji": adaptacja_mutacji
+        })
+
+    zadania = []
+    for indeks_zestawu, zestaw in enumerate(zestawy_parametrow):
+        for i in range(liczba_uruchomien):
+            log = None
+            if katalog_logow:
+                log = os.path.join(katalog_logow, f"zestaw{indeks_zestawu}_uruchomienie{i}.{format_logu}")
+            punkt = None
+            if katalog_punktow:
+                punkt = os.path.join(katalog_punktow, f"zestaw{indeks_zestawu}_uruchomienie{i}")
+            zadania.append({
+                "zestaw": indeks_zestawu,
+                "uruchomienie": i,
+                "log": log,
+                "graf": klucz_grafu,
+                "ziarno": ziarno_uruchomienia(ziarno_bazowe, indeks_zestawu, i),
+                "parametry": {
+                    "liczba_kolorow": liczba_kolorow,
+                    "rozmiar_populacji": podstawowe_parametry["rozmiar_populacji"],
+                    "liczba_generacji": podstawowe_parametry["liczba_generacji"],
+                    "p_krzyzowania": zestaw["p_krzyzowania"],
+                    "p_mutacji": zestaw["p_mutacji"],
+                    "rozmiar_turnieju": zestaw.get("rozmiar_turnieju", podstawowe_parametry["rozmiar_turnieju"]),
+                    "silnik": silnik,
+                    "kryteria_stopu": kryteria_stopu,
+                    "ocena_przyrostowa": ocena_przyrostowa,
+                    "pamiec_przystosowania": pamiec_przystosowania,
+                    "kroki_lokalne": kroki_lokalne,
+                    "udzial_lokalny": udzial_lokalny,
+                    "operator_krzyzowania": operator_krzyzowania,
+                    "operator_mutacji": operator_mutacji,
+                    "adaptacja_mutacji": adaptacja_mutacji
+                },
+                "wyspy": wyspy,
+                "stan_ustalony": stan_ustalony,
+                "punkt_kontrolny": punkt,
+                "interwal_punktow": interwal_punktow
+            })
+
+    return zadania
+
+def podsumuj_eksperyment(zestawy_parametrow, liczba_uruchomien, liczba_generacji, wyniki_uruchomien,
+                         plik_historii=None):
+
+    # Uśrednia wyniki uruchomień dla każdego zestawu parametrów.
+    # wyniki_uruchomien to iterator wyników wykonaj_uruchomienie w kolejności listy z zadania_eksperymentu.
+    # Historie uruchomień są agregowane w locie (AgregatHistorii); z plik_historii każda jest też
+    # dopisywana do pliku binarnego (ZapisHistorii). Powyżej PROG_PELNEJ_HISTORII generacji
+    # wynik zawiera "poziomy_historii_zbieznosci" zamiast list historii dla każdej generacji.
+    # Zwraca listę "wyniki_strategii" w formacie zapisywanym do pliku wyników.
+
+    zapis_historii = ZapisHistorii(plik_historii, liczba_generacji) if plik_historii else None
+
+    wyniki_strategii = []
+    try:
+        for indeks_zestawu, zestaw in enumerate(zestawy_parametrow):
+            print(f"\n--- TEST: {zestaw['nazwa']} (PK={zestaw['p_krzyzowania']}, PM={zestaw['p_mutacji']}) ---")
+
+            wyniki_konfliktow = []
+            historie = AgregatHistorii(liczba_generacji) # Statystyki historii bez przechowywania list
+            statystyki_pamieci = []
+
+            for i in range(liczba_uruchomien):
+                # Wyniki przychodzą w kolejności zadań, niezależnie od trybu
+                najlepszy, konflikty, historia, statystyki = next(wyniki_uruchomien)
+                if statystyki is not None:
+                    statystyki_pamieci.append(statystyki)
+
+                print(f"Uruchomienie {i+1}: Znaleziono rozwiązanie z {konflikty} konfliktami.")
+                if konflikty == 0:
+                    print(f"-> Idealne rozwiązanie: {najlepszy}")
+
+                wyniki_konfliktow.append(konflikty)
+                historie.dodaj(historia)
+                if zapis_historii is not None:
+                    zapis_historii.dopisz(indeks_zestawu, i, historia)
+
+            # Podsumowanie dla zestawu parametrów
+            srednia_konfliktow_final = sum(wyniki_konfliktow) / len(wyniki_konfliktow)
+            najlepszy_wynik = min(wyniki_konfliktow)
+
+            print(f"Podsumowanie dla '{zestaw['nazwa']}':")
+            print(f"> Najlepszy wynik (min. konfliktów): {najlepszy_wynik}")
+            print(f"> Średnia liczba konfliktów: {srednia_konfliktow_final:.2f}")
+            if statystyki_pamieci:
+                suma = {klucz: sum(s[klucz] for s in statystyki_pamieci) for klucz in statystyki_pamieci[0]}
+                print(f"> Pamięć przystosowania: {suma['trafienia']} trafień, {suma['chybienia']} chybień, "
+                      f"{suma['pominiete']} pominiętych kopii")
+
+            # Dodaj do wyników strategii
+            wynik_strategii = {
+                "nazwa": zestaw['nazwa'],
+                "pk": zestaw['p_krzyzowania'],
+                "pm": zestaw['p_mutacji'],
+                "najlepszy_wynik": najlepszy_wynik,
+                "srednia_konfliktow_finalna": srednia_konfliktow_final,
+                "konflikty_uruchomien": wyniki_konfliktow
+            }
+            if liczba_generacji > PROG_PELNEJ_HISTORII:
+                wynik_strategii["poziomy_historii_zbieznosci"] = zbuduj_poziomy(historie.srednia(), historie.minimum,
+                                                                                historie.maksimum)
+            else:
+                wynik_strategii.update({
+                    "srednia_historia_zbieznosci": [round(wartosc, 2) for wartosc in historie.srednia().tolist()],
+                    "min_historia_zbieznosci": historie.minimum.tolist(),
+                    "max_historia_zbieznosci": historie.maksimum.tolist(),
+                    "odchylenie_historii_zbieznosci": [round(wartosc, 2)
+                                                       for wartosc in np.sqrt(historie.wariancja()).tolist()]
+                })
+            wyniki_strategii.append(wynik_strategii)
+    finally:
+        if zapis_historii is not None:
+            zapis_historii.zamknij()
+
+    return wyniki_strategii
+
+def przeprowadz_eksperyment(graf, liczba_kolorow, zestawy_parametrow, podstawowe_parametry, liczba_uruchomien,
+                            ziarno_bazowe, liczba_procesow=1, plik_historii=None, **ustawienia):
+
+    # Uruchamia wszystkie zestawy parametrów po liczba_uruchomien razy i uśrednia wyniki.
+    # Przy liczba_procesow > 1 niezależne uruchomienia są rozdzielane na pulę procesów.
+    # ustawienia to pozostałe argumenty zadania_eksperymentu (silnik, wyspy, kryteria_stopu, katalogi itd.),
+    # plik_historii jak w podsumuj_eksperyment.
+    # Zwraca listę "wyniki_strategii" w formacie zapisywanym do pliku wyników.
+
+    zadania = zadania_eksperymentu(graf, liczba_kolorow, zestawy_parametrow, podstawowe_parametry,
+                                   liczba_uruchomien, ziarno_bazowe, **ustawienia)
+
+    if liczba_procesow > 1:
+        # Import na żądanie: concurrent.futures.process wydłuża start każdego wywołania main.py
+        from concurrent.futures import ProcessPoolExecutor
+        pula = ProcessPoolExecutor(max_workers=liczba_procesow, initializer=inicjalizuj_proces,
+                                   initargs=({None: graf},))
+        wyniki_uruchomien = pula.map(wykonaj_uruchomienie, zadania)
+    else:
+        pula = None
+        wyniki_uruchomien = (wykonaj_uruchomienie(zadanie, graf) for zadanie in zadania)
+
+    try:
+        return podsumuj_eksperyment(zestawy_parametrow, liczba_uruchomien, podstawowe_parametry["liczba_generacji"],
+                                    wyniki_uruchomien, plik_historii)
+    finally:
+        if pula is not None:
+            pula.shutdown(cancel_futures=True)
+
 
 if __name__ == "__main__":
-    
-    parser = argparse.ArgumentParser(description="Algorytm Genetyczny dla Kolorowania Grafu.")
-    parser.add_argument("sciezka_do_grafu", type=str, 
-                        help="Ścieżka do pliku .json z definicją grafu.")
-    parser.add_argument("-k", "--kolory", type=int, default=3, 
-                        help="Liczba kolorów do testu (default: 3)")
-    
-    args = parser.parse_args()
-    
+    args = ARGUMENTY
+
     print("Start eksperymentu")
     
     # Konfiguracja
     WYBRANY_GRAF = wczytaj_graf_z_pliku(args.sciezka_do_grafu)
     LICZBA_KOLOROW_DO_TESTU = args.kolory
-    LICZBA_URUCHOMIEN_NA_ZESTAW = 10
+    LICZBA_URUCHOMIEN_NA_ZESTAW = DOMYSLNA_LICZBA_URUCHOMIEN
+    
+    # Ziarno bazowe zapisywane w wynikach, żeby eksperyment dało się powtórzyć
+    ziarno_bazowe = args.ziarno
+    if ziarno_bazowe is None and args.punkty_kontrolne:
+        # Wznowienie bez --ziarno używa ziarna przerwanego eksperymentu
+        sciezka_opisu = os.path.join(args.punkty_kontrolne, PLIK_OPISU_PUNKTOW)
+        if os.path.exists(sciezka_opisu):
+            with open(sciezka_opisu, 'r') as f:
+                ziarno_bazowe = json.load(f)["ziarno"]
+    if ziarno_bazowe is None:
+        ziarno_bazowe = random.SystemRandom().randrange(2**32)
     
-    # Parametry algorytmu
-    PODSTAWOWE_PARAMETRY = {
-        "rozmiar_populacji": 50,  
-        "liczba_generacji": 200, 
-        "rozmiar_turnieju": 5    
+    # Kryteria wcześniejszego zakończenia pojedynczego uruchomienia (domyślnie wszystkie wyłączone)
+    kryteria_stopu = {
+        "zero_konfliktow": args.stop_zero,
+        "limit_czasu": args.limit_czasu,
+        "limit_ocen": args.limit_ocen,
+        "limit_stagnacji": args.limit_stagnacji
     }
-
-    # Zestawy parametrów do porównania
-    zestawy_parametrow = [
-        {"nazwa": "Niska mutacja", "p_krzyzowania": 0.9, "p_mutacji": 0.01},
-        {"nazwa": "Średnia mutacja", "p_krzyzowania": 0.9, "p_mutacji": 0.1},
-        {"nazwa": "Wysoka mutacja", "p_krzyzowania": 0.9, "p_mutacji": 0.2},
-        {"nazwa": "Niskie krzyżowanie", "p_krzyzowania": 0.1, "p_mutacji": 0.1},
-        {"nazwa": "Tylko krzyżowanie 100%", "p_krzyzowania": 1, "p_mutacji": 0},
-        {"nazwa": "Sama mutacja 10%", "p_krzyzowania": 0, "p_mutacji": 0.1},
-    ]
+    
+    PODSTAWOWE_PARAMETRY = DOMYSLNE_PODSTAWOWE_PARAMETRY
+    zestawy_parametrow = DOMYSLNE_ZESTAWY_PARAMETROW
 
     print(f"Testowany Graf: {args.sciezka_do_grafu}")
     print(f"  > {WYBRANY_GRAF['liczba_wierzcholkow']} wierzchołków, {len(WYBRANY_GRAF['krawedzie'])} krawędzi.")
+    if WYBRANY_GRAF.get("ograniczenie_kolorow"):
+        print(f"  > graf jest kolorowalny {WYBRANY_GRAF['ograniczenie_kolorow']} kolorami (ukryte kolorowanie).")
+    
+    if args.szukaj_k:
+        # Import na miejscu: moduł liczba_chromatyczna sam importuje uruchom_ga z main
+        from liczba_chromatyczna import szukaj_liczby_chromatycznej
+        print(f"Szukanie liczby kolorów ({args.szukaj_k}), ziarno: {ziarno_bazowe}")
+        wynik = szukaj_liczby_chromatycznej(
+            WYBRANY_GRAF, PODSTAWOWE_PARAMETRY["rozmiar_populacji"], PODSTAWOWE_PARAMETRY["liczba_generacji"],
+            args.p_krzyzowania, args.p_mutacji, PODSTAWOWE_PARAMETRY["rozmiar_turnieju"], tryb=args.szukaj_k,
+            kryteria_stopu=kryteria_stopu, rng=np.random.default_rng(ziarno_bazowe),
+            obserwator=lambda proba: print(f"  k={proba['liczba_kolorow']}: konflikty {proba['konflikty']}, "
+                                           f"generacje {proba['generacje']}, {proba['czas_s']:.2f} s"),
+            silnik=args.silnik, ocena_przyrostowa=not args.pelna_ocena, pamiec_przystosowania=args.pamiec,
+            kroki_lokalne=args.lokalne, udzial_lokalny=args.udzial_lokalny,
+            operator_krzyzowania=args.krzyzowanie, operator_mutacji=args.mutacja,
+            adaptacja_mutacji=args.adaptacja_mutacji)
+        print(f"  > DSatur: {wynik['ograniczenie_gorne_dsatur']} kolorów, "
+              f"klika: {wynik['ograniczenie_dolne_klika']}")
+        print(f"  > Najmniejsza znaleziona liczba kolorów: {wynik['liczba_kolorow']}")
+        
+        wynik["info_szukania"] = {
+            "graf": args.sciezka_do_grafu,
+            "tryb": args.szukaj_k,
+            "rozmiar_populacji": PODSTAWOWE_PARAMETRY["rozmiar_populacji"],
+            "liczba_generacji": PODSTAWOWE_PARAMETRY["liczba_generacji"],
+            "p_krzyzowania": args.p_krzyzowania,
+            "p_mutacji": args.p_mutacji,
+            "adaptacja_mutacji": args.adaptacja_mutacji,
+            "silnik": args.silnik,
+            "kryteria_stopu": kryteria_stopu,
+            "operator_krzyzowania": args.krzyzowanie,
+            "operator_mutacji": args.mutacja,
+            "kroki_lokalne": args.lokalne,
+            "ziarno": ziarno_bazowe
+        }
+        nazwa_grafu = os.path.splitext(os.path.basename(args.sciezka_do_grafu))[0]
+        os.makedirs(KATALOG_WYNIKOW, exist_ok=True)
+        sciezka_zapisu = os.path.join(KATALOG_WYNIKOW, f"chromatyczna_{nazwa_grafu}.json")
+        with open(sciezka_zapisu, 'w') as f:
+            json.dump(wynik, f, indent=4)
+        print(f"\nPomyślnie zapisano wyniki do pliku: {sciezka_zapisu}")
+        sys.exit(0)
     print(f"Liczba kolorów: {LICZBA_KOLOROW_DO_TESTU}")
+    print(f"Ziarno: {ziarno_bazowe}, procesy: {args.workers}")
     
     # ZAPISYWANIE WYNIKÓW 
     wszystkie_wyniki = {
@@ -210,64 +1935,70 @@ if __name__ == "__main__":
             "liczba_wierzcholkow": WYBRANY_GRAF['liczba_wierzcholkow'],
             "liczba_krawedzi": len(WYBRANY_GRAF['krawedzie']),
             "liczba_kolorow": LICZBA_KOLOROW_DO_TESTU,
+            "ograniczenie_kolorow": WYBRANY_GRAF.get("ograniczenie_kolorow"),
             "liczba_uruchomien_na_zestaw": LICZBA_URUCHOMIEN_NA_ZESTAW,
             "rozmiar_populacji": PODSTAWOWE_PARAMETRY["rozmiar_populacji"],
-            "liczba_generacji": PODSTAWOWE_PARAMETRY["liczba_generacji"]
+            "liczba_generacji": PODSTAWOWE_PARAMETRY["liczba_generacji"],
+            "silnik": args.silnik,
+            "liczba_wysp": args.wyspy,
+            "stan_ustalony": args.stan_ustalony,
+            "kryteria_stopu": kryteria_stopu,
+            "ocena_przyrostowa": not args.pelna_ocena,
+            "pamiec_przystosowania": args.pamiec,
+            "kroki_lokalne": args.lokalne,
+            "udzial_lokalny": args.udzial_lokalny,
+            "operator_krzyzowania": args.krzyzowanie,
+            "operator_mutacji": args.mutacja,
+            "adaptacja_mutacji": args.adaptacja_mutacji,
+            "ziarno": ziarno_bazowe
         },
         "wyniki_strategii": []
     }
     
+    ustawienia_wysp = None
+    if args.wyspy > 1:
+        ustawienia_wysp = {
+            "liczba_wysp": args.wyspy,
+            "interwal_migracji": args.interwal_migracji,
+            "liczba_migrantow": args.migranci,
+            "topologia": args.topologia
+        }
+    
+    ustawienia_stanu_ustalonego = None
+    if args.stan_ustalony:
+        ustawienia_stanu_ustalonego = {
+            "liczba_procesow": args.stan_ustalony,
+            "zastepowanie": args.zastepowanie,
+            "rozmiar_porcji": args.porcja
+        }
+    
     # PĘTLA EKSPERYMENTU
-    for zestaw in zestawy_parametrow:
-        print(f"\n--- TEST: {zestaw['nazwa']} (PK={zestaw['p_krzyzowania']}, PM={zestaw['p_mutacji']}) ---")
-        
-        wyniki_konfliktow = []
-        historie_uruchomien = [] # Zapisywanie historycznych wyników
-        
-        for i in range(LICZBA_URUCHOMIEN_NA_ZESTAW):
-            # Uruchamianie głównego skryptu
-            najlepszy, konflikty, historia = uruchom_ga(
-                graf=WYBRANY_GRAF,
-                liczba_kolorow=LICZBA_KOLOROW_DO_TESTU,
-                rozmiar_populacji=PODSTAWOWE_PARAMETRY["rozmiar_populacji"],
-                liczba_generacji=PODSTAWOWE_PARAMETRY["liczba_generacji"],
-                p_krzyzowania=zestaw["p_krzyzowania"],
-                p_mutacji=zestaw["p_mutacji"],
-                rozmiar_turnieju=PODSTAWOWE_PARAMETRY["rozmiar_turnieju"]
-            )
-            
-            print(f"Uruchomienie {i+1}: Znaleziono rozwiązanie z {konflikty} konfliktami.")
-            if konflikty == 0:
-                print(f"-> Idealne rozwiązanie: {najlepszy}")
-            
-            wyniki_konfliktow.append(konflikty)
-            historie_uruchomien.append(historia) # Zapisz historię z tego uruchomienia
-            
-        # Obliczanie średniej zbieżności
-        srednia_historia = []
-        liczba_generacji = PODSTAWOWE_PARAMETRY["liczba_generacji"]
-        for gen in range(liczba_generacji):
-            suma_dla_generacji = sum(historia[gen] for historia in historie_uruchomien if len(historia) > gen)
-            srednia_dla_generacji = suma_dla_generacji / LICZBA_URUCHOMIEN_NA_ZESTAW
-            srednia_historia.append(round(srednia_dla_generacji, 2))
-            
-        # Podsumowanie dla zestawu parametrów
-        srednia_konfliktow_final = sum(wyniki_konfliktow) / len(wyniki_konfliktow)
-        najlepszy_wynik = min(wyniki_konfliktow)
-        
-        print(f"Podsumowanie dla '{zestaw['nazwa']}':")
-        print(f"> Najlepszy wynik (min. konfliktów): {najlepszy_wynik}")
-        print(f"> Średnia liczba konfliktów: {srednia_konfliktow_final:.2f}")
-        
-        # Dodaj do wyników strategii
-        wszystkie_wyniki["wyniki_strategii"].append({
-            "nazwa": zestaw['nazwa'],
-            "pk": zestaw['p_krzyzowania'],
-            "pm": zestaw['p_mutacji'],
-            "najlepszy_wynik": najlepszy_wynik,
-            "srednia_konfliktow_finalna": srednia_konfliktow_final,
-            "srednia_historia_zbieznosci": srednia_historia # Dodaj uśredniony wykres
-        })
+    try:
+        wszystkie_wyniki["wyniki_strategii"] = przeprowadz_eksperyment(
+            WYBRANY_GRAF, LICZBA_KOLOROW_DO_TESTU, zestawy_parametrow, PODSTAWOWE_PARAMETRY,
+            LICZBA_URUCHOMIEN_NA_ZESTAW, ziarno_bazowe, liczba_procesow=args.workers, silnik=args.silnik,
+            wyspy=ustawienia_wysp, kryteria_stopu=kryteria_stopu,
+            katalog_logow=args.log_generacji, format_logu=args.format_logu,
+            pamiec_przystosowania=args.pamiec, ocena_przyrostowa=not args.pelna_ocena,
+            katalog_punktow=args.punkty_kontrolne, interwal_punktow=args.interwal_punktow,
+            plik_historii=args.zapis_historii, kroki_lokalne=args.lokalne, udzial_lokalny=args.udzial_lokalny,
+            operator_krzyzowania=args.krzyzowanie, operator_mutacji=args.mutacja,
+            stan_ustalony=ustawienia_stanu_ustalonego, adaptacja_mutacji=args.adaptacja_mutacji)
+    except ValueError as e:
+        print(f"Błąd: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # ZAPIS WYNIKÓW DO BAZY
+    if args.baza:
+        from baza_wynikow import dodaj_eksperyment, otworz_baze
+        polaczenie = otworz_baze(args.baza)
+        id_eksperymentu = dodaj_eksperyment(polaczenie, wszystkie_wyniki)
+        polaczenie.close()
+        if id_eksperymentu is None:
+            print(f"\nTe same wyniki są już w bazie: {args.baza}")
+        else:
+            print(f"\nPomyślnie dopisano wyniki do bazy: {args.baza} (eksperyment {id_eksperymentu})")
+        sys.exit(0)
 
     # ZAPIS WYNIKÓW DO PLIKU
     
@@ -0,0 +1,111 @@
+import math
+
+# Przeszukiwanie lokalne dla trybu memetycznego: poprawianie wybranych osobników przez przekolorowanie
+# wierzchołków leżących na konfliktowych krawędziach (min-conflicts z listą tabu).
+
+def zbuduj_tablice_sasiadow(osobnik, liczba_kolorow, offsety, sasiedzi):
+
+    # Tablica gamma[v * liczba_kolorow + c] = liczba sąsiadów wierzchołka v w kolorze c.
+    # Wierzchołek v jest w konflikcie, gdy gamma[v * liczba_kolorow + osobnik[v]] > 0.
+
+    gamma = [0] * (len(osobnik) * liczba_kolorow)
+    for v in range(len(osobnik)):
+        baza = v * liczba_kolorow
+        for w in sasiedzi[offsety[v]:offsety[v + 1]]:
+            gamma[baza + osobnik[w]] += 1
+    return gamma
+
+def popraw_lokalnie(osobnik, konflikty, liczba_kolorow, offsety, sasiedzi, liczba_krokow, rng, kadencja_tabu=10):
+
+    # Poprawia osobnika w miejscu co najwyżej liczba_krokow ruchami i zwraca nową liczbę konfliktów.
+    # Każdy krok bierze losowy wierzchołek w konflikcie i nadaje mu kolor o najmniejszej liczbie sąsiadów
+    # w tym kolorze. Ruchy pogarszające są odrzucane, więc wynik nigdy nie jest gorszy od wejścia;
+    # ruchy bez zmiany wyniku nie mogą przywrócić koloru zdjętego w ostatnich kadencja_tabu krokach.
+    # Ruch kosztuje O(liczba_kolorow + stopień) dzięki tablicy gamma aktualizowanej przyrostowo.
+
+    if konflikty == 0 or liczba_krokow <= 0:
+        return konflikty
+
+    k = liczba_kolorow
+    gamma = zbuduj_tablice_sasiadow(osobnik, k, offsety, sasiedzi)
+
+    # Wierzchołki w konflikcie jako lista z indeksem pozycji: losowanie, dodanie i usunięcie w O(1)
+    konfliktowe = [v for v in range(len(osobnik)) if gamma[v * k + osobnik[v]]]
+    pozycje = {v: i for i, v in enumerate(konfliktowe)}
+
+    def usun(v):
+        i = pozycje.pop(v)
+        ostatni = konfliktowe.pop()
+        if ostatni != v:
+            konfliktowe[i] = ostatni
+            pozycje[ostatni] = i
+
+    def dodaj(v):
+        pozycje[v] = len(konfliktowe)
+        konfliktowe.append(v)
+
+    tabu = {}
+    losowe = rng.random(2 * liczba_krokow).tolist()
+
+    for krok in range(liczba_krokow):
+        if not konfliktowe:
+            break
+
+        v = konfliktowe[int(losowe[2 * krok] * len(konfliktowe))]
+        baza = v * k
+        stary_kolor = osobnik[v]
+        obecne = gamma[baza + stary_kolor]
+
+        # Najlepszy kolor; przy remisie wygrywa pierwszy od losowego przesunięcia
+        nowy_kolor = -1
+        najlepsze = obecne
+        start = int(losowe[2 * krok + 1] * k)
+        for i in range(k):
+            c = (start + i) % k
+            if c == stary_kolor:
+                continue
+            g = gamma[baza + c]
+            if g < najlepsze or (g == najlepsze and nowy_kolor < 0 and tabu.get(baza + c, -1) < krok):
+                nowy_kolor, najlepsze = c, g
+        if nowy_kolor < 0:
+            continue
+
+        konflikty += najlepsze - obecne
+        osobnik[v] = nowy_kolor
+        tabu[baza + stary_kolor] = krok + kadencja_tabu
+
+        for w in sasiedzi[offsety[v]:offsety[v + 1]]:
+            baza_w = w * k
+            gamma[baza_w + stary_kolor] -= 1
+            gamma[baza_w + nowy_kolor] += 1
+            kolor_w = osobnik[w]
+            if kolor_w == stary_kolor and gamma[baza_w + stary_kolor] == 0:
+                usun(w)
+            elif kolor_w == nowy_kolor and gamma[baza_w + nowy_kolor] == 1:
+                dodaj(w)
+        if najlepsze == 0:
+            usun(v)
+
+    return konflikty
+
+def wybierz_do_poprawy(konflikty, udzial):
+
+    # Indeksy najlepszych osobników (co najmniej jednego), stanowiących udzial populacji.
+
+    liczba = max(1, math.ceil(udzial * len(konflikty)))
+    return sorted(range(len(konflikty)), key=konflikty.__getitem__)[:liczba]
+
+def popraw_populacje(populacja, konflikty, liczba_kolorow, offsety, sasiedzi, liczba_krokow, udzial, rng,
+                     kadencja_tabu=10):
+
+    # Krok memetyczny: popraw_lokalnie dla udzial najlepszych osobników populacji.
+    # Działa na liście chromosomów z listą konfliktów i na tablicy NumPy (wiersze) z tablicą konfliktów;
+    # osobniki i ich konflikty są aktualizowane w miejscu.
+
+    tablica = not isinstance(konflikty, list)
+    for i in wybierz_do_poprawy(konflikty.tolist() if tablica else konflikty, udzial):
+        osobnik = populacja[i].tolist() if tablica else populacja[i]
+        konflikty[i] = popraw_lokalnie(osobnik, int(konflikty[i]), liczba_kolorow, offsety, sasiedzi,
+                                       liczba_krokow, rng, kadencja_tabu)
+        if tablica:
+            populacja[i] = osobnik
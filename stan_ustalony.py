@@ -0,0 +1,172 @@
+import random
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from main import (KontekstOperatorow, oblicz_konflikty_populacji, selekcja_turniejowa_wektorowa,
+                  sprawdz_kryteria_stopu, sprawdz_poprawnosc_kryteriow, tablice_krawedzi, typ_genu,
+                  uzupelnij_historie, wybierz_operatory)
+
+# Algorytm genetyczny ze stanem ustalonym (steady-state): zamiast budować co generację całą nową populację,
+# proces główny ciągle tworzy porcje dzieci z bieżącej populacji, a pula procesów je ocenia.
+# Każde ocenione dziecko od razu zastępuje słabszego osobnika, więc tworzenie dzieci i ocena się nakładają.
+# Procesy liczą tylko konflikty; selekcja, krzyżowanie, mutacja i zastępowanie zostają w procesie głównym,
+# więc przyspieszenie z liczba_procesow ogranicza udział oceny w czasie pokolenia (duże, gęste grafy).
+# Stan uruchomienia nie jest zapisywany, dlatego tryb nie działa z punktami kontrolnymi.
+
+STRATEGIE_ZASTEPOWANIA = ("najgorszy", "turniej")
+
+# Krawędzie grafu ustawiane raz w każdym procesie oceniającym (zamiast wysyłania ich z każdą porcją)
+_KRAWEDZIE_PROCESU = None
+
+def _inicjalizuj_proces(krawedzie_u, krawedzie_v):
+    global _KRAWEDZIE_PROCESU
+    _KRAWEDZIE_PROCESU = (krawedzie_u, krawedzie_v)
+
+def ocen_porcje(porcja):
+
+    # Konflikty porcji dzieci (tablica (liczba_dzieci, liczba_wierzcholkow)) w procesie oceniającym.
+
+    return oblicz_konflikty_populacji(porcja, *_KRAWEDZIE_PROCESU)
+
+def stworz_porcje(populacja, konflikty, liczba_dzieci, p_krzyzowania, p_mutacji, rozmiar_turnieju,
+                  krzyzuj, mutuj, kontekst):
+
+    # Porcja liczba_dzieci dzieci z bieżącej populacji: turnieje, krzyżowanie i mutacja
+    # operatorami silnika numpy z rejestru (krzyzuj, mutuj z wybierz_operatory).
+
+    rng = kontekst.rng
+    liczba_par = (liczba_dzieci + 1) // 2
+    liczba_wierzcholkow = populacja.shape[1]
+
+    indeksy_rodzicow = selekcja_turniejowa_wektorowa(1.0 / (1.0 + konflikty), 2 * liczba_par, rozmiar_turnieju, rng)
+    rodzice1, rodzice2 = populacja[indeksy_rodzicow[0::2]], populacja[indeksy_rodzicow[1::2]]
+
+    dzieci = np.empty((2 * liczba_par, liczba_wierzcholkow), dtype=populacja.dtype)
+    dzieci1, dzieci2 = dzieci[0::2], dzieci[1::2]
+    np.copyto(dzieci1, rodzice1)
+    np.copyto(dzieci2, rodzice2)
+    if liczba_wierzcholkow > 1:
+        czy_krzyzowac = rng.random(liczba_par) < p_krzyzowania
+        punkty_ciecia = rng.integers(1, liczba_wierzcholkow, size=liczba_par)
+        krzyzuj(rodzice1, rodzice2, dzieci1, dzieci2, czy_krzyzowac, punkty_ciecia, kontekst)
+
+    dzieci = dzieci[:liczba_dzieci]
+    mutuj(dzieci, p_mutacji, kontekst)
+    return dzieci
+
+def wybierz_do_zastapienia(konflikty, zastepowanie, rozmiar_turnieju, rng):
+
+    # Indeks osobnika, którego może zastąpić nowe dziecko:
+    # "najgorszy" - osobnik z największą liczbą konfliktów, "turniej" - przegrany losowego turnieju.
+
+    if zastepowanie == "najgorszy":
+        return int(np.argmax(konflikty))
+    uczestnicy = rng.choice(len(konflikty), size=rozmiar_turnieju, replace=False)
+    return int(uczestnicy[np.argmax(konflikty[uczestnicy])])
+
+def uruchom_stan_ustalony(graf, liczba_kolorow, rozmiar_populacji, liczba_generacji, p_krzyzowania, p_mutacji,
+                          rozmiar_turnieju, liczba_procesow=1, zastepowanie="najgorszy", rozmiar_porcji=None,
+                          kryteria_stopu=None, rng=None, operator_krzyzowania="jednopunktowe",
+                          operator_mutacji="losowa"):
+
+    # GA ze stanem ustalonym. Budżet to tyle ocen dzieci, ile zużyłoby liczba_generacji pokoleń uruchom_ga;
+    # co rozmiar_populacji ocen do historii trafia najlepszy dotąd wynik, więc wyniki mają format uruchom_ga.
+    # Z liczba_procesow > 1 porcje po rozmiar_porcji dzieci oceniane są w puli procesów, a w toku są
+    # zawsze dwie porcje na proces: gdy jedna wraca, kolejna powstaje z populacji już po jej wstawieniu.
+    # Kolejność powrotu porcji zależy wtedy od procesów, więc przebieg nie jest powtarzalny co do bitu;
+    # z liczba_procesow=1 porcje są oceniane na miejscu i wynik zależy tylko od rng.
+    # Dziecko zastępuje osobnika z wybierz_do_zastapienia, jeśli ma nie więcej konfliktów od niego.
+
+    sprawdz_poprawnosc_kryteriow(kryteria_stopu)
+    if zastepowanie not in STRATEGIE_ZASTEPOWANIA:
+        raise ValueError(f"Nieznana strategia zastępowania: {zastepowanie}")
+    krzyzuj, mutuj = wybierz_operatory(operator_krzyzowania, operator_mutacji, "numpy")
+    if rng is None:
+        rng = np.random.default_rng(random.getrandbits(64))
+    if rozmiar_porcji is None:
+        # Porcje mniejsze od populacji, żeby selekcja szybko widziała wstawione dzieci
+        rozmiar_porcji = max(1, rozmiar_populacji // (2 * liczba_procesow))
+
+    czas_startu = time.perf_counter()
+    krawedzie_u, krawedzie_v = tablice_krawedzi(graf)
+    kontekst = KontekstOperatorow(liczba_kolorow, rng, krawedzie=(krawedzie_u, krawedzie_v))
+
+    populacja = rng.integers(0, liczba_kolorow, size=(rozmiar_populacji, graf["liczba_wierzcholkow"]))
+    populacja = populacja.astype(typ_genu(liczba_kolorow))
+
+    pula = None
+    if liczba_procesow > 1:
+        pula = ProcessPoolExecutor(max_workers=liczba_procesow, initializer=_inicjalizuj_proces,
+                                   initargs=(krawedzie_u, krawedzie_v))
+        czesci = np.array_split(populacja, liczba_procesow)
+        konflikty = np.concatenate(list(pula.map(ocen_porcje, czesci)))
+    else:
+        konflikty = oblicz_konflikty_populacji(populacja, krawedzie_u, krawedzie_v)
+
+    indeks_najlepszego = int(np.argmin(konflikty))
+    najlepszy_osobnik = populacja[indeks_najlepszego].tolist()
+    najlepsze_konflikty = int(konflikty[indeks_najlepszego])
+    historia_postepow = [najlepsze_konflikty]
+    generacje_bez_poprawy = 0
+    liczba_ocen = rozmiar_populacji
+    ocenione_dzieci = 0
+    poprawa = False
+
+    def przyjmij(dzieci, konflikty_dzieci):
+        # Wstawia ocenioną porcję do populacji; zwraca True, gdy ewolucja ma się zakończyć
+        nonlocal najlepszy_osobnik, najlepsze_konflikty, generacje_bez_poprawy, liczba_ocen, ocenione_dzieci, poprawa
+        for dziecko, konflikty_dziecka in zip(dzieci, konflikty_dzieci.tolist()):
+            zastepowany = wybierz_do_zastapienia(konflikty, zastepowanie, rozmiar_turnieju, rng)
+            if konflikty_dziecka <= konflikty[zastepowany]:
+                populacja[zastepowany] = dziecko
+                konflikty[zastepowany] = konflikty_dziecka
+            if konflikty_dziecka < najlepsze_konflikty:
+                najlepszy_osobnik, najlepsze_konflikty = dziecko.tolist(), konflikty_dziecka
+                poprawa = True
+
+            liczba_ocen += 1
+            ocenione_dzieci += 1
+            if ocenione_dzieci % rozmiar_populacji == 0:
+                # Koniec odpowiednika jednej generacji
+                historia_postepow.append(najlepsze_konflikty)
+                generacje_bez_poprawy = 0 if poprawa else generacje_bez_poprawy + 1
+                poprawa = False
+                if len(historia_postepow) >= liczba_generacji:
+                    return True
+            if sprawdz_kryteria_stopu(kryteria_stopu, najlepsze_konflikty, czas_startu, liczba_ocen,
+                                      generacje_bez_poprawy):
+                return True
+        return False
+
+    def nowa_porcja():
+        return stworz_porcje(populacja, konflikty, rozmiar_porcji, p_krzyzowania, p_mutacji, rozmiar_turnieju,
+                             krzyzuj, mutuj, kontekst)
+
+    zakoncz = (len(historia_postepow) >= liczba_generacji
+               or sprawdz_kryteria_stopu(kryteria_stopu, najlepsze_konflikty, czas_startu, liczba_ocen, 0))
+
+    if pula is None:
+        while not zakoncz:
+            dzieci = nowa_porcja()
+            zakoncz = przyjmij(dzieci, oblicz_konflikty_populacji(dzieci, krawedzie_u, krawedzie_v))
+    else:
+        try:
+            w_toku = {}
+            for _ in range(2 * liczba_procesow):
+                dzieci = nowa_porcja()
+                w_toku[pula.submit(ocen_porcje, dzieci)] = dzieci
+            while not zakoncz:
+                gotowe, _ = wait(w_toku, return_when=FIRST_COMPLETED)
+                for przyszlosc in gotowe:
+                    dzieci = w_toku.pop(przyszlosc)
+                    zakoncz = zakoncz or przyjmij(dzieci, przyszlosc.result())
+                if not zakoncz:
+                    for _ in gotowe:
+                        dzieci = nowa_porcja()
+                        w_toku[pula.submit(ocen_porcje, dzieci)] = dzieci
+        finally:
+            pula.shutdown(cancel_futures=True)
+
+    uzupelnij_historie(historia_postepow, liczba_generacji)
+    return najlepszy_osobnik, historia_postepow[-1], historia_postepow
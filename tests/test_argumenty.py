@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from argumenty_main import NAZWY_KRZYZOWANIA, NAZWY_MUTACJI, sprawdz_argumenty
+from main import OPERATORY_KRZYZOWANIA, OPERATORY_MUTACJI
+
+KATALOG = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_nazwy_operatorow_zgadzaja_sie_z_rejestrami():
+    assert set(NAZWY_KRZYZOWANIA) == set(OPERATORY_KRZYZOWANIA)
+    assert set(NAZWY_MUTACJI) == set(OPERATORY_MUTACJI)
+
+
+def test_niezgodne_opcje_sa_odrzucane():
+    with pytest.raises(SystemExit):
+        sprawdz_argumenty(["graf.json", "--wyspy", "2", "--workers", "2"])
+
+
+def test_help_nie_importuje_numpy():
+    kod = ("import sys, runpy; sys.argv = ['main.py', '--help']\n"
+           "try:\n    runpy.run_path('main.py', run_name='__main__')\n"
+           "except SystemExit:\n    pass\n"
+           "print('numpy' in sys.modules)")
+    wynik = subprocess.run([sys.executable, "-c", kod], cwd=KATALOG, capture_output=True, text=True, check=True)
+    assert wynik.stdout.strip().endswith("False")
+
+
+def test_prawdopodobienstwa_szukania_k():
+    args = sprawdz_argumenty(["graf.json", "--szukaj-k", "w_dol", "--p-mutacji", "0.2"])
+    assert (args.p_krzyzowania, args.p_mutacji) == (0.9, 0.2)
+    with pytest.raises(SystemExit):
+        sprawdz_argumenty(["graf.json", "--p-krzyzowania", "0.5"])
+    with pytest.raises(SystemExit):
+        sprawdz_argumenty(["graf.json", "--szukaj-k", "bisekcja", "--p-mutacji", "1.5"])
+
+
+def test_stan_ustalony_nie_laczy_sie_z_punktami_kontrolnymi():
+    with pytest.raises(SystemExit):
+        sprawdz_argumenty(["graf.json", "--stan-ustalony", "2", "--punkty-kontrolne", "punkty"])
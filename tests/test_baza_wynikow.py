@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import json
+import os
+
+from baza_wynikow import dodaj_eksperyment, otworz_baze, podsumowanie
+
+KATALOG = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def eksperyment(graf="grafy/graph_1.json", liczba_generacji=200, srednia=2.0, **info):
+    return {
+        "info_eksperymentu": {"graf": graf, "liczba_kolorow": 3, "liczba_generacji": liczba_generacji,
+                              "rozmiar_populacji": 50, "liczba_uruchomien_na_zestaw": 10, **info},
+        "wyniki_strategii": [{"nazwa": "a", "pk": 0.9, "pm": 0.1, "najlepszy_wynik": int(srednia),
+                              "srednia_konfliktow_finalna": srednia}]
+    }
+
+
+def test_rozne_budzety_grafy_i_silniki_nie_sa_usredniane_razem(tmp_path):
+    polaczenie = otworz_baze(str(tmp_path / "b.sqlite"))
+    dodaj_eksperyment(polaczenie, eksperyment(srednia=2.0))
+    dodaj_eksperyment(polaczenie, eksperyment(srednia=4.0))
+    dodaj_eksperyment(polaczenie, eksperyment(liczba_generacji=20, srednia=9.0))
+    dodaj_eksperyment(polaczenie, eksperyment(graf="inne/graph_1.json", srednia=7.0))
+    dodaj_eksperyment(polaczenie, eksperyment(srednia=5.0, silnik="numpy"))
+    dodaj_eksperyment(polaczenie, eksperyment(srednia=6.0, kroki_lokalne=5, udzial_lokalny=0.1))
+
+    wiersze = podsumowanie(polaczenie, graf="graph_1")
+    assert sorted(w["srednia_konfliktow_finalna"] for w in wiersze) == [3.0, 5.0, 6.0, 7.0, 9.0]
+    assert [w["srednia_konfliktow_finalna"] for w in podsumowanie(polaczenie, graf="inne/graph_1.json")] == [7.0]
+    assert [w["srednia_konfliktow_finalna"] for w in podsumowanie(polaczenie, liczba_generacji=20)] == [9.0]
+    assert [w["srednia_konfliktow_finalna"] for w in podsumowanie(polaczenie, silnik="numpy")] == [5.0]
+
+
+def test_plik_bez_liczby_uruchomien_da_sie_wypisac(tmp_path):
+    dane = eksperyment()
+    del dane["info_eksperymentu"]["liczba_uruchomien_na_zestaw"]
+    plik = tmp_path / "wyniki.json"
+    plik.write_text(json.dumps(dane))
+    baza = str(tmp_path / "b.sqlite")
+    for polecenie in (["importuj", str(plik)], ["zapytaj"], ["lista"]):
+        wynik = subprocess.run([sys.executable, os.path.join(KATALOG, "baza_wynikow.py"), "--baza", baza,
+                                *polecenie], capture_output=True, text=True)
+        assert wynik.returncode == 0, wynik.stderr
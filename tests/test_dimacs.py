@@ -0,0 +1,29 @@
+import pytest
+
+from generate_graph import wczytaj_krawedzie_dimacs
+
+
+def krawedzie(sciezka):
+    n, porcje = wczytaj_krawedzie_dimacs(str(sciezka), rozmiar_porcji=2)
+    return n, [tuple(k) for porcja in porcje for k in porcja.tolist()]
+
+
+def test_petle_i_powtorzenia_sa_pomijane(tmp_path):
+    plik = tmp_path / "g.col"
+    plik.write_text("c komentarz\np edge 3 4\ne 1 2\ne 2 3\ne 3 3\ne 2 1\n")
+    assert krawedzie(plik) == (3, [(0, 1), (1, 2)])
+
+
+@pytest.mark.parametrize("tresc, komunikat", [
+    ("p edge 3 2\ne 1 2\ne 2 9\n", "linia 3: wierzchołek spoza zakresu"),
+    ("p edge 3 2\ne 0 1\n", "linia 2: wierzchołek spoza zakresu"),
+    ("p edge 3 2\ne 1 2\ne 2\n", "linia 3: niepoprawna linia krawędzi"),
+    ("p edge 3 2\ne 1 x\n", "linia 2: niepoprawna linia krawędzi"),
+    ("c\np edge\n", "linia 2: niepoprawna linia nagłówka"),
+    ("e 1 2\n", "brak linii"),
+])
+def test_niepoprawne_linie_sa_odrzucane_z_numerem(tmp_path, tresc, komunikat):
+    plik = tmp_path / "g.col"
+    plik.write_text(tresc)
+    with pytest.raises(ValueError, match=komunikat):
+        krawedzie(plik)
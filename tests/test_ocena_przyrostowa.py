@@ -0,0 +1,110 @@
+import json
+import random
+
+import numpy as np
+import pytest
+
+from format_grafu import zapisz_graf_binarny
+from main import (indeks_sasiedztwa, konflikty_po_krzyzowaniu, konflikty_po_zmianach, policz_konflikty,
+                  uruchom_ga, wczytaj_graf_z_pliku, zbuduj_indeks_sasiedztwa, zmien_geny_przyrostowo)
+
+
+def losowy_graf(rng, liczba_wierzcholkow, liczba_krawedzi):
+    # Krawędzie losowane z powtórzeniami (multigraf), bez pętli
+    krawedzie = []
+    while len(krawedzie) < liczba_krawedzi:
+        u, v = rng.integers(0, liczba_wierzcholkow, size=2).tolist()
+        if u != v:
+            krawedzie.append((u, v))
+    return {"liczba_wierzcholkow": liczba_wierzcholkow, "krawedzie": krawedzie}
+
+
+@pytest.mark.parametrize("ziarno", range(5))
+def test_mutacje_przyrostowe_zgodne_z_pelna_ocena(ziarno):
+    rng = np.random.default_rng(ziarno)
+    graf = losowy_graf(rng, 30, 120)
+    offsety, sasiedzi = indeks_sasiedztwa(graf)
+    osobnik = rng.integers(0, 3, size=30).tolist()
+    konflikty = policz_konflikty(osobnik, graf["krawedzie"])
+
+    for _ in range(200):
+        liczba_zmian = int(rng.integers(1, 6))
+        pozycje = rng.integers(0, 30, size=liczba_zmian).tolist()
+        kolory = rng.integers(0, 3, size=liczba_zmian).tolist()
+        konflikty = zmien_geny_przyrostowo(osobnik, konflikty, pozycje, kolory, offsety, sasiedzi)
+        assert konflikty == policz_konflikty(osobnik, graf["krawedzie"])
+
+
+@pytest.mark.parametrize("ziarno", range(5))
+def test_zmiany_i_krzyzowanie_zgodne_z_pelna_ocena(ziarno):
+    rng = np.random.default_rng(ziarno)
+    graf = losowy_graf(rng, 25, 80)
+    offsety, sasiedzi = indeks_sasiedztwa(graf)
+
+    for _ in range(100):
+        stary = rng.integers(0, 4, size=25).tolist()
+        nowy = list(stary)
+        zmienione = sorted(set(rng.integers(0, 25, size=6).tolist()))
+        for v in zmienione:
+            nowy[v] = int(rng.integers(0, 4))
+        konflikty = konflikty_po_zmianach(nowy, stary, policz_konflikty(stary, graf["krawedzie"]), zmienione,
+                                          offsety, sasiedzi)
+        assert konflikty == policz_konflikty(nowy, graf["krawedzie"])
+
+        rodzic1, rodzic2 = stary, nowy
+        punkt = int(rng.integers(1, 25))
+        dziecko1, dziecko2 = rodzic1[:punkt] + rodzic2[punkt:], rodzic2[:punkt] + rodzic1[punkt:]
+        wynik = konflikty_po_krzyzowaniu(rodzic1, rodzic2, policz_konflikty(rodzic1, graf["krawedzie"]),
+                                         policz_konflikty(rodzic2, graf["krawedzie"]), dziecko1, dziecko2,
+                                         punkt, offsety, sasiedzi)
+        assert wynik == (policz_konflikty(dziecko1, graf["krawedzie"]),
+                         policz_konflikty(dziecko2, graf["krawedzie"]))
+
+
+def test_ocena_przyrostowa_daje_ten_sam_przebieg_co_pelna():
+    graf = losowy_graf(np.random.default_rng(7), 40, 150)
+    wyniki = []
+    for przyrostowa in (True, False):
+        random.seed(3)
+        wyniki.append(uruchom_ga(dict(graf), 3, 20, 30, 0.9, 0.05, 3, ocena_przyrostowa=przyrostowa,
+                                 rng=np.random.default_rng(3)))
+    assert wyniki[0] == wyniki[1]
+
+
+@pytest.mark.parametrize("przyrostowa", (True, False))
+def test_graf_binarny_daje_ten_sam_przebieg_co_json(tmp_path, przyrostowa):
+    # Krawędzie .gbin zostają tablicą z mapowania pamięci; wynik ma być jak dla listy krotek
+    graf = losowy_graf(np.random.default_rng(11), 40, 150)
+    sciezka_binarna = tmp_path / "graf.gbin"
+    zapisz_graf_binarny(str(sciezka_binarna), graf["liczba_wierzcholkow"], graf["krawedzie"])
+    wyniki = []
+    for wersja in (dict(graf), wczytaj_graf_z_pliku(str(sciezka_binarna))):
+        random.seed(5)
+        wyniki.append(uruchom_ga(wersja, 3, 20, 30, 0.9, 0.05, 3, ocena_przyrostowa=przyrostowa,
+                                 pamiec_przystosowania=None if przyrostowa else 64,
+                                 rng=np.random.default_rng(5)))
+    assert wyniki[0] == wyniki[1]
+
+
+def test_petle_sa_odrzucane_przy_budowie_indeksu():
+    with pytest.raises(ValueError, match="pętlę"):
+        zbuduj_indeks_sasiedztwa(3, [(0, 1), (2, 2)])
+    with pytest.raises(ValueError):
+        uruchom_ga({"liczba_wierzcholkow": 3, "krawedzie": [(0, 1), (1, 1)]}, 2, 4, 2, 0.9, 0.1, 2,
+                   rng=np.random.default_rng(0))
+
+
+def test_petle_sa_odrzucane_przy_wczytywaniu(tmp_path, capsys):
+    sciezka_json = tmp_path / "petla.json"
+    sciezka_json.write_text(json.dumps({"liczba_wierzcholkow": 3, "krawedzie": [[0, 1], [2, 2]]}))
+    with pytest.raises(SystemExit):
+        wczytaj_graf_z_pliku(str(sciezka_json))
+    assert "pętlę" in capsys.readouterr().err
+
+    # Plik binarny z pętlą zapisany bez indeksu (zapis z indeksem też jest odrzucany)
+    sciezka_binarna = tmp_path / "petla.gbin"
+    zapisz_graf_binarny(str(sciezka_binarna), 3, [(0, 1), (2, 2)], z_indeksem=False)
+    with pytest.raises(SystemExit):
+        wczytaj_graf_z_pliku(str(sciezka_binarna))
+    with pytest.raises(ValueError):
+        zapisz_graf_binarny(str(sciezka_binarna), 3, [(0, 1), (2, 2)])
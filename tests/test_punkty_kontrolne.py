@@ -0,0 +1,25 @@
+import pytest
+
+from format_grafu import wczytaj_graf_binarny, zapisz_graf_binarny
+from main import skrot_krawedzi, zadania_eksperymentu
+
+PODSTAWOWE = {"rozmiar_populacji": 4, "liczba_generacji": 2, "rozmiar_turnieju": 2}
+ZESTAWY = [{"nazwa": "a", "p_krzyzowania": 0.9, "p_mutacji": 0.1}]
+
+
+def test_skrot_nie_zalezy_od_formatu_pliku(tmp_path):
+    graf = {"liczba_wierzcholkow": 4, "krawedzie": [(0, 1), (1, 2), (2, 3)]}
+    sciezka = str(tmp_path / "g.gbin")
+    zapisz_graf_binarny(sciezka, 4, graf["krawedzie"])
+    assert skrot_krawedzi(graf) == skrot_krawedzi(wczytaj_graf_binarny(sciezka))
+    assert skrot_krawedzi(graf) == skrot_krawedzi(graf, porcja=2)
+
+
+def test_wznowienie_z_innym_grafem_o_tym_samym_rozmiarze_jest_odrzucane(tmp_path):
+    katalog = str(tmp_path / "punkty")
+    graf1 = {"liczba_wierzcholkow": 4, "krawedzie": [(0, 1), (1, 2), (2, 3)]}
+    graf2 = {"liczba_wierzcholkow": 4, "krawedzie": [(0, 1), (1, 2), (0, 3)]}
+    zadania_eksperymentu(graf1, 3, ZESTAWY, PODSTAWOWE, 1, 1, katalog_punktow=katalog)
+    zadania_eksperymentu(graf1, 3, ZESTAWY, PODSTAWOWE, 1, 1, katalog_punktow=katalog)
+    with pytest.raises(ValueError, match="skrot_krawedzi"):
+        zadania_eksperymentu(graf2, 3, ZESTAWY, PODSTAWOWE, 1, 1, katalog_punktow=katalog)
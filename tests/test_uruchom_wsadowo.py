@@ -0,0 +1,30 @@
+import json
+import os
+import shutil
+
+from uruchom_wsadowo import nazwa_przebiegu, uruchom_partie, wczytaj_manifest
+
+GRAF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "grafy", "graph_1.json")
+
+
+def test_grafy_o_tej_samej_nazwie_maja_osobne_punkty_kontrolne(tmp_path):
+    sciezki = []
+    for katalog in ("a", "b"):
+        (tmp_path / katalog).mkdir()
+        sciezki.append(str(tmp_path / katalog / "graph_1.json"))
+        shutil.copy(GRAF, sciezki[-1])
+    plik_manifestu = tmp_path / "manifest.json"
+    plik_manifestu.write_text(json.dumps({
+        "grafy": sciezki, "kolory": [3], "liczba_uruchomien": 1, "ziarno": 1,
+        "zestawy_parametrow": [{"nazwa": "A", "p_krzyzowania": 0.9, "p_mutacji": 0.1}],
+        "podstawowe_parametry": {"rozmiar_populacji": 10, "liczba_generacji": 3}
+    }))
+
+    wyjscie = str(tmp_path / "partia.json")
+    uruchom_partie(wczytaj_manifest(str(plik_manifestu)), wyjscie, katalog_punktow=str(tmp_path / "punkty"))
+
+    assert nazwa_przebiegu(sciezki[0], 3) != nazwa_przebiegu(sciezki[1], 3)
+    assert sorted(os.listdir(tmp_path / "punkty")) == sorted(nazwa_przebiegu(s, 3) for s in sciezki)
+    with open(wyjscie) as f:
+        assert len(json.load(f)["eksperymenty"]) == 2
+    assert not os.path.exists(wyjscie + ".tmp")
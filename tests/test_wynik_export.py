@@ -0,0 +1,22 @@
+import json
+import os
+import shutil
+
+from wynik_export import eksportuj_katalog
+
+KATALOG = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_niepoprawny_plik_nie_przerywa_eksportu_katalogu(tmp_path, capsys):
+    wyniki = tmp_path / "wyniki"
+    wyniki.mkdir()
+    shutil.copy(os.path.join(KATALOG, "wyniki", "wyniki_graph_2_k2.json"), wyniki / "wyniki_graph_2_k2.json")
+    (wyniki / "partia_zla.json").write_text(json.dumps({"eksperymenty": [{"info_eksperymentu": 5}]}))
+    (wyniki / "wyniki_lista.json").write_text(json.dumps([1, 2]))
+
+    wygenerowane, pominiete, bledy = eksportuj_katalog(str(wyniki), str(tmp_path / "img"))
+
+    assert (wygenerowane, pominiete, bledy) == (1, 0, 2)
+    bledy_eksportu = capsys.readouterr().err
+    assert "partia_zla.json: AttributeError" in bledy_eksportu
+    assert "wyniki_lista.json: AttributeError" in bledy_eksportu
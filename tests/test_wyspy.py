@@ -0,0 +1,28 @@
+import os
+
+import pytest
+
+from main import wczytaj_graf_z_pliku
+from wyspy import uruchom_wyspy
+
+GRAF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "grafy", "graph_1.json")
+
+
+def test_zly_rozmiar_turnieju_jest_odrzucany_przed_startem_wysp():
+    graf = wczytaj_graf_z_pliku(GRAF)
+    with pytest.raises(ValueError, match="turnieju"):
+        uruchom_wyspy(graf, 3, 10, 20, 0.9, 0.1, 20, liczba_wysp=2)
+
+
+def test_blad_w_wyspie_nie_zawiesza_procesu_glownego():
+    # Krawędź do nieistniejącego wierzchołka: każda wyspa kończy się IndexError przy pierwszej ocenie
+    graf = {"liczba_wierzcholkow": 3, "krawedzie": [(0, 1), (0, 99)]}
+    graf["sasiedzi_offsety"], graf["sasiedzi"] = [0, 1, 2, 2], [1, 0]
+    with pytest.raises(RuntimeError, match="błędem"):
+        uruchom_wyspy(graf, 3, 10, 1000, 0.9, 0.1, 3, liczba_wysp=2)
+
+
+def test_wyspy_zwracaja_wynik():
+    graf = wczytaj_graf_z_pliku(GRAF)
+    osobnik, konflikty, historia = uruchom_wyspy(graf, 3, 10, 20, 0.9, 0.1, 3, liczba_wysp=2, ziarno=1)
+    assert len(historia) == 20 and historia[-1] == konflikty
@@ -0,0 +1,229 @@
+import os
+import sys
+import json
+import time
+import hashlib
+import random
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from main import (DOMYSLNA_LICZBA_URUCHOMIEN, DOMYSLNE_PODSTAWOWE_PARAMETRY, DOMYSLNE_ZESTAWY_PARAMETROW,
+                  KATALOG_WYNIKOW, inicjalizuj_proces, podsumuj_eksperyment, wczytaj_graf_z_pliku,
+                  wykonaj_uruchomienie, zadania_eksperymentu, zapisz_atomowo)
+
+# Partia eksperymentów w jednym procesie: wszystkie pary (graf, liczba kolorów) z manifestu,
+# każdy graf wczytany raz, wszystkie uruchomienia w jednej puli procesów i jeden plik wyników.
+#
+# Manifest (JSON):
+# {
+#     "grafy": ["grafy/graph_1.json", {"sciezka": "grafy/graph_2.json", "kolory": [4, 2]}],
+#     "kolory": [3],                      # dla grafów bez własnej listy "kolory"
+#     "zestawy_parametrow": [...],        # opcjonalne, domyślnie jak w main.py
+#     "podstawowe_parametry": {...},      # opcjonalne, uzupełniane domyślnymi
+#     "liczba_uruchomien": 10,            # opcjonalne
+#     "ziarno": 1,                        # opcjonalne
+#     "ustawienia": {"silnik": "numpy"}   # opcjonalne argumenty zadania_eksperymentu
+# }
+
+# Klucze "ustawienia" przekazywane do zadania_eksperymentu
+USTAWIENIA = ("silnik", "wyspy", "stan_ustalony", "kryteria_stopu", "pamiec_przystosowania", "ocena_przyrostowa",
+              "kroki_lokalne", "udzial_lokalny", "operator_krzyzowania", "operator_mutacji", "interwal_punktow",
+              "adaptacja_mutacji")
+
+def wczytaj_manifest(sciezka):
+
+    # Wczytuje manifest i uzupełnia brakujące pola domyślnymi wartościami z main.py.
+    # Zwraca słownik z listą "przebiegi" par (ścieżka grafu, liczba kolorów); błędy formatu to ValueError.
+
+    with open(sciezka, 'r') as f:
+        manifest = json.load(f)
+
+    if not manifest.get("grafy"):
+        raise ValueError("Manifest nie zawiera listy \"grafy\"")
+    nieznane = set(manifest.get("ustawienia", {})) - set(USTAWIENIA)
+    if nieznane:
+        raise ValueError(f"Nieznane ustawienia w manifeście: {', '.join(sorted(nieznane))}")
+
+    przebiegi = []
+    for wpis in manifest["grafy"]:
+        if isinstance(wpis, str):
+            wpis = {"sciezka": wpis}
+        kolory = wpis.get("kolory", manifest.get("kolory"))
+        if not kolory:
+            raise ValueError(f"Brak liczby kolorów dla grafu {wpis.get('sciezka')}")
+        przebiegi.extend((wpis["sciezka"], int(k)) for k in kolory)
+
+    return {
+        "przebiegi": przebiegi,
+        "zestawy_parametrow": manifest.get("zestawy_parametrow", DOMYSLNE_ZESTAWY_PARAMETROW),
+        "podstawowe_parametry": {**DOMYSLNE_PODSTAWOWE_PARAMETRY, **manifest.get("podstawowe_parametry", {})},
+        "liczba_uruchomien": manifest.get("liczba_uruchomien", DOMYSLNA_LICZBA_URUCHOMIEN),
+        "ziarno": manifest.get("ziarno"),
+        "ustawienia": manifest.get("ustawienia", {})
+    }
+
+def nazwa_przebiegu(sciezka, liczba_kolorow):
+
+    # Nazwa podkatalogu punktów kontrolnych i logów przebiegu: <graf>_<skrót ścieżki>_k<kolory>.
+    # Skrót ścieżki rozróżnia grafy o tej samej nazwie z różnych katalogów i nie zależy
+    # od kolejności w manifeście, więc wznowienie partii trafia do tych samych podkatalogów.
+
+    graf = os.path.splitext(os.path.basename(sciezka))[0]
+    skrot = hashlib.sha256(os.path.normpath(sciezka).encode()).hexdigest()[:8]
+    return f"{graf}_{skrot}_k{liczba_kolorow}"
+
+def uruchom_partie(manifest, sciezka_wyjscia, liczba_procesow=1, katalog_punktow=None, katalog_logow=None,
+                   format_logu="jsonl", baza=None):
+
+    # Wykonuje wszystkie przebiegi manifestu (wczytaj_manifest) z ziarnem manifest["ziarno"].
+    # Każdy przebieg używa tego ziarna bazowego, więc daje te same wyniki co main.py z --ziarno.
+    # Przy liczba_procesow > 1 uruchomienia wszystkich przebiegów trafiają od razu do wspólnej puli,
+    # a procesy robocze dostają każdy graf raz (inicjalizuj_proces). Wyniki są zbierane przebieg po
+    # przebiegu i po każdym zapisywane do sciezka_wyjscia, więc przerwana partia zostawia gotowe przebiegi.
+    # Z katalog_punktow i katalog_logow każdy przebieg dostaje w nich podkatalog nazwa_przebiegu.
+    # Z baza (ścieżka bazy SQLite) każdy gotowy przebieg jest dopisywany do bazy wyników zamiast do pliku.
+    # Zwraca słownik w formacie pliku wyników partii.
+
+    ustawienia = manifest["ustawienia"]
+    if liczba_procesow > 1 and (ustawienia.get("wyspy") or ustawienia.get("stan_ustalony")):
+        raise ValueError("Model wyspowy i stan ustalony same tworzą procesy; uruchom partię z jednym procesem")
+    if katalog_punktow and ustawienia.get("stan_ustalony"):
+        raise ValueError("Stan ustalony nie zapisuje stanu uruchomień; uruchom partię bez punktów kontrolnych")
+
+    grafy = {}
+    for sciezka, _ in manifest["przebiegi"]:
+        if sciezka not in grafy:
+            grafy[sciezka] = wczytaj_graf_z_pliku(sciezka)
+
+    zestawy_parametrow = manifest["zestawy_parametrow"]
+    podstawowe_parametry = manifest["podstawowe_parametry"]
+    liczba_uruchomien = manifest["liczba_uruchomien"]
+
+    zadania_przebiegow = []
+    for sciezka, liczba_kolorow in manifest["przebiegi"]:
+        nazwa = nazwa_przebiegu(sciezka, liczba_kolorow)
+        katalogi = {}
+        if katalog_punktow:
+            katalogi["katalog_punktow"] = os.path.join(katalog_punktow, nazwa)
+        if katalog_logow:
+            katalogi["katalog_logow"] = os.path.join(katalog_logow, nazwa)
+        zadania_przebiegow.append(zadania_eksperymentu(
+            grafy[sciezka], liczba_kolorow, zestawy_parametrow, podstawowe_parametry, liczba_uruchomien,
+            manifest["ziarno"], format_logu=format_logu, klucz_grafu=sciezka, **katalogi, **ustawienia))
+
+    polaczenie = None
+    if baza:
+        from baza_wynikow import dodaj_eksperyment, otworz_baze
+        polaczenie = otworz_baze(baza)
+
+    pula = None
+    if liczba_procesow > 1:
+        pula = ProcessPoolExecutor(max_workers=liczba_procesow, initializer=inicjalizuj_proces, initargs=(grafy,))
+        przyszle = [[pula.submit(wykonaj_uruchomienie, zadanie) for zadanie in zadania]
+                    for zadania in zadania_przebiegow]
+        wyniki_przebiegow = [(przyszly.result() for przyszly in lista) for lista in przyszle]
+    else:
+        wyniki_przebiegow = [(wykonaj_uruchomienie(zadanie, grafy[zadanie["graf"]]) for zadanie in zadania)
+                             for zadania in zadania_przebiegow]
+
+    partia = {
+        "info_partii": {
+            "liczba_przebiegow": len(manifest["przebiegi"]),
+            "liczba_uruchomien_na_zestaw": liczba_uruchomien,
+            "zestawy_parametrow": zestawy_parametrow,
+            "podstawowe_parametry": podstawowe_parametry,
+            "ustawienia": ustawienia,
+            "ziarno": manifest["ziarno"],
+            "data": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "eksperymenty": []
+    }
+
+    try:
+        for (sciezka, liczba_kolorow), wyniki_uruchomien in zip(manifest["przebiegi"], wyniki_przebiegow):
+            graf = grafy[sciezka]
+            print(f"\n===== {sciezka}, k={liczba_kolorow} =====")
+            wyniki_strategii = podsumuj_eksperyment(zestawy_parametrow, liczba_uruchomien,
+                                                    podstawowe_parametry["liczba_generacji"], wyniki_uruchomien)
+
+            # Każdy wpis ma format pliku wyników main.py (wyniki.py, wynik_export.py)
+            eksperyment = {
+                "info_eksperymentu": {
+                    "graf": sciezka,
+                    "liczba_wierzcholkow": graf["liczba_wierzcholkow"],
+                    "liczba_krawedzi": len(graf["krawedzie"]),
+                    "liczba_kolorow": liczba_kolorow,
+                    "ograniczenie_kolorow": graf.get("ograniczenie_kolorow"),
+                    "liczba_uruchomien_na_zestaw": liczba_uruchomien,
+                    "rozmiar_populacji": podstawowe_parametry["rozmiar_populacji"],
+                    "liczba_generacji": podstawowe_parametry["liczba_generacji"],
+                    **ustawienia,
+                    "ziarno": manifest["ziarno"]
+                },
+                "wyniki_strategii": wyniki_strategii
+            }
+            partia["eksperymenty"].append(eksperyment)
+            if polaczenie is not None:
+                dodaj_eksperyment(polaczenie, eksperyment)
+            else:
+                zapisz_atomowo(sciezka_wyjscia, partia, jako_json=True)
+    finally:
+        if pula is not None:
+            pula.shutdown(cancel_futures=True)
+        if polaczenie is not None:
+            polaczenie.close()
+
+    return partia
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Partia eksperymentów: wiele grafów i liczb kolorów w jednym procesie.")
+    parser.add_argument("manifest", type=str,
+                        help="Plik JSON z listą grafów, liczb kolorów i parametrów (opis w nagłówku modułu)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Liczba procesów wspólnej puli dla wszystkich uruchomień (default: 1)")
+    parser.add_argument("-o", "--wyjscie", type=str, default=None,
+                        help="Plik wyników zbiorczych (default: wyniki/partia_<manifest>.json)")
+    parser.add_argument("--punkty-kontrolne", type=str, default=None, metavar="KATALOG",
+                        help="Zapisuj stan uruchomień do KATALOG/<graf>_<skrót ścieżki>_k<kolory>; "
+                             "ponowne uruchomienie wznawia partię")
+    parser.add_argument("--log-generacji", type=str, default=None, metavar="KATALOG",
+                        help="Zapisuj dane każdej generacji do KATALOG/<graf>_<skrót ścieżki>_k<kolory>")
+    parser.add_argument("--format-logu", choices=["jsonl", "csv"], default="jsonl",
+                        help="Format plików z --log-generacji (default: jsonl)")
+    parser.add_argument("--ziarno", type=int, default=None,
+                        help="Ziarno bazowe; nadpisuje ziarno z manifestu (default: z manifestu albo losowe)")
+    parser.add_argument("--baza", type=str, nargs="?", const="wyniki/wyniki.sqlite", default=None, metavar="PLIK",
+                        help="Dopisuj wyniki do wspólnej bazy SQLite (baza_wynikow.py) zamiast do pliku -o "
+                             "(default PLIK: wyniki/wyniki.sqlite)")
+
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers musi być dodatnie")
+
+    try:
+        manifest = wczytaj_manifest(args.manifest)
+    except (OSError, json.JSONDecodeError, ValueError) as e:
+        print(f"Błąd manifestu: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.ziarno is not None:
+        manifest["ziarno"] = args.ziarno
+    if manifest["ziarno"] is None:
+        manifest["ziarno"] = random.SystemRandom().randrange(2**32)
+
+    sciezka_wyjscia = args.wyjscie
+    if sciezka_wyjscia is None:
+        os.makedirs(KATALOG_WYNIKOW, exist_ok=True)
+        nazwa_manifestu = os.path.splitext(os.path.basename(args.manifest))[0]
+        sciezka_wyjscia = os.path.join(KATALOG_WYNIKOW, f"partia_{nazwa_manifestu}.json")
+
+    print(f"Partia: {len(manifest['przebiegi'])} przebiegów, ziarno: {manifest['ziarno']}, procesy: {args.workers}")
+    try:
+        uruchom_partie(manifest, sciezka_wyjscia, args.workers, katalog_punktow=args.punkty_kontrolne,
+                       katalog_logow=args.log_generacji, format_logu=args.format_logu, baza=args.baza)
+    except ValueError as e:
+        print(f"Błąd: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"\nPomyślnie zapisano wyniki do {'bazy: ' + args.baza if args.baza else 'pliku: ' + sciezka_wyjscia}")
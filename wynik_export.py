@@ -1,20 +1,45 @@
 import json
 import argparse
+import hashlib
+import glob
 import sys
 import os
-import matplotlib.pyplot as plt
-
-# Sprawdzenie, czy biblioteka jest zainstalowana
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    print("Błąd: Wymagana biblioteka 'matplotlib' nie jest zainstalowana.", file=sys.stderr)
-    print("Uruchom: pip install matplotlib", file=sys.stderr)
-    sys.exit(1)
 
 # === NOWA ZMIENNA: Katalog wyjściowy ===
 IMG_DIR = "img"
 
+# Katalog z plikami wyników przeglądany przez --katalog
+WYNIKI_DIR = "wyniki"
+
+# Plik w IMG_DIR ze skrótami SHA-256 plików wyników, z których powstały obrazy
+PLIK_MANIFESTU = ".manifest_eksportu.json"
+
+# Zmiana wyglądu rysunków wymaga zwiększenia wersji, żeby eksport nie pominął starych obrazów
+WERSJA_RYSUNKOW = 2
+
+# Rozdzielczość zapisywanych obrazów
+DPI = 200
+
+
+def zaladuj_matplotlib():
+    """Importuje matplotlib przy pierwszym rysunku i zwraca (Figure, FigureCanvasAgg).
+
+    Import kosztuje ok. 1 s, więc --help, błędy odczytu i eksport bez zmienionych plików go pomijają.
+    Backend Agg jest wybierany przed importem, bo eksport nigdy nie otwiera okien.
+    Rysunki powstają przez obiektowe API (Figure + płótno Agg), bez maszyny stanów pyplot,
+    więc działają tak samo w procesach roboczych.
+    """
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+    except ImportError:
+        print("Błąd: Wymagana biblioteka 'matplotlib' nie jest zainstalowana.", file=sys.stderr)
+        print("Uruchom: pip install matplotlib", file=sys.stderr)
+        sys.exit(1)
+    return Figure, FigureCanvasAgg
+
 def wczytaj_wyniki(filepath):
     """Wczytuje plik JSON z wynikami."""
     try:
@@ -29,12 +54,12 @@ def wczytaj_wyniki(filepath):
         sys.exit(1)
 
 def generuj_okno_tabeli(data, output_filepath): # <-- ZMIANA: Dodany argument
-    """Tworzy i zapisuje obraz tabeli z wynikami."""
+    """Tworzy i zapisuje obraz tabeli z wynikami. Zwraca True, gdy obraz został zapisany."""
     
     strategie = data.get("wyniki_strategii", [])
     if not strategie:
         print("Brak wyników strategii do wyświetlenia w tabeli.", file=sys.stderr)
-        return
+        return False
 
     # Wczytanie danych do tabeli
     col_labels = ["Nazwa Strategii", "PK", "PM", "Najlepszy Wynik", "Śr. Konfliktów"]
@@ -70,8 +95,11 @@ def generuj_okno_tabeli(data, output_filepath): # <-- ZMIANA: Dodany argument
         f"{info.get('liczba_uruchomien_na_zestaw')} uruchomień/zestaw"
     )
 
-    # Stworzenie okna dla tabeli
-    fig_table, ax_table = plt.subplots(figsize=(12, 4)) # Rozmiar okna
+    # Stworzenie figury dla tabeli
+    Figure, FigureCanvasAgg = zaladuj_matplotlib()
+    fig_table = Figure(figsize=(12, 4)) # Rozmiar okna
+    FigureCanvasAgg(fig_table)
+    ax_table = fig_table.subplots()
     ax_table.axis('tight')
     ax_table.axis('off')
 
@@ -98,88 +126,259 @@ def generuj_okno_tabeli(data, output_filepath): # <-- ZMIANA: Dodany argument
 
     # === ZMIANA: Zapis do pliku zamiast pokazywania ===
     try:
-        fig_table.savefig(output_filepath, bbox_inches='tight', dpi=200)
+        fig_table.savefig(output_filepath, bbox_inches='tight', dpi=DPI)
         print(f"✅ Pomyślnie zapisano tabelę: {output_filepath}")
+        return True
     except Exception as e:
         print(f"❌ Błąd podczas zapisu tabeli: {e}", file=sys.stderr)
-    
-    plt.close(fig_table) # Zamknij figurę, aby zwolnić pamięć
+        return False
 
 
 def generuj_wykres_zbieznosci(data, output_filepath): # <-- ZMIANA: Dodany argument
-    """Tworzy i zapisuje wykres liniowy zbieżności."""
+    """Tworzy i zapisuje wykres liniowy zbieżności. Zwraca True, gdy wykres został zapisany."""
     
     strategie = data.get("wyniki_strategii", [])
     if not strategie:
         print("Brak danych do wygenerowania wykresu.", file=sys.stderr)
-        return
+        return False
+
+    # Tworzenie figury dla wykresu
+    Figure, FigureCanvasAgg = zaladuj_matplotlib()
+    fig = Figure(figsize=(14, 8))
+    FigureCanvasAgg(fig)
+    ax = fig.subplots()
+
+    # Długie historie są rysowane z poziomu o kubełku na piksel szerokości osi
+    from historia_zbieznosci import krzywa_do_wykresu
+    szerokosc = int(ax.get_position().width * fig.get_figwidth() * DPI)
 
-    # Tworzenie okna dla wykresu
-    plt.figure(figsize=(14, 8))
-    
     for s in strategie:
-        historia = s.get("srednia_historia_zbieznosci")
-        if historia:
-            plt.plot(historia, label=f"{s.get('nazwa')} (PK={s.get('pk')}, PM={s.get('pm')})", linewidth=2)
+        krzywa = krzywa_do_wykresu(s, szerokosc)
+        if krzywa:
+            x, srednia, minimum, maksimum = krzywa
+            linia, = ax.plot(x, srednia, label=f"{s.get('nazwa')} (PK={s.get('pk')}, PM={s.get('pm')})", linewidth=2)
+            if minimum is not None:
+                # Zakres średniej w kubełku, żeby krótkie skoki krzywej nie znikały
+                ax.fill_between(x, minimum, maksimum, color=linia.get_color(), alpha=0.3, linewidth=0)
 
     # Dodanie info
     info = data.get("info_eksperymentu", {})
     graf_name = os.path.basename(info.get('graf', ''))
     title = f"Zbieżność Algorytmu dla Grafu: {graf_name}\n({info.get('liczba_wierzcholkow')} wierzchołków, {info.get('liczba_kolorow')} kolorów)"
     
-    plt.title(title, fontsize=16)
-    plt.xlabel("Numer Generacji", fontsize=12)
-    plt.ylabel("Średnia liczba konfliktów", fontsize=12)
-    plt.legend(loc='upper right', fontsize=10)
-    plt.grid(True, which='both', linestyle='--', linewidth=0.5)
-    plt.minorticks_on()
-    plt.tight_layout()
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel("Numer Generacji", fontsize=12)
+    ax.set_ylabel("Średnia liczba konfliktów", fontsize=12)
+    ax.legend(loc='upper right', fontsize=10)
+    ax.grid(True, which='both', linestyle='--', linewidth=0.5)
+    ax.minorticks_on()
+    fig.tight_layout()
 
     # === ZMIANA: Zapis do pliku zamiast pokazywania ===
     try:
-        plt.savefig(output_filepath, dpi=200)
+        fig.savefig(output_filepath, dpi=DPI)
         print(f"✅ Pomyślnie zapisano wykres: {output_filepath}")
+        return True
     except Exception as e:
         print(f"❌ Błąd podczas zapisu wykresu: {e}", file=sys.stderr)
+        return False
+
+
+def nazwy_obrazow(nazwa_wynikow):
+    """Nazwy plików tabeli i wykresu dla pliku wyników, np. "wyniki_graph_1_k3" -> "tabela_graph_1_k3.png"."""
+    if nazwa_wynikow.startswith("wyniki_"):
+        nazwa_wynikow = nazwa_wynikow[len("wyniki_"):]
+    return f"tabela_{nazwa_wynikow}.png", f"wykres_{nazwa_wynikow}.png"
+
+
+def eksperymenty_z_pliku(dane, nazwa_pliku):
+    """Lista par (nazwa, dane eksperymentu) z pliku wyników.
+
+    Plik main.py to jeden eksperyment; plik partii z uruchom_wsadowo.py ("eksperymenty")
+    daje po jednym eksperymencie na parę (graf, liczba kolorów).
+    """
+    nazwa = os.path.splitext(nazwa_pliku)[0]
+    if "eksperymenty" not in dane:
+        return [(nazwa, dane)]
+    eksperymenty = []
+    for eksperyment in dane["eksperymenty"]:
+        info = eksperyment.get("info_eksperymentu", {})
+        graf = os.path.splitext(os.path.basename(info.get("graf", "")))[0]
+        eksperymenty.append((f"{nazwa}_{graf}_k{info.get('liczba_kolorow')}", eksperyment))
+    return eksperymenty
+
+
+def eksportuj_plik(sciezka_wynikow, katalog_img):
+    """Generuje tabele i wykresy dla jednego pliku wyników.
+
+    Wykonywane również w procesach roboczych eksportuj_katalog. Zwraca (listę zapisanych obrazów,
+    czy wszystkie obrazy się udały); błąd odczytu pliku jest zgłaszany wyjątkiem.
+    """
+    with open(sciezka_wynikow, 'r') as f:
+        dane = json.load(f)
+
+    obrazy = []
+    wszystkie = True
+    for nazwa, eksperyment in eksperymenty_z_pliku(dane, os.path.basename(sciezka_wynikow)):
+        tabela, wykres = (os.path.join(katalog_img, plik) for plik in nazwy_obrazow(nazwa))
+        for generuj, sciezka_obrazu in ((generuj_okno_tabeli, tabela), (generuj_wykres_zbieznosci, wykres)):
+            if generuj(eksperyment, sciezka_obrazu):
+                obrazy.append(sciezka_obrazu)
+            else:
+                wszystkie = False
+    return obrazy, wszystkie
 
-    plt.close() # Zamknij bieżącą figurę
+
+def skrot_pliku(sciezka):
+    """Skrót SHA-256 zawartości pliku (zmiana daty modyfikacji bez zmiany treści nie wymusza eksportu)."""
+    skrot = hashlib.sha256()
+    with open(sciezka, 'rb') as f:
+        for blok in iter(lambda: f.read(1 << 20), b""):
+            skrot.update(blok)
+    return skrot.hexdigest()
+
+
+def wczytaj_manifest(katalog_img):
+    """Wczytuje manifest eksportu; brak, uszkodzenie albo inna WERSJA_RYSUNKOW dają pusty manifest."""
+    try:
+        with open(os.path.join(katalog_img, PLIK_MANIFESTU), 'r') as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if manifest.get("wersja") != WERSJA_RYSUNKOW:
+        return {}
+    return manifest.get("pliki", {})
+
+
+def zapisz_manifest(katalog_img, pliki):
+    """Zapisuje manifest przez plik tymczasowy, żeby przerwany eksport nie zostawił uszkodzonego pliku."""
+    sciezka = os.path.join(katalog_img, PLIK_MANIFESTU)
+    with open(sciezka + ".tmp", 'w') as f:
+        json.dump({"wersja": WERSJA_RYSUNKOW, "pliki": pliki}, f, indent=4)
+    os.replace(sciezka + ".tmp", sciezka)
+
+
+def eksportuj_katalog(katalog, katalog_img=IMG_DIR, liczba_procesow=1, wymus=False):
+    """Eksport zbiorczy wszystkich plików wyników (wyniki_*.json, partia_*.json) z katalogu.
+
+    Plik jest pomijany, gdy skrót jego zawartości zgadza się z manifestem w katalog_img
+    i wszystkie obrazy z poprzedniego eksportu nadal istnieją (wymus=True generuje wszystko).
+    Pozostałe pliki są rysowane w puli liczba_procesow procesów, więc matplotlib jest importowany
+    raz na proces, a nie raz na plik. Manifest jest zapisywany po każdym gotowym pliku.
+    Błąd w jednym pliku (także niepoprawna struktura JSON) jest wypisywany ze ścieżką
+    i nie przerywa eksportu pozostałych.
+    Zwraca (liczba wygenerowanych, liczba pominiętych, liczba błędów).
+    """
+    os.makedirs(katalog_img, exist_ok=True)
+    sciezki = sorted(glob.glob(os.path.join(katalog, "wyniki_*.json")) +
+                     glob.glob(os.path.join(katalog, "partia_*.json")))
+
+    poprzedni = {} if wymus else wczytaj_manifest(katalog_img)
+    manifest = {}
+    do_eksportu = {}
+    for sciezka in sciezki:
+        nazwa = os.path.basename(sciezka)
+        skrot = skrot_pliku(sciezka)
+        wpis = poprzedni.get(nazwa)
+        if wpis and wpis["skrot"] == skrot and all(os.path.exists(obraz) for obraz in wpis["obrazy"]):
+            manifest[nazwa] = wpis
+        else:
+            do_eksportu[sciezka] = skrot
+
+    pominiete = len(sciezki) - len(do_eksportu)
+    print(f"Pliki wyników: {len(sciezki)}, do eksportu: {len(do_eksportu)}, bez zmian: {pominiete}")
+
+    bledy = 0
+
+    def zapamietaj(sciezka, wynik):
+        nonlocal bledy
+        obrazy, wszystkie = wynik
+        if wszystkie:
+            manifest[os.path.basename(sciezka)] = {"skrot": do_eksportu[sciezka], "obrazy": obrazy}
+            zapisz_manifest(katalog_img, manifest)
+        else:
+            bledy += 1
+            print(f"❌ Nie wszystkie obrazy z pliku {sciezka} zostały wygenerowane", file=sys.stderr)
+
+    def zglos_blad(sciezka, e):
+        nonlocal bledy
+        bledy += 1
+        print(f"❌ Błąd eksportu pliku {sciezka}: {type(e).__name__}: {e}", file=sys.stderr)
+
+    if liczba_procesow > 1 and len(do_eksportu) > 1:
+        # Import przed utworzeniem puli: procesy potomne (fork) dziedziczą już zaimportowany matplotlib
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        zaladuj_matplotlib()
+        with ProcessPoolExecutor(max_workers=min(liczba_procesow, len(do_eksportu))) as pula:
+            przyszle = {pula.submit(eksportuj_plik, sciezka, katalog_img): sciezka for sciezka in do_eksportu}
+            for przyszly in as_completed(przyszle):
+                try:
+                    wynik = przyszly.result()
+                except Exception as e:
+                    zglos_blad(przyszle[przyszly], e)
+                    continue
+                zapamietaj(przyszle[przyszly], wynik)
+    else:
+        for sciezka in do_eksportu:
+            try:
+                wynik = eksportuj_plik(sciezka, katalog_img)
+            except Exception as e:
+                zglos_blad(sciezka, e)
+                continue
+            zapamietaj(sciezka, wynik)
+
+    # Manifest bez wpisów dla plików wyników, których już nie ma w katalogu
+    zapisz_manifest(katalog_img, manifest)
+    return len(do_eksportu) - bledy, pominiete, bledy
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generator wizualizacji z plików wyników GA.")
-    parser.add_argument("sciezka_do_wynikow", type=str, 
+    parser.add_argument("sciezka_do_wynikow", type=str, nargs="?", default=None,
                         help="Ścieżka do pliku .json z wynikami (np. wyniki/wyniki_graph_1_k3.json)")
-    
+    parser.add_argument("--katalog", type=str, nargs="?", const=WYNIKI_DIR, default=None,
+                        help=f"Eksport zbiorczy wszystkich plików wyników z katalogu (default: {WYNIKI_DIR}); "
+                             "pliki bez zmian od ostatniego eksportu są pomijane")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Liczba procesów rysujących przy --katalog (default: liczba rdzeni)")
+    parser.add_argument("--wymus", action="store_true",
+                        help="Przy --katalog generuj wszystkie obrazy, także dla niezmienionych plików")
+    parser.add_argument("--img", type=str, default=IMG_DIR,
+                        help=f"Katalog na obrazy (default: {IMG_DIR})")
+
     args = parser.parse_args()
+    if (args.sciezka_do_wynikow is None) == (args.katalog is None):
+        parser.error("podaj plik wyników albo --katalog")
+    if args.workers < 1:
+        parser.error("--workers musi być dodatnie")
+
+    if args.katalog is not None:
+        if not os.path.isdir(args.katalog):
+            print(f"Błąd: Nie znaleziono katalogu: {args.katalog}", file=sys.stderr)
+            sys.exit(1)
+        wygenerowane, pominiete, bledy = eksportuj_katalog(args.katalog, args.img, args.workers, args.wymus)
+        print(f"\nGotowe. Wygenerowano: {wygenerowane}, pominięto: {pominiete}, błędy: {bledy}. "
+              f"Obrazy są w katalogu '{args.img}/'.")
+        sys.exit(1 if bledy else 0)
 
     # Wczytanie danych
     dane = wczytaj_wyniki(args.sciezka_do_wynikow)
 
     # === ZMIANA: Przygotowanie katalogu i nazw plików ===
     
-    # 1. Upewnij się, że katalog 'img/' istnieje
-    os.makedirs(IMG_DIR, exist_ok=True)
+    # 1. Upewnij się, że katalog na obrazy istnieje
+    os.makedirs(args.img, exist_ok=True)
     
     # 2. Stwórz nazwy plików wyjściowych na podstawie pliku wejściowego
-    # np. "wyniki/wyniki_graph_1_k3.json" -> "wyniki_graph_1_k3"
+    # np. "wyniki/wyniki_graph_1_k3.json" -> "tabela_graph_1_k3.png", "wykres_graph_1_k3.png";
+    # plik partii z uruchom_wsadowo.py daje parę obrazów na każdy eksperyment
     base_filename = os.path.basename(args.sciezka_do_wynikow)
-    name_part = os.path.splitext(base_filename)[0]
-    
-    # np. "wyniki_graph_1_k3" -> "tabela_graph_1_k3.png"
-    tabela_filename = name_part.replace("wyniki_", "tabela_") + ".png"
-    wykres_filename = name_part.replace("wyniki_", "wykres_") + ".png"
-    
-    # Stwórz pełne ścieżki zapisu
-    tabela_output_path = os.path.join(IMG_DIR, tabela_filename)
-    wykres_output_path = os.path.join(IMG_DIR, wykres_filename)
     
-    # === ZMIANA: Wywołanie funkcji z nowymi ścieżkami ===
-    
-    # 3. Generuj i zapisz tabelę
-    generuj_okno_tabeli(dane, tabela_output_path)
-
-    # 4. Generuj i zapisz wykres
-    generuj_wykres_zbieznosci(dane, wykres_output_path)
+    # 3. Generuj i zapisz tabele i wykresy
+    for nazwa, eksperyment in eksperymenty_z_pliku(dane, base_filename):
+        tabela_filename, wykres_filename = nazwy_obrazow(nazwa)
+        generuj_okno_tabeli(eksperyment, os.path.join(args.img, tabela_filename))
+        generuj_wykres_zbieznosci(eksperyment, os.path.join(args.img, wykres_filename))
 
-    # 5. Zakończ
-    print(f"\nGotowe. Obrazy zostały zapisane w katalogu '{IMG_DIR}/'.")
\ No newline at end of file
+    # 4. Zakończ
+    print(f"\nGotowe. Obrazy zostały zapisane w katalogu '{args.img}/'.")
@@ -2,14 +2,20 @@ import json
 import argparse
 import sys
 import os
-import matplotlib.pyplot as plt
 
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    print("Błąd: Wymagana biblioteka 'matplotlib' nie jest zainstalowana.", file=sys.stderr)
-    print("Uruchom: pip install matplotlib", file=sys.stderr)
-    sys.exit(1)
+
+def zaladuj_pyplot():
+    """Importuje matplotlib.pyplot dopiero przed rysowaniem.
+
+    --help i błędy odczytu pliku nie płacą za import matplotlib (ok. 1 s).
+    """
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("Błąd: Wymagana biblioteka 'matplotlib' nie jest zainstalowana.", file=sys.stderr)
+        print("Uruchom: pip install matplotlib", file=sys.stderr)
+        sys.exit(1)
+    return plt
 
 
 def wczytaj_wyniki(filepath):
@@ -68,6 +74,7 @@ def generuj_okno_tabeli(data):
     )
 
     # Stworzenie okna dla tabeli
+    plt = zaladuj_pyplot()
     fig_table, ax_table = plt.subplots(figsize=(12, 4)) # Rozmiar okna
     ax_table.axis('tight')
     ax_table.axis('off')
@@ -103,12 +110,21 @@ def generuj_wykres_zbieznosci(data):
         return
 
     # Tworzenie okna dla wykresu
-    plt.figure(figsize=(14, 8))
-    
+    plt = zaladuj_pyplot()
+    fig = plt.figure(figsize=(14, 8))
+
+    # Długie historie są rysowane z poziomu o kubełku na piksel szerokości osi
+    from historia_zbieznosci import krzywa_do_wykresu
+    szerokosc = int(plt.gca().get_position().width * fig.get_figwidth() * fig.dpi)
+
     for s in strategie:
-        historia = s.get("srednia_historia_zbieznosci")
-        if historia:
-            plt.plot(historia, label=f"{s.get('nazwa')} (PK={s.get('pk')}, PM={s.get('pm')})", linewidth=2)
+        krzywa = krzywa_do_wykresu(s, szerokosc)
+        if krzywa:
+            x, srednia, minimum, maksimum = krzywa
+            linia, = plt.plot(x, srednia, label=f"{s.get('nazwa')} (PK={s.get('pk')}, PM={s.get('pm')})", linewidth=2)
+            if minimum is not None:
+                # Zakres średniej w kubełku, żeby krótkie skoki krzywej nie znikały
+                plt.fill_between(x, minimum, maksimum, color=linia.get_color(), alpha=0.3, linewidth=0)
 
     # Dodanie info
     info = data.get("info_eksperymentu", {})
@@ -142,4 +158,4 @@ if __name__ == "__main__":
 
     # Otwieranie okien
     print("Otwieranie okien z wynikami...")
-    plt.show()
\ No newline at end of file
+    zaladuj_pyplot().show()
\ No newline at end of file
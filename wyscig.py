@@ -0,0 +1,269 @@
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import numpy as np
+
+from main import (DOMYSLNA_LICZBA_URUCHOMIEN, DOMYSLNE_PODSTAWOWE_PARAMETRY, DOMYSLNE_ZESTAWY_PARAMETROW,
+                  KATALOG_WYNIKOW, inicjalizuj_proces, wczytaj_graf_z_pliku, wykonaj_uruchomienie,
+                  zadania_eksperymentu)
+
+# Wyścig konfiguracji (racing / successive halving) zamiast pełnego przeglądu zestawów parametrów.
+# Każda runda uruchamia wszystkie pozostałe konfiguracje (pk, pm, rozmiar turnieju) po liczba_uruchomien
+# razy z krótkim budżetem generacji. Konfiguracje istotnie gorsze od najlepszej (jednostronny test
+# Manna-Whitneya na wynikach uruchomień) odpadają, a z reszty przechodzi co najwyżej 1/eta najlepszych.
+# Następna runda ma eta razy więcej generacji, aż do pełnego liczba_generacji.
+# Rundy używają nowych uruchomień: wyniki przy różnych budżetach generacji nie są porównywalne.
+#
+# Wynik uruchomienia (mniejszy lepszy): liczba konfliktów, a dla kolorowania bez konfliktów
+# ułamek budżetu zużyty do jego znalezienia (w [0, 1)), więc szybsze rozwiązanie wygrywa z wolniejszym.
+
+DOMYSLNE_PK = (0.1, 0.5, 0.9, 1.0)
+DOMYSLNE_PM = (0.0, 0.01, 0.05, 0.1, 0.2)
+DOMYSLNE_TURNIEJE = (2, 3, 5)
+
+def siatka_konfiguracji(lista_pk, lista_pm, lista_turniejow):
+
+    # Wszystkie kombinacje parametrów jako zestawy w formacie zestawy_parametrow
+    # (z dodatkowym kluczem "rozmiar_turnieju", zob. zadania_eksperymentu).
+
+    return [{"nazwa": f"PK={pk} PM={pm} T={turniej}", "p_krzyzowania": pk, "p_mutacji": pm,
+             "rozmiar_turnieju": turniej}
+            for pk in lista_pk for pm in lista_pm for turniej in lista_turniejow]
+
+def rangi_srednie(wartosci):
+
+    # Rangi (od 1) z remisami zastąpionymi średnią rangą grupy oraz liczebności grup remisów.
+
+    porzadek = np.argsort(wartosci, kind="mergesort")
+    posortowane = wartosci[porzadek]
+    nowa_grupa = np.r_[True, posortowane[1:] != posortowane[:-1]]
+    poczatki = np.flatnonzero(nowa_grupa)
+    konce = np.r_[poczatki[1:], len(wartosci)]
+    rangi = np.empty(len(wartosci))
+    rangi[porzadek] = ((poczatki + konce + 1) / 2)[np.cumsum(nowa_grupa) - 1]
+    return rangi, konce - poczatki
+
+def test_manna_whitneya(a, b):
+
+    # Jednostronny test Manna-Whitneya: p-wartość hipotezy, że wyniki a są stochastycznie większe
+    # (gorsze) od wyników b. Przybliżenie normalne z poprawką na remisy i poprawką ciągłości;
+    # gdy wszystkie wyniki są równe, test niczego nie rozstrzyga i zwraca 1.0.
+
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    n1, n2 = len(a), len(b)
+    n = n1 + n2
+    rangi, remisy = rangi_srednie(np.concatenate([a, b]))
+
+    u = rangi[:n1].sum() - n1 * (n1 + 1) / 2
+    wariancja = n1 * n2 / 12 * ((n + 1) - (remisy ** 3 - remisy).sum() / (n * (n - 1)))
+    if wariancja <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(wariancja)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+def wynik_uruchomienia(konflikty, historia, liczba_generacji):
+
+    # Wynik uruchomienia do porównań w wyścigu (opis na początku modułu).
+
+    if konflikty > 0:
+        return float(konflikty)
+    return historia.index(0) / liczba_generacji
+
+def wyscig(graf, liczba_kolorow, konfiguracje, rozmiar_populacji, liczba_generacji, generacje_startowe=25,
+           liczba_uruchomien=5, eta=2, alfa=0.05, ziarno=None, liczba_procesow=1, obserwator=None, **ustawienia):
+
+    # Wyścig konfiguracji (opis na początku modułu). Uruchomienia kończą się po znalezieniu kolorowania
+    # bez konfliktów, więc budżet rozwiązanych uruchomień jest zwracany wcześniej.
+    # ustawienia to pozostałe argumenty zadania_eksperymentu (silnik, operatory, adaptacja_mutacji itd.);
+    # obserwator (wywoływalny) dostaje słownik z podsumowaniem każdej rundy.
+    # Zwraca słownik ze zwycięzcą, rundami, liczbą wykonanych ocen i budżetem pełnego przeglądu
+    # (wszystkie konfiguracje, DOMYSLNA_LICZBA_URUCHOMIEN uruchomień po liczba_generacji generacji).
+
+    if eta < 2 or liczba_uruchomien < 2 or generacje_startowe < 1:
+        raise ValueError("Wyścig wymaga eta >= 2, liczba_uruchomien >= 2 i generacje_startowe >= 1")
+    if not konfiguracje:
+        raise ValueError("Brak konfiguracji do wyścigu")
+    if ziarno is None:
+        ziarno = random.SystemRandom().randrange(2**32)
+    kryteria_stopu = {**(ustawienia.pop("kryteria_stopu", None) or {}), "zero_konfliktow": True}
+
+    pula = None
+    if liczba_procesow > 1:
+        # Jedna pula dla wszystkich rund: graf trafia do procesów raz
+        from concurrent.futures import ProcessPoolExecutor
+        pula = ProcessPoolExecutor(max_workers=liczba_procesow, initializer=inicjalizuj_proces,
+                                   initargs=({None: graf},))
+
+    pozostale = list(konfiguracje)
+    rundy = []
+    liczba_ocen = 0
+    generacje = min(generacje_startowe, liczba_generacji)
+    try:
+        while True:
+            # Ziarno rundy zależy od ziarna wyścigu i numeru rundy, nie od tego, kto odpadł wcześniej
+            ziarno_rundy = int(np.random.SeedSequence([ziarno, len(rundy)]).generate_state(1)[0])
+            zadania = zadania_eksperymentu(
+                graf, liczba_kolorow, pozostale,
+                {"rozmiar_populacji": rozmiar_populacji, "liczba_generacji": generacje,
+                 "rozmiar_turnieju": DOMYSLNE_PODSTAWOWE_PARAMETRY["rozmiar_turnieju"]},
+                liczba_uruchomien, ziarno_rundy, kryteria_stopu=kryteria_stopu, **ustawienia)
+            if pula is not None:
+                wyniki_zadan = list(pula.map(wykonaj_uruchomienie, zadania))
+            else:
+                wyniki_zadan = [wykonaj_uruchomienie(zadanie, graf) for zadanie in zadania]
+
+            wyniki = [[] for _ in pozostale]
+            for zadanie, (_, konflikty, historia, _) in zip(zadania, wyniki_zadan):
+                wyniki[zadanie["zestaw"]].append(wynik_uruchomienia(konflikty, historia, generacje))
+                # Populacja startowa i jedno pokolenie dzieci na każdą wykonaną generację
+                wykonane = historia.index(0) if konflikty == 0 else generacje - 1
+                liczba_ocen += rozmiar_populacji * (wykonane + 1)
+
+            srednie = [float(np.mean(w)) for w in wyniki]
+            najlepsza = int(np.argmin(srednie))
+            p_wartosci = [1.0 if i == najlepsza else test_manna_whitneya(w, wyniki[najlepsza])
+                          for i, w in enumerate(wyniki)]
+
+            # Najpierw odpadają konfiguracje istotnie gorsze, potem połowienie po średnim wyniku
+            zostaja = [i for i in range(len(pozostale)) if p_wartosci[i] >= alfa]
+            limit = math.ceil(len(pozostale) / eta)
+            zostaja = sorted(zostaja, key=srednie.__getitem__)[:limit]
+
+            runda = {
+                "generacje": generacje,
+                "konfiguracje": [{
+                    "nazwa": konfiguracja["nazwa"],
+                    "srednia_wyniku": round(srednie[i], 4),
+                    "srednia_konfliktow": float(np.mean([w if w >= 1 else 0 for w in wyniki[i]])),
+                    "rozwiazane": sum(w < 1 for w in wyniki[i]),
+                    "p_wartosc": round(p_wartosci[i], 4),
+                    "odpada": None if i in zostaja else ("test" if p_wartosci[i] < alfa else "polowienie")
+                } for i, konfiguracja in enumerate(pozostale)]
+            }
+            rundy.append(runda)
+            if obserwator is not None:
+                obserwator(runda)
+
+            pozostale = [pozostale[i] for i in zostaja]
+            if len(pozostale) == 1 or generacje >= liczba_generacji:
+                break
+            generacje = min(generacje * eta, liczba_generacji)
+    finally:
+        if pula is not None:
+            pula.shutdown(cancel_futures=True)
+
+    return {
+        "zwyciezca": pozostale[0],
+        "zestawy_parametrow": pozostale,
+        "rundy": rundy,
+        "liczba_ocen": liczba_ocen,
+        "budzet_pelnego_przegladu": len(konfiguracje) * DOMYSLNA_LICZBA_URUCHOMIEN * liczba_generacji
+                                    * rozmiar_populacji,
+        "ziarno": ziarno
+    }
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Wyścig konfiguracji parametrów GA z odrzucaniem gorszych "
+                                                 "po krótkich uruchomieniach.")
+    parser.add_argument("sciezka_do_grafu", type=str,
+                        help="Ścieżka do pliku .json lub .gbin z definicją grafu.")
+    parser.add_argument("-k", "--kolory", type=int, default=3,
+                        help="Liczba kolorów (default: 3)")
+    parser.add_argument("--pk", type=float, nargs="+", default=list(DOMYSLNE_PK),
+                        help="Prawdopodobieństwa krzyżowania w siatce konfiguracji")
+    parser.add_argument("--pm", type=float, nargs="+", default=list(DOMYSLNE_PM),
+                        help="Prawdopodobieństwa mutacji w siatce konfiguracji")
+    parser.add_argument("--turnieje", type=int, nargs="+", default=list(DOMYSLNE_TURNIEJE),
+                        help="Rozmiary turnieju w siatce konfiguracji")
+    parser.add_argument("--domyslne", action="store_true",
+                        help="Zamiast siatki ścigaj zestawy parametrów z main.py")
+    parser.add_argument("--generacje-startowe", type=int, default=25,
+                        help="Liczba generacji w pierwszej rundzie (default: 25)")
+    parser.add_argument("--uruchomienia", type=int, default=5,
+                        help="Liczba uruchomień każdej konfiguracji w rundzie (default: 5)")
+    parser.add_argument("--eta", type=int, default=2,
+                        help="Co rundę przechodzi najwyżej 1/eta konfiguracji, a budżet generacji "
+                             "rośnie eta razy (default: 2)")
+    parser.add_argument("--alfa", type=float, default=0.05,
+                        help="Poziom istotności testu Manna-Whitneya (default: 0.05)")
+    parser.add_argument("--silnik", choices=["python", "numpy"], default="python",
+                        help="Implementacja pętli ewolucji (default: python)")
+    parser.add_argument("--adaptacja-mutacji", action="store_true",
+                        help="Zmieniaj PM w trakcie uruchomień (wartości PM konfiguracji są startowe)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Liczba procesów wspólnej puli dla wszystkich rund (default: 1)")
+    parser.add_argument("--ziarno", type=int, default=None,
+                        help="Ziarno wyścigu (default: losowe)")
+    parser.add_argument("-o", "--wyjscie", type=str, default=None,
+                        help="Plik wyników (default: wyniki/wyscig_<graf>_k<kolory>.json)")
+
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers musi być dodatnie")
+    rozmiar_populacji = DOMYSLNE_PODSTAWOWE_PARAMETRY["rozmiar_populacji"]
+    liczba_generacji = DOMYSLNE_PODSTAWOWE_PARAMETRY["liczba_generacji"]
+    if any(not 1 <= t <= rozmiar_populacji for t in args.turnieje):
+        parser.error(f"rozmiary turnieju muszą być w przedziale [1, {rozmiar_populacji}]")
+
+    if args.domyslne:
+        konfiguracje = DOMYSLNE_ZESTAWY_PARAMETROW
+    else:
+        konfiguracje = siatka_konfiguracji(args.pk, args.pm, args.turnieje)
+    ziarno = args.ziarno if args.ziarno is not None else random.SystemRandom().randrange(2**32)
+
+    graf = wczytaj_graf_z_pliku(args.sciezka_do_grafu)
+    print(f"Wyścig: {len(konfiguracje)} konfiguracji, graf {args.sciezka_do_grafu}, k={args.kolory}, "
+          f"ziarno: {ziarno}, procesy: {args.workers}")
+
+    def wypisz_runde(runda):
+        print(f"\n--- Runda: {runda['generacje']} generacji, {len(runda['konfiguracje'])} konfiguracji ---")
+        for konfiguracja in sorted(runda["konfiguracje"], key=lambda k: k["srednia_wyniku"]):
+            print(f"  {konfiguracja['nazwa']:<28} wynik {konfiguracja['srednia_wyniku']:>8.3f}  "
+                  f"rozwiązane {konfiguracja['rozwiazane']}/{args.uruchomienia}  "
+                  f"p={konfiguracja['p_wartosc']:.3f}  {konfiguracja['odpada'] or ''}")
+
+    start = time.perf_counter()
+    try:
+        wynik = wyscig(graf, args.kolory, konfiguracje, rozmiar_populacji, liczba_generacji,
+                       generacje_startowe=args.generacje_startowe, liczba_uruchomien=args.uruchomienia,
+                       eta=args.eta, alfa=args.alfa, ziarno=ziarno, liczba_procesow=args.workers,
+                       obserwator=wypisz_runde, silnik=args.silnik, adaptacja_mutacji=args.adaptacja_mutacji)
+    except ValueError as e:
+        print(f"Błąd: {e}", file=sys.stderr)
+        sys.exit(1)
+    czas = time.perf_counter() - start
+
+    print(f"\nZwycięzca: {wynik['zwyciezca']['nazwa']}")
+    print(f"Oceny: {wynik['liczba_ocen']} ({wynik['liczba_ocen'] / wynik['budzet_pelnego_przegladu']:.1%} "
+          f"budżetu pełnego przeglądu), czas {czas:.1f} s")
+
+    wynik["info_wyscigu"] = {
+        "graf": args.sciezka_do_grafu,
+        "liczba_kolorow": args.kolory,
+        "liczba_konfiguracji": len(konfiguracje),
+        "rozmiar_populacji": rozmiar_populacji,
+        "liczba_generacji": liczba_generacji,
+        "generacje_startowe": args.generacje_startowe,
+        "liczba_uruchomien_w_rundzie": args.uruchomienia,
+        "eta": args.eta,
+        "alfa": args.alfa,
+        "silnik": args.silnik,
+        "adaptacja_mutacji": args.adaptacja_mutacji,
+        "czas_s": round(czas, 2)
+    }
+    sciezka_zapisu = args.wyjscie
+    if sciezka_zapisu is None:
+        nazwa_grafu = os.path.splitext(os.path.basename(args.sciezka_do_grafu))[0]
+        os.makedirs(KATALOG_WYNIKOW, exist_ok=True)
+        sciezka_zapisu = os.path.join(KATALOG_WYNIKOW, f"wyscig_{nazwa_grafu}_k{args.kolory}.json")
+    with open(sciezka_zapisu, 'w') as f:
+        json.dump(wynik, f, indent=4)
+    print(f"Pomyślnie zapisano wyniki do pliku: {sciezka_zapisu}")
+    print("Pole \"zestawy_parametrow\" można wkleić do manifestu uruchom_wsadowo.py.")
@@ -0,0 +1,190 @@
+import random
+import time
+import multiprocessing as mp
+import queue
+import numpy as np
+
+from main import (indeks_sasiedztwa, oblicz_konflikty_populacji, stworz_nowa_populacje, sprawdz_kryteria_stopu,
+                  sprawdz_poprawnosc_kryteriow, tablice_krawedzi, uzupelnij_historie)
+
+TOPOLOGIE = ("pierscien", "pelna")
+
+# Co ile sekund proces główny sprawdza, czy wyspy, na których wynik czeka, jeszcze działają
+INTERWAL_SPRAWDZANIA = 0.5
+
+def sasiedzi_wysp(liczba_wysp, topologia):
+
+    # Zwraca listę wysp docelowych dla migrantów z każdej wyspy.
+    # "pierscien": wyspa i wysyła do i+1, "pelna": każda wyspa wysyła do wszystkich pozostałych.
+
+    if topologia == "pierscien":
+        return [[(i + 1) % liczba_wysp] for i in range(liczba_wysp)]
+    if topologia == "pelna":
+        return [[j for j in range(liczba_wysp) if j != i] for i in range(liczba_wysp)]
+    raise ValueError(f"Nieznana topologia: {topologia}")
+
+def przyjmij_migrantow(populacja, konflikty, migranci):
+
+    # Zastępuje najgorszych osobników wyspy przybyłymi migrantami.
+
+    najgorsze = sorted(range(len(populacja)), key=lambda i: konflikty[i], reverse=True)
+    for indeks, (osobnik, konflikty_osobnika) in zip(najgorsze, migranci):
+        populacja[indeks] = list(osobnik)
+        konflikty[indeks] = konflikty_osobnika
+
+def _proces_wyspy(numer, graf, parametry, ziarno, skrzynki, cele, zdarzenie_stopu, kolejka_wynikow):
+
+    # Ewolucja jednej wyspy w osobnym procesie.
+    # Co interwal_migracji generacji wysyła kopie najlepszych osobników do wysp docelowych
+    # i bez czekania przyjmuje migrantów, którzy zdążyli dotrzeć do jej skrzynki.
+
+    rng = np.random.default_rng(ziarno)
+    czas_startu = time.perf_counter()
+
+    # Migranci niedostarczeni po zakończeniu wyspy mogą przepaść, proces nie czeka na ich wysłanie
+    for skrzynka in skrzynki:
+        skrzynka.cancel_join_thread()
+
+    liczba_kolorow = parametry["liczba_kolorow"]
+    rozmiar_populacji = parametry["rozmiar_populacji"]
+    krawedzie = tablice_krawedzi(graf)
+    indeks = indeks_sasiedztwa(graf)
+
+    populacja = rng.integers(0, liczba_kolorow, size=(rozmiar_populacji, graf["liczba_wierzcholkow"]))
+    konflikty = oblicz_konflikty_populacji(populacja, *krawedzie).tolist()
+    populacja = populacja.tolist()
+    liczba_ocen = rozmiar_populacji
+
+    historia_postepow = []
+    najlepszy_osobnik = None
+    najlepsze_konflikty = None
+    generacje_bez_poprawy = 0
+
+    for generacja in range(parametry["liczba_generacji"]):
+
+        # Migracja (przed oceną, żeby przybysze od razu brali udział w selekcji)
+        if generacja > 0 and generacja % parametry["interwal_migracji"] == 0:
+            kolejnosc = sorted(range(rozmiar_populacji), key=konflikty.__getitem__)
+            migranci = [(populacja[i], konflikty[i]) for i in kolejnosc[:parametry["liczba_migrantow"]]]
+            for cel in cele:
+                skrzynki[cel].put(migranci)
+
+            while True:
+                try:
+                    przybyli = skrzynki[numer].get_nowait()
+                except queue.Empty:
+                    break
+                przyjmij_migrantow(populacja, konflikty, przybyli)
+
+        indeks_najlepszego = min(range(rozmiar_populacji), key=konflikty.__getitem__)
+        if najlepsze_konflikty is None or konflikty[indeks_najlepszego] < najlepsze_konflikty:
+            najlepsze_konflikty = konflikty[indeks_najlepszego]
+            najlepszy_osobnik = list(populacja[indeks_najlepszego])
+            generacje_bez_poprawy = 0
+        else:
+            generacje_bez_poprawy += 1
+        historia_postepow.append(najlepsze_konflikty)
+
+        # Pokolorowanie bez konfliktów na dowolnej wyspie kończy pracę wszystkich wysp
+        if najlepsze_konflikty == 0:
+            zdarzenie_stopu.set()
+        if zdarzenie_stopu.is_set():
+            break
+
+        # Pozostałe kryteria (czas, oceny, stagnacja) dotyczą każdej wyspy osobno
+        if sprawdz_kryteria_stopu(parametry["kryteria_stopu"], najlepsze_konflikty, czas_startu,
+                                  liczba_ocen, generacje_bez_poprawy):
+            break
+
+        przystosowania = [1.0 / (1.0 + k) for k in konflikty]
+        populacja, konflikty = stworz_nowa_populacje(
+            populacja, konflikty, przystosowania, rozmiar_populacji, liczba_kolorow,
+            parametry["p_krzyzowania"], parametry["p_mutacji"], parametry["rozmiar_turnieju"], krawedzie, indeks,
+            rng=rng)
+        liczba_ocen += rozmiar_populacji
+
+    kolejka_wynikow.put((numer, najlepszy_osobnik, najlepsze_konflikty, historia_postepow))
+
+def odbierz_wyniki_wysp(procesy, kolejka_wynikow, zdarzenie_stopu):
+
+    # Odbiera wynik każdej wyspy (przed join(), żeby procesy nie czekały na opróżnienie kolejki).
+    # Czeka po INTERWAL_SPRAWDZANIA sekund i sprawdza, czy wyspy bez wyniku jeszcze żyją: jeśli któraś
+    # zakończyła się błędem, pozostałe są przerywane, a wyjątek zgłaszany w procesie głównym.
+
+    wyniki_wysp = []
+    while len(wyniki_wysp) < len(procesy):
+        try:
+            wyniki_wysp.append(kolejka_wynikow.get(timeout=INTERWAL_SPRAWDZANIA))
+            continue
+        except queue.Empty:
+            pass
+        gotowe = {wynik[0] for wynik in wyniki_wysp}
+        # Wyspa z kodem wyjścia 0 zdążyła wysłać wynik, który jest jeszcze w kolejce
+        bledne = [numer for numer, proces in enumerate(procesy)
+                  if numer not in gotowe and not proces.is_alive() and proces.exitcode != 0]
+        if bledne:
+            zdarzenie_stopu.set()
+            for proces in procesy:
+                if proces.is_alive():
+                    proces.terminate()
+            for proces in procesy:
+                proces.join()
+            kody = ", ".join(f"{numer} (kod {procesy[numer].exitcode})" for numer in bledne)
+            raise RuntimeError(f"Wyspy zakończyły się błędem: {kody}; pozostałe wyspy przerwano")
+    return wyniki_wysp
+
+def uruchom_wyspy(graf, liczba_kolorow, rozmiar_populacji, liczba_generacji, p_krzyzowania, p_mutacji, rozmiar_turnieju,
+                  liczba_wysp=4, interwal_migracji=10, liczba_migrantow=2, topologia="pierscien", ziarno=None,
+                  kryteria_stopu=None):
+
+    # Model wyspowy: liczba_wysp populacji (każda o rozmiarze rozmiar_populacji) ewoluuje w osobnych procesach
+    # i wymienia najlepszych osobników przez kolejki (potoki) zgodnie z topologią.
+    # Wszystkie wyspy kończą pracę, gdy któraś znajdzie pokolorowanie bez konfliktów.
+    # Zwraca wyniki w formacie uruchom_ga; historia to najlepszy wynik spośród wszystkich wysp w każdej generacji.
+
+    sprawdz_poprawnosc_kryteriow(kryteria_stopu)
+    if not 1 <= rozmiar_turnieju <= rozmiar_populacji:
+        raise ValueError(f"Rozmiar turnieju ({rozmiar_turnieju}) musi być w przedziale [1, {rozmiar_populacji}]")
+    if ziarno is None:
+        ziarno = random.getrandbits(32)
+    cele = sasiedzi_wysp(liczba_wysp, topologia)
+
+    parametry = {
+        "liczba_kolorow": liczba_kolorow,
+        "rozmiar_populacji": rozmiar_populacji,
+        "liczba_generacji": liczba_generacji,
+        "p_krzyzowania": p_krzyzowania,
+        "p_mutacji": p_mutacji,
+        "rozmiar_turnieju": rozmiar_turnieju,
+        "interwal_migracji": interwal_migracji,
+        "liczba_migrantow": liczba_migrantow,
+        "kryteria_stopu": kryteria_stopu
+    }
+
+    skrzynki = [mp.Queue() for _ in range(liczba_wysp)]
+    zdarzenie_stopu = mp.Event()
+    kolejka_wynikow = mp.Queue()
+    ziarna_wysp = np.random.SeedSequence(ziarno).generate_state(liczba_wysp)
+
+    procesy = [
+        mp.Process(target=_proces_wyspy,
+                   args=(i, graf, parametry, int(ziarna_wysp[i]), skrzynki, cele[i], zdarzenie_stopu, kolejka_wynikow))
+        for i in range(liczba_wysp)
+    ]
+    for proces in procesy:
+        proces.start()
+
+    wyniki_wysp = odbierz_wyniki_wysp(procesy, kolejka_wynikow, zdarzenie_stopu)
+    for proces in procesy:
+        proces.join()
+
+    najlepszy_osobnik, najlepsze_konflikty = None, None
+    for _, osobnik, konflikty, _ in sorted(wyniki_wysp):
+        if najlepsze_konflikty is None or konflikty < najlepsze_konflikty:
+            najlepszy_osobnik, najlepsze_konflikty = osobnik, konflikty
+
+    # Historia zbiorcza: minimum po wyspach, krótsze historie uzupełnione ostatnią wartością
+    historie = [uzupelnij_historie(historia, liczba_generacji) for _, _, _, historia in wyniki_wysp]
+    historia_postepow = [min(wartosci) for wartosci in zip(*historie)]
+
+    return najlepszy_osobnik, historia_postepow[-1], historia_postepow